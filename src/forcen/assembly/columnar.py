@@ -0,0 +1,414 @@
+"""Columnar assembly engine (``[assembly] engine = "columnar"``).
+
+Runs the same stages as the row engine in reassemble.py, but over NumPy
+columns: rows are reduced to integer tag/tree_uid codes and day numbers,
+and every per-row lookup becomes an as-of join done with one sorted
+``searchsorted``.  Commands are still interpreted one by one (they are few
+compared with rows), reusing the row engine's timeline builders, so both
+engines share their DSL semantics.  MeasurementRow objects are created
+once, at the end.
+
+The output must be identical to assemble_unsorted's; tests/
+test_assembly_columnar.py checks that differentially.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..config import ConfigBundle
+from ..dsl.types import (
+    AliasCommand,
+    Command,
+    Selector,
+    SelectorDateFilter,
+    SelectorStrategy,
+    SplitCommand,
+    UpdateCommand,
+)
+from ..transactions.models import MeasurementRow
+from .primary import PrimaryTimeline, build_primary_timelines
+from .properties import PROPERTY_FIELDS, PropertyTimeline, build_property_timelines
+from .split import _resolve_source_uid
+from .survey import SurveyCatalog
+from .treebuilder import AliasResolver, build_tag_resolver, tree_uid_for_tag
+
+
+# Day numbers are offsets from date.min, so a (group, day) pair packs into
+# one int64 key: group * _DAY_SPAN + day.
+_DAY_SPAN = 1 << 22
+
+
+class _TreeUids:
+    """Interns tree_uid strings as integer codes."""
+
+    def __init__(self) -> None:
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def code(self, tree_uid: str) -> int:
+        code = self.codes.get(tree_uid)
+        if code is None:
+            code = self.codes[tree_uid] = len(self.values)
+            self.values.append(tree_uid)
+        return code
+
+
+def assemble_columnar(
+    raw_rows: Sequence[MeasurementRow], commands: Sequence[Command], config: ConfigBundle
+) -> Tuple[List[MeasurementRow], List[MeasurementRow]]:
+    """Columnar equivalent of assemble_unsorted (same return value)."""
+
+    catalog = SurveyCatalog.from_config(config)
+    commands = list(commands)
+
+    tag_index: Dict[Tuple[str, str, str], int] = {}
+    tag_codes = np.fromiter(
+        (tag_index.setdefault((row.site, row.plot, row.tag), len(tag_index)) for row in raw_rows),
+        dtype=np.int64,
+        count=len(raw_rows),
+    )
+    days = _days([row.date for row in raw_rows])
+    columns = {
+        name: np.array([getattr(row, name) for row in raw_rows], dtype=object)
+        for name in PROPERTY_FIELDS
+    }
+
+    # Row tags no command mentions keep their base tree_uid for all time, so
+    # the resolver only needs the tags the commands name.
+    resolver = build_tag_resolver((), commands)
+    uids = _TreeUids()
+    tree_uids = _assign_tree_uids(tag_index, tag_codes, days, resolver, uids)
+
+    surveys = catalog.ordered_surveys()
+    survey_codes = _survey_codes(days, catalog)
+    _apply_splits(
+        tree_uids,
+        days,
+        survey_codes,
+        raw_rows,
+        [cmd for cmd in commands if isinstance(cmd, SplitCommand)],
+        resolver,
+        uids,
+    )
+
+    property_timelines = build_property_timelines(
+        [cmd for cmd in commands if isinstance(cmd, UpdateCommand)], resolver
+    )
+    _apply_properties(columns, tree_uids, days, property_timelines, uids)
+
+    primary_timelines = build_primary_timelines(
+        [cmd for cmd in commands if isinstance(cmd, AliasCommand)], resolver
+    )
+    public_tags = _primary_tags(columns["tag"], tree_uids, days, primary_timelines, uids)
+
+    uid_values = [uids.values[code] for code in tree_uids.tolist()]
+    survey_values = [surveys[code] if code >= 0 else None for code in survey_codes.tolist()]
+    column_values = {name: column.tolist() for name, column in columns.items()}
+    measurements = [
+        MeasurementRow(
+            row_number=row.row_number,
+            site=column_values["site"][index],
+            plot=column_values["plot"][index],
+            tag=column_values["tag"][index],
+            date=row.date,
+            dbh_mm=row.dbh_mm,
+            health=row.health,
+            standing=row.standing,
+            notes=row.notes,
+            genus=column_values["genus"][index],
+            species=column_values["species"][index],
+            code=column_values["code"][index],
+            origin=row.origin,
+            normalization_flags=row.normalization_flags,
+            raw=row.raw,
+            tree_uid=uid_values[index],
+            public_tag=public_tags[index],
+            source_tx=row.source_tx,
+            survey_id=survey_values[index],
+        )
+        for index, row in enumerate(raw_rows)
+    ]
+
+    implied_rows = _implied_rows(
+        measurements, tree_uids, days, survey_codes, surveys, catalog, config
+    )
+    return measurements, implied_rows
+
+
+# ----------------------------------------------------------------------
+def _days(dates: Sequence[date]) -> np.ndarray:
+    origin = date.min.toordinal()
+    return np.fromiter((when.toordinal() - origin for when in dates), dtype=np.int64, count=len(dates))
+
+
+def _day(when: date) -> int:
+    return when.toordinal() - date.min.toordinal()
+
+
+def _asof(
+    event_groups: np.ndarray,
+    event_days: np.ndarray,
+    row_groups: np.ndarray,
+    row_days: np.ndarray,
+) -> np.ndarray:
+    """Per row, the index of the last event of its group dated on or before it, else -1.
+
+    Events sharing a group and day keep their given order, so the later one wins.
+    """
+
+    if len(event_groups) == 0:
+        return np.full(len(row_groups), -1, dtype=np.int64)
+    order = np.lexsort((np.arange(len(event_groups)), event_days, event_groups))
+    keys = event_groups[order] * _DAY_SPAN + event_days[order]
+    positions = np.searchsorted(keys, row_groups * _DAY_SPAN + row_days, side="right") - 1
+    clipped = np.maximum(positions, 0)
+    hit = (positions >= 0) & (event_groups[order][clipped] == row_groups)
+    return np.where(hit, order[clipped], -1)
+
+
+def _assign_tree_uids(
+    tag_index: Dict[Tuple[str, str, str], int],
+    tag_codes: np.ndarray,
+    days: np.ndarray,
+    resolver: AliasResolver,
+    uids: _TreeUids,
+) -> np.ndarray:
+    event_tags: List[int] = []
+    event_days: List[int] = []
+    event_uids: List[int] = []
+    for key, code in tag_index.items():
+        timeline = resolver.timeline(key)
+        entries = timeline.entries() if timeline is not None else [(date.min, tree_uid_for_tag(key))]
+        for when, tree_uid in entries:
+            event_tags.append(code)
+            event_days.append(_day(when))
+            event_uids.append(uids.code(tree_uid))
+    # Every tag timeline starts at date.min, so each row finds an event.
+    matches = _asof(
+        np.array(event_tags, dtype=np.int64), np.array(event_days, dtype=np.int64), tag_codes, days
+    )
+    return np.array(event_uids, dtype=np.int64)[matches]
+
+
+def _survey_codes(days: np.ndarray, catalog: SurveyCatalog) -> np.ndarray:
+    """Position of each row's survey in catalog order, or -1 outside every survey."""
+
+    records = [catalog.get(survey_id) for survey_id in catalog.ordered_surveys()]
+    if not records:
+        return np.full(len(days), -1, dtype=np.int64)
+    starts = np.array([_day(record.start) for record in records], dtype=np.int64)
+    ends = np.array([_day(record.end) for record in records], dtype=np.int64)
+    codes = np.searchsorted(starts, days, side="right") - 1
+    inside = (codes >= 0) & (days <= ends[np.maximum(codes, 0)])
+    return np.where(inside, codes, -1)
+
+
+def _apply_splits(
+    tree_uids: np.ndarray,
+    days: np.ndarray,
+    survey_codes: np.ndarray,
+    raw_rows: Sequence[MeasurementRow],
+    commands: List[SplitCommand],
+    resolver: AliasResolver,
+    uids: _TreeUids,
+) -> None:
+    if not commands:
+        return
+    dbh = np.array([row.dbh_mm or 0 for row in raw_rows], dtype=np.int64)
+    health = np.array([row.health or 0 for row in raw_rows], dtype=np.int64)
+    row_numbers = np.array([row.row_number for row in raw_rows], dtype=np.int64)
+
+    def select(
+        views: np.ndarray, selector: Selector, date_filter: SelectorDateFilter | None
+    ) -> np.ndarray:
+        views = _filter_by_date(views, days, date_filter)
+        if len(views) == 0 or selector.strategy == SelectorStrategy.ALL:
+            return views
+        if selector.strategy == SelectorStrategy.LARGEST:
+            return views[np.lexsort((row_numbers[views], -health[views], -dbh[views]))[:1]]
+        if selector.strategy == SelectorStrategy.SMALLEST:
+            return views[np.lexsort((-row_numbers[views], health[views], dbh[views]))[:1]]
+        if selector.strategy == SelectorStrategy.RANKS:
+            return _select_ranks(views, selector.ranks, survey_codes, dbh, health, row_numbers)
+        return views[:0]
+
+    # tree_uid code -> ascending indices of its surveyed rows, kept in step
+    # with tree_uids so each SPLIT reads only its source tree's rows.
+    surveyed = np.flatnonzero(survey_codes >= 0)
+    order = surveyed[np.argsort(tree_uids[surveyed], kind="stable")]
+    codes, starts = np.unique(tree_uids[order], return_index=True)
+    rows_by_tree: Dict[int, np.ndarray] = dict(
+        zip(codes.tolist(), np.split(order, starts[1:]))
+    )
+    empty = order[:0]
+
+    for command in sorted(commands, key=lambda cmd: cmd.effective_date):
+        selector = command.selector
+        if selector is None:
+            continue
+        assert command.effective_date is not None
+        target = uids.code(resolver.resolve(command.target, command.effective_date))
+        source = uids.code(_resolve_source_uid(resolver, command))
+
+        views = rows_by_tree.get(source, empty)
+        selected = select(views, selector, selector.date_filter)
+        future = views[days[views] >= _day(command.effective_date)]
+        moved = np.union1d(selected, select(future, selector, None))
+        if len(moved) == 0 or source == target:
+            continue
+        tree_uids[moved] = target
+        rows_by_tree[source] = np.setdiff1d(views, moved, assume_unique=True)
+        rows_by_tree[target] = np.union1d(rows_by_tree.get(target, empty), moved)
+
+
+def _filter_by_date(
+    views: np.ndarray, days: np.ndarray, date_filter: SelectorDateFilter | None
+) -> np.ndarray:
+    if date_filter is None:
+        return views
+    view_days = days[views]
+    first = _day(date_filter.first)
+    if date_filter.kind == "before":
+        return views[view_days < first]
+    if date_filter.kind == "after":
+        return views[view_days > first]
+    if date_filter.kind == "between":
+        end = _day(date_filter.second or date_filter.first)
+        return views[(view_days >= first) & (view_days <= end)]
+    return views
+
+
+def _select_ranks(
+    views: np.ndarray,
+    ranks: Tuple[int, ...],
+    survey_codes: np.ndarray,
+    dbh: np.ndarray,
+    health: np.ndarray,
+    row_numbers: np.ndarray,
+) -> np.ndarray:
+    surveys = survey_codes[views]
+    order = np.lexsort((row_numbers[views], -health[views], -dbh[views], surveys))
+    ordered = views[order]
+    ordered_surveys = surveys[order]
+    group_start = np.searchsorted(ordered_surveys, ordered_surveys, side="left")
+    rank = np.arange(len(ordered)) - group_start + 1
+    return ordered[np.isin(rank, np.array(ranks, dtype=np.int64))]
+
+
+def _apply_properties(
+    columns: Dict[str, np.ndarray],
+    tree_uids: np.ndarray,
+    days: np.ndarray,
+    timelines: Dict[str, PropertyTimeline],
+    uids: _TreeUids,
+) -> None:
+    events: Dict[str, Tuple[List[int], List[int], List[str]]] = {
+        name: ([], [], []) for name in PROPERTY_FIELDS
+    }
+    for tree_uid, timeline in timelines.items():
+        code = uids.code(tree_uid)
+        for record in timeline.records():
+            for name, value in record.fields.items():
+                if name in events:
+                    groups, event_days, values = events[name]
+                    groups.append(code)
+                    event_days.append(_day(record.effective_date))
+                    values.append(value)
+    for name, (groups, event_days, values) in events.items():
+        if not groups:
+            continue
+        matches = _asof(
+            np.array(groups, dtype=np.int64), np.array(event_days, dtype=np.int64), tree_uids, days
+        )
+        found = matches >= 0
+        columns[name][found] = np.array(values, dtype=object)[matches[found]]
+
+
+def _primary_tags(
+    tags: np.ndarray,
+    tree_uids: np.ndarray,
+    days: np.ndarray,
+    timelines: Dict[str, PrimaryTimeline],
+    uids: _TreeUids,
+) -> List[str]:
+    groups: List[int] = []
+    event_days: List[int] = []
+    values: List[str] = []
+    for tree_uid, timeline in timelines.items():
+        code = uids.code(tree_uid)
+        for record in timeline.records():
+            groups.append(code)
+            event_days.append(_day(record.effective_date))
+            values.append(record.tag)
+    public = tags.copy()
+    if groups:
+        matches = _asof(
+            np.array(groups, dtype=np.int64), np.array(event_days, dtype=np.int64), tree_uids, days
+        )
+        primary = np.array(values + [""], dtype=object)[matches]  # -1 picks the ""
+        chosen = primary.astype(bool)
+        public[chosen] = primary[chosen]
+    return public.tolist()
+
+
+def _implied_rows(
+    measurements: List[MeasurementRow],
+    tree_uids: np.ndarray,
+    days: np.ndarray,
+    survey_codes: np.ndarray,
+    surveys: List[str],
+    catalog: SurveyCatalog,
+    config: ConfigBundle,
+) -> List[MeasurementRow]:
+    surveyed = np.flatnonzero(survey_codes >= 0)
+    if len(surveyed) == 0:
+        return []
+    drop_after = config.validation.drop_after_absent_surveys
+    uid_codes = tree_uids[surveyed]
+
+    # Per tree: its latest survey's latest-dated row (first such row on ties).
+    order = np.lexsort((surveyed, -days[surveyed], -survey_codes[surveyed], uid_codes))
+    first_of_tree = np.ones(len(order), dtype=bool)
+    first_of_tree[1:] = uid_codes[order][1:] != uid_codes[order][:-1]
+    last_rows = surveyed[order[first_of_tree]]
+    trailing = len(surveys) - (survey_codes[last_rows] + 1)
+    last_rows = last_rows[trailing >= drop_after]
+    if len(last_rows) == 0:
+        return []
+
+    # Emit in order of each tree's first surveyed row.
+    _, first_index = np.unique(uid_codes, return_index=True)
+    first_seen = dict(zip(uid_codes[first_index].tolist(), surveyed[first_index].tolist()))
+    last_rows = sorted(last_rows.tolist(), key=lambda index: first_seen[int(tree_uids[index])])
+
+    implied: List[MeasurementRow] = []
+    for index in last_rows:
+        last = measurements[index]
+        survey_id = surveys[int(survey_codes[index]) + 1]
+        survey_record = catalog.get(survey_id)
+        implied.append(
+            MeasurementRow(
+                row_number=0,
+                site=last.site,
+                plot=last.plot,
+                tag=last.tag,
+                date=survey_record.start,
+                dbh_mm=None,
+                health=0,
+                standing=False,
+                notes="",
+                genus=last.genus,
+                species=last.species,
+                code=last.code,
+                origin="implied",
+                tree_uid=last.tree_uid,
+                public_tag=last.public_tag or last.tag,
+                source_tx=last.source_tx,
+                survey_id=survey_id,
+            )
+        )
+    return implied
@@ -0,0 +1,270 @@
+"""Incremental reassembly over independent groups of tags and tree_uids.
+
+Assembly only ever relates rows and commands that share a tag or a
+tree_uid: a row's tree_uid is resolved from its own tag's alias timeline,
+ALIAS/SPLIT link a target tag to a source tag or tree_uid, and UPDATE,
+primary tags and implied rows act per tree_uid.  Grouping tags and
+tree_uids into connected components therefore yields groups that can be
+assembled independently.  AssemblyState keeps each component's assembled
+rows; when rows or commands are appended, only the components they touch
+(merged where the new input links them) are reassembled.
+
+Every assembled row carries the key that reproduces the stable sort done
+by assemble_dataset, so merging components gives a byte-identical dataset.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..config import ConfigBundle
+from ..dsl.types import AliasCommand, Command, SplitCommand, TagRef, TreeRef, UpdateCommand
+from ..transactions.models import MeasurementRow
+from .reassemble import assemble_unsorted
+from .treebuilder import tree_uid_for_tag
+
+
+STATE_FORMAT = 2
+
+Node = Tuple[str, ...]
+SortKey = tuple
+
+
+@dataclass
+class AssemblyComponent:
+    nodes: List[Node]
+    raw_indices: List[int]
+    command_indices: List[int]
+    rows: List[Tuple[SortKey, MeasurementRow]] = field(default_factory=list)
+
+
+@dataclass
+class AssemblyState:
+    """Per-component assembled rows for the first raw_count rows and command_count commands."""
+
+    config_fingerprint: str
+    raw_count: int = 0
+    command_count: int = 0
+    components: Dict[int, AssemblyComponent] = field(default_factory=dict)
+    node_component: Dict[Node, int] = field(default_factory=dict)
+    next_component: int = 0
+    tx_ids: List[str] = field(default_factory=list)
+    format: int = STATE_FORMAT
+
+    def matches(
+        self,
+        config: ConfigBundle,
+        tx_ids: Sequence[str],
+        raw_count: int,
+        command_count: int,
+    ) -> bool:
+        return (
+            self.format == STATE_FORMAT
+            and self.config_fingerprint == config_fingerprint(config)
+            and list(self.tx_ids) == list(tx_ids)
+            and self.raw_count == raw_count
+            and self.command_count == command_count
+        )
+
+    def dataset(self) -> List[MeasurementRow]:
+        keyed = [item for component in self.components.values() for item in component.rows]
+        keyed.sort(key=lambda item: item[0])
+        return [row for _, row in keyed]
+
+
+def config_fingerprint(config: ConfigBundle) -> str:
+    payload = config.model_dump_json(exclude={"engine"})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def assemble_incremental(
+    raw_rows: Sequence[MeasurementRow],
+    commands: Sequence[Command],
+    config: ConfigBundle,
+    state: Optional[AssemblyState] = None,
+) -> Tuple[List[MeasurementRow], AssemblyState]:
+    """Assemble *raw_rows*/*commands*, reusing *state* for their unchanged prefix.
+
+    *state* must describe ``raw_rows[:state.raw_count]`` and
+    ``commands[:state.command_count]``; it is not modified.  Returns the
+    dataset (identical to assemble_dataset) and the state for the full input.
+    """
+
+    if state is None:
+        state = AssemblyState(config_fingerprint=config_fingerprint(config))
+    new_state = AssemblyState(
+        config_fingerprint=state.config_fingerprint,
+        raw_count=len(raw_rows),
+        command_count=len(commands),
+        components=dict(state.components),
+        node_component=dict(state.node_component),
+        next_component=state.next_component,
+        tx_ids=list(state.tx_ids),
+    )
+
+    dirty = _merge_new_input(new_state, raw_rows, commands, state.raw_count, state.command_count)
+    if dirty:
+        _assemble_components(new_state, dirty, raw_rows, commands, config)
+    return new_state.dataset(), new_state
+
+
+# ----------------------------------------------------------------------
+def _merge_new_input(
+    state: AssemblyState,
+    raw_rows: Sequence[MeasurementRow],
+    commands: Sequence[Command],
+    raw_start: int,
+    command_start: int,
+) -> List[int]:
+    """Fold appended rows/commands into the component map; return dirty component ids."""
+
+    uf = _UnionFind()
+    items: List[Tuple[str, int, Node]] = []
+
+    def token(node: Node) -> Node:
+        cid = state.node_component.get(node)
+        return ("component", str(cid)) if cid is not None else node
+
+    def add_item(kind: str, index: int, nodes: List[Node]) -> None:
+        tokens = [token(node) for node in nodes]
+        uf.add(tokens[0])
+        for other in tokens[1:]:
+            uf.union(tokens[0], other)
+        items.append((kind, index, tokens[0]))
+
+    for index in range(raw_start, len(raw_rows)):
+        row = raw_rows[index]
+        add_item("raw", index, _tag_nodes(TagRef(row.site, row.plot, row.tag)))
+    for index in range(command_start, len(commands)):
+        nodes = _command_nodes(commands[index])
+        if nodes:
+            add_item("command", index, nodes)
+
+    groups: Dict[Node, AssemblyComponent] = {}
+    for element in uf.elements():
+        root = uf.find(element)
+        group = groups.setdefault(root, AssemblyComponent([], [], []))
+        if element[0] == "component":
+            old = state.components.pop(int(element[1]))
+            group.nodes.extend(old.nodes)
+            group.raw_indices.extend(old.raw_indices)
+            group.command_indices.extend(old.command_indices)
+        else:
+            group.nodes.append(element)
+    for kind, index, tok in items:
+        group = groups[uf.find(tok)]
+        (group.raw_indices if kind == "raw" else group.command_indices).append(index)
+
+    dirty: List[int] = []
+    for group in groups.values():
+        cid = state.next_component
+        state.next_component += 1
+        group.raw_indices.sort()
+        group.command_indices.sort()
+        state.components[cid] = group
+        for node in group.nodes:
+            state.node_component[node] = cid
+        dirty.append(cid)
+    return dirty
+
+
+def _assemble_components(
+    state: AssemblyState,
+    component_ids: List[int],
+    raw_rows: Sequence[MeasurementRow],
+    commands: Sequence[Command],
+    config: ConfigBundle,
+) -> None:
+    """Reassemble *component_ids* together (they are independent) and store their rows."""
+
+    raw_owner: Dict[int, int] = {}
+    command_indices: List[int] = []
+    for cid in component_ids:
+        component = state.components[cid]
+        component.rows = []
+        for index in component.raw_indices:
+            raw_owner[index] = cid
+        command_indices.extend(component.command_indices)
+    raw_indices = sorted(raw_owner)
+    command_indices.sort()
+
+    measurements, implied_rows = assemble_unsorted(
+        [raw_rows[index] for index in raw_indices],
+        [commands[index] for index in command_indices],
+        config,
+    )
+
+    first_index: Dict[str, int] = {}
+    for index, row in zip(raw_indices, measurements):
+        cid = raw_owner[index]
+        state.components[cid].rows.append((_sort_key(row, 0, index), row))
+        if (
+            row.tree_uid is not None
+            and row.tree_uid not in first_index
+            and row.survey_id is not None
+        ):
+            first_index[row.tree_uid] = index
+    for row in implied_rows:
+        assert row.tree_uid is not None
+        cid = state.node_component[("uid", row.tree_uid)]
+        state.components[cid].rows.append(
+            (_sort_key(row, 1, first_index[row.tree_uid]), row)
+        )
+
+
+def _sort_key(row: MeasurementRow, implied: int, index: int) -> SortKey:
+    # assemble_dataset stable-sorts measurements (raw order) followed by
+    # implied rows (first-appearance order); the suffix reproduces that.
+    return (row.date, row.site, row.plot, row.tag, row.row_number, implied, index)
+
+
+def _tag_nodes(tag: TagRef) -> List[Node]:
+    key = tag.key()
+    return [("tag",) + key, ("uid", tree_uid_for_tag(key))]
+
+
+def _ref_nodes(ref: TreeRef) -> List[Node]:
+    if ref.tree_uid is not None:
+        return [("uid", ref.tree_uid)]
+    assert ref.tag is not None
+    return _tag_nodes(ref.tag)
+
+
+def _command_nodes(command: Command) -> List[Node]:
+    if isinstance(command, AliasCommand):
+        return _tag_nodes(command.target) + _ref_nodes(command.tree_ref)
+    if isinstance(command, SplitCommand):
+        return _tag_nodes(command.target) + _ref_nodes(command.source)
+    if isinstance(command, UpdateCommand):
+        return _ref_nodes(command.tree_ref)
+    return []
+
+
+class _UnionFind:
+    def __init__(self) -> None:
+        self._parent: Dict[Node, Node] = {}
+
+    def __contains__(self, item: Node) -> bool:
+        return item in self._parent
+
+    def add(self, item: Node) -> None:
+        self._parent.setdefault(item, item)
+
+    def find(self, item: Node) -> Node:
+        self.add(item)
+        root = item
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[item] != root:
+            self._parent[item], item = root, self._parent[item]
+        return root
+
+    def union(self, a: Node, b: Node) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self._parent[root_b] = root_a
+
+    def elements(self) -> Iterable[Node]:
+        return list(self._parent)
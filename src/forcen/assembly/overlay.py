@@ -0,0 +1,57 @@
+"""Derived fields computed by assembly, kept apart from the raw rows.
+
+Assembly treats raw rows as immutable: stages record tree_uids, survey ids,
+public tags and UPDATE-assigned properties in an :class:`AssemblyOverlay`
+indexed by raw row position, and the assembled rows are built once at the
+end.  Assembled rows share the raw rows' normalization_flags and raw
+mappings, so neither side may mutate those in place.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from ..transactions.models import MeasurementRow
+
+
+@dataclass
+class AssemblyOverlay:
+    """Per-row derived fields, parallel to the raw rows they were computed from."""
+
+    tree_uids: List[Optional[str]]
+    survey_ids: List[Optional[str]]
+    public_tags: List[Optional[str]] = field(default_factory=list)
+    # Sparse: only rows whose tree has an applicable UPDATE.
+    properties: Dict[int, Dict[str, str]] = field(default_factory=dict)
+
+    def materialize(self, raw_rows: Sequence[MeasurementRow]) -> List[MeasurementRow]:
+        """Build the assembled rows: each raw row with its derived fields applied."""
+
+        measurements: List[MeasurementRow] = []
+        for index, row in enumerate(raw_rows):
+            fields = self.properties.get(index, {})
+            measurements.append(
+                MeasurementRow(
+                    row_number=row.row_number,
+                    site=fields.get("site", row.site),
+                    plot=fields.get("plot", row.plot),
+                    tag=fields.get("tag", row.tag),
+                    date=row.date,
+                    dbh_mm=row.dbh_mm,
+                    health=row.health,
+                    standing=row.standing,
+                    notes=row.notes,
+                    genus=fields.get("genus", row.genus),
+                    species=fields.get("species", row.species),
+                    code=fields.get("code", row.code),
+                    origin=row.origin,
+                    normalization_flags=row.normalization_flags,
+                    raw=row.raw,
+                    tree_uid=self.tree_uids[index],
+                    public_tag=self.public_tags[index],
+                    source_tx=row.source_tx,
+                    survey_id=self.survey_ids[index],
+                )
+            )
+        return measurements
@@ -7,8 +7,6 @@ from datetime import date
 from typing import Dict, Iterable, List, Optional
 
 from ..dsl.types import AliasCommand
-from ..transactions.models import MeasurementRow
-from .survey import SurveyCatalog
 from .treebuilder import AliasResolver
 
 
@@ -26,6 +24,11 @@ class PrimaryTimeline:
         self._records.append(PrimaryRecord(effective_date, tag))
         self._records.sort(key=lambda record: record.effective_date)
 
+    def records(self) -> List[PrimaryRecord]:
+        """Records in effective-date order (ties keep insertion order)."""
+
+        return list(self._records)
+
     def resolve(self, when: date) -> Optional[str]:
         current: Optional[str] = None
         for record in self._records:
@@ -49,18 +52,14 @@ def build_primary_timelines(
     return timelines
 
 
-def apply_primary_tags(
-    measurements: Iterable[MeasurementRow],
-    timelines: Dict[str, PrimaryTimeline],
-    catalog: SurveyCatalog,
-) -> None:
-    for row in measurements:
-        if row.tree_uid is None:
-            row.public_tag = row.public_tag or row.tag
-            continue
-        timeline = timelines.get(row.tree_uid)
-        if timeline is None:
-            row.public_tag = row.public_tag or row.tag
-            continue
-        tag = timeline.resolve(row.date)
-        row.public_tag = tag or row.public_tag or row.tag
+def primary_tag(
+    timelines: Dict[str, PrimaryTimeline], tree_uid: Optional[str], when: date
+) -> Optional[str]:
+    """The tree's PRIMARY tag as of *when*, if any."""
+
+    if tree_uid is None:
+        return None
+    timeline = timelines.get(tree_uid)
+    if timeline is None:
+        return None
+    return timeline.resolve(when)
@@ -5,13 +5,17 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from ..dsl.types import UpdateCommand, TagRef, TreeRef
 from ..transactions.models import MeasurementRow
 from .treebuilder import AliasResolver
 
 
+# Row fields an UPDATE may assign; other assignment keys are ignored.
+PROPERTY_FIELDS = ("genus", "species", "code", "site", "plot", "tag")
+
+
 @dataclass
 class PropertyRecord:
     effective_date: date
@@ -26,6 +30,11 @@ class PropertyTimeline:
         self._records.append(PropertyRecord(effective_date=effective_date, fields=fields))
         self._records.sort(key=lambda record: record.effective_date)
 
+    def records(self) -> List[PropertyRecord]:
+        """Records in effective-date order (ties keep insertion order)."""
+
+        return list(self._records)
+
     def resolve(self, when: date) -> Dict[str, str]:
         result: Dict[str, str] = {}
         for record in self._records:
@@ -49,31 +58,29 @@ def build_property_timelines(
     return timelines
 
 
-def apply_properties(
-    measurements: Iterable[MeasurementRow],
+def resolve_properties(
+    measurements: Sequence[MeasurementRow],
+    tree_uids: Sequence[Optional[str]],
     timelines: Dict[str, PropertyTimeline],
-) -> None:
-    for row in measurements:
-        if row.tree_uid is None:
+) -> Dict[int, Dict[str, str]]:
+    """UPDATE-assigned PROPERTY_FIELDS as of each row's date, keyed by row index.
+
+    Rows whose tree has no applicable UPDATE are omitted.
+    """
+
+    resolved: Dict[int, Dict[str, str]] = {}
+    for index, row in enumerate(measurements):
+        tree_uid = tree_uids[index]
+        if tree_uid is None:
             continue
-        timeline = timelines.get(row.tree_uid)
+        timeline = timelines.get(tree_uid)
         if timeline is None:
             continue
         fields = timeline.resolve(row.date)
-        if not fields:
-            continue
-        if "genus" in fields:
-            row.genus = fields["genus"]
-        if "species" in fields:
-            row.species = fields["species"]
-        if "code" in fields:
-            row.code = fields["code"]
-        if "site" in fields:
-            row.site = fields["site"]
-        if "plot" in fields:
-            row.plot = fields["plot"]
-        if "tag" in fields:
-            row.tag = fields["tag"]
+        assigned = {name: fields[name] for name in PROPERTY_FIELDS if name in fields}
+        if assigned:
+            resolved[index] = assigned
+    return resolved
 
 
 def _resolve_tree_uid(resolver: AliasResolver, tree_ref: TreeRef, when: date) -> str:
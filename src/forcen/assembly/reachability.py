@@ -0,0 +1,155 @@
+"""Plot-level reachability over the ledger's tags, tree_uids and commands.
+
+Extends the incremental assembly grouping (see :mod:`.incremental`) with one
+node per (site, plot) and links every tag to its plot.  A connected
+component is then a set of plots whose raw rows and commands only relate
+to each other: assembling just those rows and commands reproduces exactly
+the full dataset's rows for those plots.  A scoped lint uses this to load
+only the partitions a transaction can affect.
+
+An UPDATE that moves a tree links it to the destination plot.  One that
+sets only one of site/plot makes the destination depend on other commands;
+the index then marks itself unbounded and no scope is offered.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Set, Tuple
+
+from ..dsl.types import Command, TagRef, UpdateCommand
+from ..transactions.models import MeasurementRow
+from .incremental import Node, _command_nodes, _tag_nodes, _UnionFind
+
+
+INDEX_FORMAT = 1
+
+Plot = Tuple[str, str]
+
+
+@dataclass
+class ReachabilityScope:
+    """The plots (and index components) a set of rows and commands can reach."""
+
+    plots: Set[Plot]
+    roots: Set[Node]
+
+
+@dataclass
+class ReachabilityIndex:
+    """Plot reachability for the first raw_count rows and command_count commands."""
+
+    raw_count: int = 0
+    command_count: int = 0
+    tx_ids: List[str] = field(default_factory=list)
+    unbounded: bool = False
+    plots: Set[Plot] = field(default_factory=set)
+    links: _UnionFind = field(default_factory=_UnionFind)
+    format: int = INDEX_FORMAT
+
+    def extend(
+        self, raw_rows: Sequence[MeasurementRow], commands: Sequence[Command]
+    ) -> None:
+        """Fold ``raw_rows[raw_count:]`` and ``commands[command_count:]`` into the index."""
+
+        for row in raw_rows[self.raw_count :]:
+            self._link(_row_nodes(row))
+        for command in commands[self.command_count :]:
+            nodes = self._command_nodes(command)
+            if nodes:
+                self._link(nodes)
+        self.raw_count = len(raw_rows)
+        self.command_count = len(commands)
+
+    def scope(
+        self, raw_rows: Sequence[MeasurementRow], commands: Sequence[Command]
+    ) -> Optional[ReachabilityScope]:
+        """Return what *raw_rows*/*commands* (not yet in the index) can reach.
+
+        The index itself is left unchanged.  Returns None when the index is
+        unbounded.
+        """
+
+        local = _UnionFind()
+        seeds: List[Node] = []
+        unbounded = self.unbounded
+
+        def token(node: Node) -> Node:
+            return ("root",) + self.links.find(node) if node in self.links else node
+
+        def add(nodes: List[Node]) -> None:
+            tokens = [token(node) for node in nodes]
+            local.add(tokens[0])
+            for other in tokens[1:]:
+                local.union(tokens[0], other)
+            seeds.append(tokens[0])
+
+        for row in raw_rows:
+            add(_row_nodes(row))
+        for command in commands:
+            nodes = _scope_nodes(command)
+            if nodes is None:
+                unbounded = True
+            elif nodes:
+                add(nodes)
+        if unbounded:
+            return None
+
+        seed_roots = {local.find(seed) for seed in seeds}
+        plots: Set[Plot] = set()
+        roots: Set[Node] = set()
+        for element in local.elements():
+            if local.find(element) not in seed_roots:
+                continue
+            if element[0] == "root":
+                roots.add(element[1:])
+            elif element[0] == "plot":
+                plots.add((element[1], element[2]))
+        for plot in self.plots:
+            if self.links.find(("plot",) + plot) in roots:
+                plots.add(plot)
+        return ReachabilityScope(plots=plots, roots=roots)
+
+    def reaches(self, scope: ReachabilityScope, command: Command) -> bool:
+        """True when *command* (already in the index) belongs to *scope*."""
+
+        nodes = _command_nodes(command)
+        return bool(nodes) and self.links.find(nodes[0]) in scope.roots
+
+    def _command_nodes(self, command: Command) -> List[Node]:
+        nodes = _scope_nodes(command)
+        if nodes is None:
+            self.unbounded = True
+            return _command_nodes(command)
+        return nodes
+
+    def _link(self, nodes: List[Node]) -> None:
+        for node in nodes:
+            if node[0] == "plot":
+                self.plots.add((node[1], node[2]))
+        self.links.add(nodes[0])
+        for other in nodes[1:]:
+            self.links.union(nodes[0], other)
+
+
+def _row_nodes(row: MeasurementRow) -> List[Node]:
+    return _with_plots(_tag_nodes(TagRef(row.site, row.plot, row.tag)))
+
+
+def _scope_nodes(command: Command) -> Optional[List[Node]]:
+    """Nodes *command* links, plot nodes included; None if its reach is unbounded."""
+
+    nodes = _with_plots(_command_nodes(command))
+    if isinstance(command, UpdateCommand):
+        site = command.assignments.get("site")
+        plot = command.assignments.get("plot")
+        if site is not None and plot is not None:
+            nodes.append(("plot", site, plot))
+        elif site is not None or plot is not None:
+            return None
+    return nodes
+
+
+def _with_plots(nodes: List[Node]) -> List[Node]:
+    plots = [("plot", node[1], node[2]) for node in nodes if node[0] == "tag"]
+    return nodes + plots
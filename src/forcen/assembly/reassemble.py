@@ -2,72 +2,76 @@
 
 from __future__ import annotations
 
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
 
 from ..config import ConfigBundle
 from ..dsl.types import AliasCommand, Command, SplitCommand, UpdateCommand
 from ..transactions.models import MeasurementRow
-from .properties import apply_properties, build_property_timelines
-from .primary import apply_primary_tags, build_primary_timelines
-from .split import apply_splits
+from .columnar import assemble_columnar
+from .overlay import AssemblyOverlay
+from .properties import build_property_timelines, resolve_properties
+from .primary import build_primary_timelines, primary_tag
+from .split import split_tree_uids
 from .survey import SurveyCatalog
-from .treebuilder import assign_tree_uids, build_alias_resolver
+from .treebuilder import build_alias_resolver, resolve_tree_uids
 from .trees import generate_implied_rows
 
 
-def clone_raw_measurement(row: MeasurementRow) -> MeasurementRow:
-    return MeasurementRow(
-        row_number=row.row_number,
-        site=row.site,
-        plot=row.plot,
-        tag=row.tag,
-        date=row.date,
-        dbh_mm=row.dbh_mm,
-        health=row.health,
-        standing=row.standing,
-        notes=row.notes,
-        genus=row.genus,
-        species=row.species,
-        code=row.code,
-        origin=row.origin,
-        normalization_flags=list(row.normalization_flags),
-        raw=dict(row.raw),
-        tree_uid=None,
-        public_tag=None,
-        source_tx=row.source_tx,
-    )
-
-
 def assemble_dataset(
     raw_rows: Sequence[MeasurementRow], commands: Sequence[Command], config: ConfigBundle
 ) -> List[MeasurementRow]:
-    measurements = [clone_raw_measurement(row) for row in raw_rows]
-    catalog = SurveyCatalog.from_config(config)
+    measurements, implied_rows = assemble_unsorted(raw_rows, commands, config)
+    dataset = measurements + implied_rows
 
+    dataset.sort(key=lambda row: (row.date, row.site, row.plot, row.tag, row.row_number))
+    return dataset
+
+
+def assemble_unsorted(
+    raw_rows: Sequence[MeasurementRow], commands: Sequence[Command], config: ConfigBundle
+) -> Tuple[List[MeasurementRow], List[MeasurementRow]]:
+    """Assemble without the final sort.
+
+    Returns the assembled measurements (one per raw row, in input order) and
+    the implied rows (in order of each tree's first surveyed measurement).
+    Dispatches to the columnar engine when ``assembly.engine`` selects it.
+    """
+
+    if config.engine.assembly.engine == "columnar":
+        return assemble_columnar(raw_rows, commands, config)
+
+    catalog = SurveyCatalog.from_config(config)
     resolver_commands = list(commands)
-    resolver = build_alias_resolver(measurements, resolver_commands)
-    assign_tree_uids(measurements, resolver)
-    apply_splits(
-        measurements,
+    # Raw rows are never modified; derived fields go to the overlay.
+    resolver = build_alias_resolver(raw_rows, resolver_commands)
+    overlay = AssemblyOverlay(
+        tree_uids=resolve_tree_uids(raw_rows, resolver),
+        survey_ids=catalog.survey_ids([row.date for row in raw_rows]),
+    )
+    split_tree_uids(
+        raw_rows,
+        overlay.tree_uids,
+        overlay.survey_ids,
         [cmd for cmd in resolver_commands if isinstance(cmd, SplitCommand)],
         resolver,
-        catalog,
     )
 
     property_timelines = build_property_timelines(
         [cmd for cmd in resolver_commands if isinstance(cmd, UpdateCommand)],
         resolver,
     )
-    apply_properties(measurements, property_timelines)
+    overlay.properties = resolve_properties(raw_rows, overlay.tree_uids, property_timelines)
 
     primary_timelines = build_primary_timelines(
         [cmd for cmd in resolver_commands if isinstance(cmd, AliasCommand)],
         resolver,
     )
-    apply_primary_tags(measurements, primary_timelines, catalog)
+    overlay.public_tags = [
+        primary_tag(primary_timelines, overlay.tree_uids[index], row.date)
+        or overlay.properties.get(index, {}).get("tag", row.tag)
+        for index, row in enumerate(raw_rows)
+    ]
 
+    measurements = overlay.materialize(raw_rows)
     implied_rows = generate_implied_rows(measurements, config)
-    dataset = measurements + implied_rows
-
-    dataset.sort(key=lambda row: (row.date, row.site, row.plot, row.tag, row.row_number))
-    return dataset
+    return measurements, implied_rows
@@ -2,39 +2,79 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from heapq import merge
+from typing import Dict, Iterable, List, Optional, Sequence, Set
 
 from ..dsl.types import Selector, SelectorDateFilter, SelectorStrategy, SplitCommand, TagRef
 from ..transactions.models import MeasurementRow
-from .survey import SurveyCatalog
 from .treebuilder import AliasResolver
 
 
 @dataclass
 class MeasurementView:
+    index: int
     row: MeasurementRow
     survey_id: str
 
 
-def apply_splits(
-    measurements: List[MeasurementRow],
+class TreeRowIndex:
+    """tree_uid -> ascending indices of its surveyed rows (the rows SPLIT can select).
+
+    Kept in step with the tree_uids list by :meth:`move`, so each SPLIT reads
+    only its source tree's rows.
+    """
+
+    def __init__(
+        self, tree_uids: Sequence[Optional[str]], survey_ids: Sequence[Optional[str]]
+    ) -> None:
+        self._rows: Dict[str, List[int]] = defaultdict(list)
+        for index, (tree_uid, survey_id) in enumerate(zip(tree_uids, survey_ids)):
+            if tree_uid is not None and survey_id is not None:
+                self._rows[tree_uid].append(index)
+
+    def rows(self, tree_uid: str) -> List[int]:
+        return self._rows.get(tree_uid, [])
+
+    def move(self, indices: Set[int], source: str, target: str) -> None:
+        """Reassign *indices* (all currently under *source*) to *target*."""
+
+        if not indices or source == target:
+            return
+        self._rows[source] = [index for index in self._rows[source] if index not in indices]
+        self._rows[target] = list(merge(self._rows[target], sorted(indices)))
+
+
+def split_tree_uids(
+    measurements: Sequence[MeasurementRow],
+    tree_uids: List[Optional[str]],
+    survey_ids: Sequence[Optional[str]],
     commands: Iterable[SplitCommand],
     resolver: AliasResolver,
-    catalog: SurveyCatalog,
 ) -> None:
+    """Apply SPLIT selectors to *tree_uids* (parallel to *measurements*) in place.
+
+    *survey_ids* holds each row's survey, as from SurveyCatalog.survey_ids.
+    """
+
+    rows_by_tree = TreeRowIndex(tree_uids, survey_ids)
     commands_sorted = sorted(commands, key=lambda cmd: cmd.effective_date)
     for command in commands_sorted:
         if command.selector is None:
             continue
-        _apply_selector_split(measurements, command, resolver, catalog)
+        _apply_selector_split(
+            measurements, tree_uids, survey_ids, rows_by_tree, command, resolver
+        )
 
 
 def _apply_selector_split(
-    measurements: List[MeasurementRow],
+    measurements: Sequence[MeasurementRow],
+    tree_uids: List[Optional[str]],
+    survey_ids: Sequence[Optional[str]],
+    rows_by_tree: TreeRowIndex,
     command: SplitCommand,
     resolver: AliasResolver,
-    catalog: SurveyCatalog,
 ) -> None:
     assert command.effective_date is not None
     selector = command.selector
@@ -44,18 +84,18 @@ def _apply_selector_split(
     target_uid = resolver.resolve(command.target, command.effective_date)
     source_uid = _resolve_source_uid(resolver, command)
 
-    views = _collect_views(measurements, source_uid, catalog)
+    views = _collect_views(measurements, survey_ids, rows_by_tree.rows(source_uid))
     selected = _select_views(views, selector)
 
-    for view in selected:
-        view.row.tree_uid = target_uid
-
     future_views = [
         view for view in views if view.row.date >= command.effective_date
     ]
     future_selected = _select_future_views(future_views, selector)
-    for view in future_selected:
-        view.row.tree_uid = target_uid
+
+    moved = {view.index for view in selected} | {view.index for view in future_selected}
+    for index in moved:
+        tree_uids[index] = target_uid
+    rows_by_tree.move(moved, source_uid, target_uid)
 
 
 def _resolve_source_uid(resolver: AliasResolver, command: SplitCommand) -> str:
@@ -67,17 +107,14 @@ def _resolve_source_uid(resolver: AliasResolver, command: SplitCommand) -> str:
 
 
 def _collect_views(
-    measurements: List[MeasurementRow], tree_uid: str, catalog: SurveyCatalog
+    measurements: Sequence[MeasurementRow],
+    survey_ids: Sequence[Optional[str]],
+    indices: Iterable[int],
 ) -> List[MeasurementView]:
-    views: List[MeasurementView] = []
-    for row in measurements:
-        if row.tree_uid != tree_uid:
-            continue
-        survey_id = catalog.survey_for_date(row.date)
-        if survey_id is None:
-            continue
-        views.append(MeasurementView(row=row, survey_id=survey_id))
-    return views
+    return [
+        MeasurementView(index=index, row=measurements[index], survey_id=survey_ids[index])
+        for index in indices
+    ]
 
 
 def _select_views(
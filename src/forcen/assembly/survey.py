@@ -7,7 +7,10 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Dict, List, Optional, Sequence
 
+import numpy as np
+
 from ..config import ConfigBundle
+from ..transactions.models import MeasurementRow
 
 
 @dataclass(frozen=True)
@@ -45,6 +48,26 @@ class SurveyCatalog:
             return record.survey_id
         return None
 
+    def survey_ids(self, dates: Sequence[date]) -> List[Optional[str]]:
+        """survey_for_date for every date, as one searchsorted over the survey starts."""
+
+        if not self._surveys or not dates:
+            return [None] * len(dates)
+        ordinals = np.fromiter((when.toordinal() for when in dates), np.int64, len(dates))
+        starts = np.array([start.toordinal() for start in self._starts], dtype=np.int64)
+        ends = np.array([record.end.toordinal() for record in self._surveys], dtype=np.int64)
+        index = np.searchsorted(starts, ordinals, side="right") - 1
+        inside = (index >= 0) & (ordinals <= ends[np.maximum(index, 0)])
+        ids = [record.survey_id for record in self._surveys]
+        return [ids[idx] if hit else None for idx, hit in zip(index.tolist(), inside.tolist())]
+
+    def survey_of(self, row: MeasurementRow) -> Optional[str]:
+        """The row's survey: the one assembly assigned, else looked up by date."""
+
+        if row.survey_id is not None:
+            return row.survey_id
+        return self.survey_for_date(row.date)
+
     def ordered_surveys(self) -> List[str]:
         return [record.survey_id for record in self._surveys]
 
@@ -18,7 +18,7 @@ def build_tree_view(
     for row in rows:
         if row.tree_uid is None:
             continue
-        survey_id = catalog.survey_for_date(row.date)
+        survey_id = catalog.survey_of(row)
         if survey_id is None:
             continue
         key = (row.tree_uid, survey_id)
@@ -68,7 +68,7 @@ def build_retag_suggestions(
     for row in rows:
         if row.tree_uid is None or row.origin == "implied":
             continue
-        survey_id = catalog.survey_for_date(row.date)
+        survey_id = catalog.survey_of(row)
         if survey_id is None:
             continue
         by_tree[row.tree_uid][survey_id].append(row)
@@ -35,6 +35,11 @@ class TagTimeline:
             idx = 0
         return self._tree_uids[idx]
 
+    def entries(self) -> List[Tuple[date, str]]:
+        """(from_date, tree_uid) bindings in date order; the first is from date.min."""
+
+        return list(zip(self._dates, self._tree_uids))
+
 
 class AliasResolver:
     """Resolves tag references to tree_uids over time."""
@@ -56,6 +61,11 @@ class AliasResolver:
         self.ensure_tag(tag)
         return self._tags[tag.key()].resolve(when)
 
+    def timeline(self, key: Tuple[str, str, str]) -> Optional[TagTimeline]:
+        """The tag's timeline, or None for a tag no command or resolve has touched."""
+
+        return self._tags.get(key)
+
     def register_commands(self, commands: Iterable[Command]) -> None:
         for command in commands:
             if isinstance(command, AliasCommand):
@@ -77,9 +87,15 @@ def tree_uid_for_tag(tag: TagRef | Tuple[str, str, str]) -> str:
 def build_alias_resolver(
     measurements: Iterable[MeasurementRow], commands: List[Command]
 ) -> AliasResolver:
+    return build_tag_resolver(
+        (TagRef(site=row.site, plot=row.plot, tag=row.tag) for row in measurements), commands
+    )
+
+
+def build_tag_resolver(tags: Iterable[TagRef], commands: List[Command]) -> AliasResolver:
     resolver = AliasResolver()
-    for row in measurements:
-        resolver.ensure_tag(TagRef(site=row.site, plot=row.plot, tag=row.tag))
+    for tag in tags:
+        resolver.ensure_tag(tag)
     resolver.register_commands(commands)
 
     alias_commands = sorted(
@@ -117,9 +133,12 @@ def _resolve_tree_ref(
     return resolver.resolve(tree_ref.tag, when)
 
 
-def assign_tree_uids(
+def resolve_tree_uids(
     measurements: Iterable[MeasurementRow], resolver: AliasResolver
-) -> None:
-    for row in measurements:
-        tag = TagRef(site=row.site, plot=row.plot, tag=row.tag)
-        row.tree_uid = resolver.resolve(tag, row.date)
+) -> List[str]:
+    """Each row's tree_uid as of its date, in row order."""
+
+    return [
+        resolver.resolve(TagRef(site=row.site, plot=row.plot, tag=row.tag), row.date)
+        for row in measurements
+    ]
@@ -25,7 +25,7 @@ def generate_implied_rows(
     for row in measurements:
         if row.tree_uid is None:
             continue
-        survey_id = catalog.survey_for_date(row.date)
+        survey_id = catalog.survey_of(row)
         if survey_id is None:
             continue
         tree_map[row.tree_uid][survey_id].append(row)
@@ -69,11 +69,10 @@ def generate_implied_rows(
                 species=last_real_row.species,
                 code=last_real_row.code,
                 origin="implied",
-                normalization_flags=[],
-                raw={},
                 tree_uid=tree_uid,
                 public_tag=last_real_row.public_tag or last_real_row.tag,
                 source_tx=last_real_row.source_tx,
+                survey_id=implied_survey_id,
             )
         )
 
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 
@@ -12,15 +13,26 @@ from .engine import (
     BuildError,
     DatasheetOptions,
     DatasheetsError,
+    ForcenServer,
+    LintManyEntry,
+    LintReport,
+    LintSession,
     SubmitError,
     SubmitResult,
     VersionNotFoundError,
     build_workspace,
+    compact_ledger,
     diff_manifests,
+    diff_version_rows,
     generate_datasheet,
+    generate_datasheets,
+    lint_many,
     lint_transaction,
     load_manifest,
+    submit_batch,
+    submit_queued,
     submit_transaction,
+    watch_transaction,
 )
 from .exceptions import ConfigError, ForcenError
 from .transactions import NormalizationConfig
@@ -40,13 +52,20 @@ EXIT_IO_ERROR = 4
 EXIT_CONFIG_ERROR = 5
 
 
+class AssemblyEngine(str, Enum):
+    rows = "rows"
+    columnar = "columnar"
+
+
 app = typer.Typer(help="Forest census transaction engine")
 tx_app = typer.Typer(help="Transaction commands")
 versions_app = typer.Typer(help="Version inspection")
 datasheets_app = typer.Typer(help="Datasheet commands")
+ledger_app = typer.Typer(help="Ledger maintenance")
 app.add_typer(tx_app, name="tx")
 app.add_typer(versions_app, name="versions")
 app.add_typer(datasheets_app, name="datasheets")
+app.add_typer(ledger_app, name="ledger")
 
 
 @app.callback()
@@ -121,17 +140,38 @@ def tx_lint(
         "-w",
         help="Directory for ledger state (to include prior DSL)",
     ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help="Keep running and re-lint whenever measurements.csv or updates.tdl changes",
+    ),
+    poll_interval: float = typer.Option(
+        0.25,
+        "--interval",
+        min=0.01,
+        help="Seconds between file checks in --watch mode",
+    ),
+    scoped: bool = typer.Option(
+        False,
+        "--scoped",
+        help="Load only the ledger plots the transaction can affect",
+    ),
 ) -> None:
     """Lint a transaction directory."""
 
     report_path = report_path or tx_dir / "lint-report.json"
 
+    if watch:
+        _watch_lint(tx_dir, config_dir, workspace, report_path, poll_interval)
+        return
+
     try:
         report = lint_transaction(
             transaction_dir=tx_dir,
             config_dir=config_dir,
             normalization=NormalizationConfig(),
             workspace=workspace,
+            scoped=scoped,
         )
     except ConfigError as exc:
         typer.echo(f"Config error: {exc}", err=True)
@@ -166,9 +206,139 @@ def tx_lint(
         raise typer.Exit(EXIT_VALIDATION_ERROR)
 
 
+def _watch_lint(
+    tx_dir: Path,
+    config_dir: Path,
+    workspace: Path,
+    report_path: Path,
+    poll_interval: float,
+) -> None:
+    try:
+        session = LintSession(
+            config_dir, workspace=workspace, normalization=NormalizationConfig()
+        )
+    except ConfigError as exc:
+        typer.echo(f"Config error: {exc}", err=True)
+        raise typer.Exit(EXIT_CONFIG_ERROR) from exc
+    except (ForcenError, OSError) as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
+
+    def show(report: Optional[LintReport], error: Optional[Exception]) -> None:
+        if error is not None:
+            typer.echo(f"{type(error).__name__}: {error}", err=True)
+            return
+        assert report is not None
+        json_payload = json.dumps(report.as_dict(), indent=2)
+        typer.echo(json_payload)
+        try:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(json_payload + "\n", encoding="utf-8")
+        except OSError as exc:
+            typer.echo(f"Failed to write report {report_path}: {exc}", err=True)
+
+    typer.echo(f"Watching {tx_dir} (Ctrl-C to stop)", err=True)
+    try:
+        watch_transaction(tx_dir, session, show, poll_interval=poll_interval)
+    except KeyboardInterrupt:
+        return
+
+
+@tx_app.command("lint-many")
+def tx_lint_many(
+    tx_dirs: List[Path] = typer.Argument(..., exists=True, file_okay=False, readable=True),
+    config_dir: Path = typer.Option(
+        Path("config"),
+        "--config",
+        "-c",
+        help="Path to configuration directory",
+    ),
+    workspace: Path = typer.Option(
+        Path(".forcen"),
+        "--workspace",
+        "-w",
+        help="Directory for ledger state (to include prior DSL)",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes (defaults to the CPU count)",
+    ),
+) -> None:
+    """Lint several transaction directories against one loaded ledger.
+
+    Each directory gets its own lint-report.json; a combined summary is
+    printed.
+    """
+
+    try:
+        entries = lint_many(
+            tx_dirs,
+            config_dir,
+            workspace=workspace,
+            normalization=NormalizationConfig(),
+            jobs=jobs,
+        )
+    except ConfigError as exc:
+        typer.echo(f"Config error: {exc}", err=True)
+        raise typer.Exit(EXIT_CONFIG_ERROR) from exc
+    except (ForcenError, OSError) as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
+
+    results = []
+    for entry in entries:
+        result = {
+            "tx_dir": str(entry.tx_dir),
+            "tx_id": None,
+            "errors": 0,
+            "warnings": 0,
+            "rows": 0,
+            "error": None,
+        }
+        if entry.report is not None:
+            payload = entry.report.as_dict()
+            result.update(tx_id=entry.report.tx_id, **payload["summary"])
+            report_path = entry.tx_dir / "lint-report.json"
+            try:
+                report_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+            except OSError as exc:
+                typer.echo(f"Failed to write report {report_path}: {exc}", err=True)
+                raise typer.Exit(EXIT_IO_ERROR) from exc
+        else:
+            result["error"] = f"{entry.error_type}: {entry.error}"
+        results.append(result)
+
+    summary = {
+        "transactions": len(entries),
+        "clean": sum(1 for entry in entries if not entry.has_errors),
+        "with_errors": sum(1 for entry in entries if entry.report and entry.report.has_errors),
+        "failed": sum(1 for entry in entries if entry.error is not None),
+        "errors": sum(result["errors"] for result in results),
+        "warnings": sum(result["warnings"] for result in results),
+    }
+    typer.echo(json.dumps({"results": results, "summary": summary}, indent=2))
+
+    failing = next((entry for entry in entries if entry.has_errors), None)
+    if failing is not None:
+        raise typer.Exit(_lint_many_exit_code(failing))
+
+
+def _lint_many_exit_code(entry: LintManyEntry) -> int:
+    # Same codes tx lint would use for this directory.
+    if entry.error_type is None:
+        return EXIT_VALIDATION_ERROR
+    return {
+        "DSLParseError": EXIT_DSL_ERROR,
+        "TransactionDataError": EXIT_VALIDATION_ERROR,
+    }.get(entry.error_type, EXIT_IO_ERROR)
+
+
 @tx_app.command("submit")
 def tx_submit(
-    tx_dir: Path = typer.Argument(..., exists=True, file_okay=False, readable=True),
+    tx_dirs: List[Path] = typer.Argument(..., exists=True, file_okay=False, readable=True),
     config_dir: Path = typer.Option(
         Path("config"),
         "--config",
@@ -181,15 +351,37 @@ def tx_submit(
         "-w",
         help="Directory for ledger state",
     ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Concurrent artifact writers (defaults to ledger.jobs in engine.toml)",
+    ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Reassemble every tree instead of only those touched by new input",
+    ),
 ) -> None:
-    """Submit a transaction and update the ledger."""
+    """Submit transactions and update the ledger.
+
+    Several directories are queued and submitted in order; concurrent callers
+    share the workspace queue.
+    """
+
+    if len(tx_dirs) > 1:
+        _submit_many(tx_dirs, config_dir, workspace, jobs, full)
+        return
 
     try:
         result = submit_transaction(
-            transaction_dir=tx_dir,
+            transaction_dir=tx_dirs[0],
             config_dir=config_dir,
             workspace=workspace,
             normalization=NormalizationConfig(),
+            jobs=jobs,
+            full=full,
         )
     except SubmitError as exc:
         typer.echo(f"Submit error: {exc}", err=True)
@@ -212,6 +404,9 @@ def tx_submit(
     except ForcenError as exc:
         typer.echo(f"Error: {exc}", err=True)
         raise typer.Exit(EXIT_IO_ERROR) from exc
+    except OSError as exc:
+        typer.echo(f"Failed to write artifacts: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
 
     payload = {
         "tx_id": result.tx_id,
@@ -222,6 +417,90 @@ def tx_submit(
     typer.echo(json.dumps(payload, indent=2))
 
 
+def _submit_many(
+    tx_dirs: List[Path],
+    config_dir: Path,
+    workspace: Path,
+    jobs: Optional[int],
+    full: bool,
+) -> None:
+    try:
+        results = submit_queued(tx_dirs, config_dir, workspace, jobs=jobs, full=full)
+    except (ForcenError, OSError) as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
+
+    typer.echo(json.dumps({"results": [result.as_dict() for result in results]}, indent=2))
+    if any(result.error for result in results):
+        raise typer.Exit(EXIT_VALIDATION_ERROR)
+
+
+@tx_app.command("submit-batch")
+def tx_submit_batch(
+    tx_dirs: List[Path] = typer.Argument(..., exists=True, file_okay=False, readable=True),
+    config_dir: Path = typer.Option(
+        Path("config"),
+        "--config",
+        "-c",
+        help="Path to configuration directory",
+    ),
+    workspace: Path = typer.Option(
+        Path(".forcen"),
+        "--workspace",
+        "-w",
+        help="Directory for ledger state",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Concurrent artifact writers (defaults to ledger.jobs in engine.toml)",
+    ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Reassemble every tree instead of only those touched by new input",
+    ),
+) -> None:
+    """Submit several transactions with one reassembly and one version."""
+
+    try:
+        result = submit_batch(
+            tx_dirs,
+            config_dir,
+            workspace,
+            normalization=NormalizationConfig(),
+            jobs=jobs,
+            full=full,
+        )
+    except ConfigError as exc:
+        typer.echo(f"Config error: {exc}", err=True)
+        raise typer.Exit(EXIT_CONFIG_ERROR) from exc
+    except (ForcenError, OSError) as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
+
+    payload = {
+        "version_seq": result.version_seq,
+        "accepted": result.accepted_tx_ids,
+        "results": [
+            {
+                "tx_dir": entry.tx_dir,
+                "tx_id": entry.tx_id,
+                "accepted": entry.accepted,
+                "errors": entry.errors,
+                "warnings": entry.warnings,
+                "reason": entry.reason,
+            }
+            for entry in result.entries
+        ],
+    }
+    typer.echo(json.dumps(payload, indent=2))
+    if any(not entry.accepted and entry.reason != "already submitted" for entry in result.entries):
+        raise typer.Exit(EXIT_VALIDATION_ERROR)
+
+
 @app.command("build")
 def build_command(
     config_dir: Path = typer.Option(
@@ -236,21 +515,126 @@ def build_command(
         "-w",
         help="Directory for ledger state",
     ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Concurrent artifact writers (defaults to ledger.jobs in engine.toml)",
+    ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Reassemble every tree instead of only those touched by new input",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rebuild even when the inputs match the latest build",
+    ),
+    assembly_engine: Optional[AssemblyEngine] = typer.Option(
+        None,
+        "--assembly-engine",
+        help="Assembly engine (defaults to assembly.engine in engine.toml)",
+    ),
 ) -> None:
     """Rebuild artifacts from ledger state."""
 
     try:
-        result = build_workspace(config_dir, workspace)
+        result = build_workspace(
+            config_dir,
+            workspace,
+            jobs=jobs,
+            full=full,
+            force=force,
+            assembly_engine=assembly_engine.value if assembly_engine else None,
+        )
     except ConfigError as exc:
         typer.echo(f"Config error: {exc}", err=True)
         raise typer.Exit(EXIT_CONFIG_ERROR) from exc
     except BuildError as exc:
         typer.echo(f"Build error: {exc}", err=True)
         raise typer.Exit(EXIT_IO_ERROR) from exc
+    except OSError as exc:
+        typer.echo(f"Failed to write artifacts: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
 
     payload = {
         "version_seq": result.version_seq,
         "tx_count": result.tx_count,
+        "skipped": result.skipped,
+    }
+    typer.echo(json.dumps(payload, indent=2))
+
+
+@app.command("serve")
+def serve_command(
+    socket_path: Path = typer.Option(
+        ...,
+        "--socket",
+        help="Unix domain socket to listen on",
+    ),
+    config_dir: Path = typer.Option(
+        Path("config"),
+        "--config",
+        "-c",
+        help="Path to configuration directory",
+    ),
+    workspace: Path = typer.Option(
+        Path(".forcen"),
+        "--workspace",
+        "-w",
+        help="Directory for ledger state",
+    ),
+) -> None:
+    """Serve lint and submit requests (one JSON object per line) on a Unix socket."""
+
+    try:
+        server = ForcenServer(socket_path, config_dir, workspace)
+    except ConfigError as exc:
+        typer.echo(f"Config error: {exc}", err=True)
+        raise typer.Exit(EXIT_CONFIG_ERROR) from exc
+    except (ForcenError, OSError) as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
+
+    typer.echo(f"Serving {workspace} on {socket_path} (Ctrl-C to stop)", err=True)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+@ledger_app.command("compact")
+def ledger_compact(
+    config_dir: Path = typer.Option(
+        Path("config"),
+        "--config",
+        "-c",
+        help="Path to configuration directory",
+    ),
+    workspace: Path = typer.Option(
+        Path(".forcen"),
+        "--workspace",
+        "-w",
+        help="Directory for ledger state",
+    ),
+) -> None:
+    """Merge per-transaction raw segments into the base raw file."""
+
+    try:
+        result = compact_ledger(config_dir, workspace)
+    except ConfigError as exc:
+        typer.echo(f"Config error: {exc}", err=True)
+        raise typer.Exit(EXIT_CONFIG_ERROR) from exc
+    except (ForcenError, OSError) as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
+
+    payload = {
+        "segments_merged": result.segments_merged,
+        "raw_rows": result.raw_rows,
     }
     typer.echo(json.dumps(payload, indent=2))
 
@@ -286,6 +670,11 @@ def versions_diff(
         "-w",
         help="Directory for ledger state",
     ),
+    rows: bool = typer.Option(
+        False,
+        "--rows",
+        help="Diff observations_long row by row (NDJSON, keyed by obs_id)",
+    ),
 ) -> None:
     """Show differences between two versions."""
 
@@ -296,6 +685,15 @@ def versions_diff(
         typer.echo(str(exc), err=True)
         raise typer.Exit(EXIT_IO_ERROR) from exc
 
+    if rows:
+        try:
+            for record in diff_version_rows(workspace, seq_a, seq_b):
+                typer.echo(json.dumps(record, sort_keys=True))
+        except (VersionNotFoundError, OSError) as exc:
+            typer.echo(str(exc), err=True)
+            raise typer.Exit(EXIT_IO_ERROR) from exc
+        return
+
     diff_payload = diff_manifests(manifest_a, manifest_b)
     typer.echo(json.dumps(diff_payload, indent=2, sort_keys=True))
 
@@ -303,8 +701,13 @@ def versions_diff(
 @datasheets_app.command("generate")
 def datasheets_generate(
     survey: str = typer.Option(..., "--survey", help="Target survey id"),
-    site: str = typer.Option(..., "--site", help="Site code"),
-    plot: str = typer.Option(..., "--plot", help="Plot code"),
+    site: Optional[str] = typer.Option(None, "--site", help="Site code"),
+    plot: Optional[str] = typer.Option(None, "--plot", help="Plot code"),
+    all_plots: bool = typer.Option(
+        False,
+        "--all",
+        help="Generate every observed plot (of --site, if given) in one pass",
+    ),
     out_dir: Path = typer.Option(
         Path("datasheets"),
         "--out",
@@ -326,27 +729,56 @@ def datasheets_generate(
         "-w",
         help="Directory for ledger state",
     ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Concurrent file writers with --all (defaults to ledger.jobs in engine.toml)",
+    ),
 ) -> None:
-    """Generate datasheet context JSON for a plot."""
+    """Generate datasheet context JSON for a plot, or for every plot with --all."""
+
+    if all_plots and plot is not None:
+        typer.echo("--plot cannot be combined with --all", err=True)
+        raise typer.Exit(EXIT_VALIDATION_ERROR)
+    if not all_plots and (site is None or plot is None):
+        typer.echo("--site and --plot are required unless --all is given", err=True)
+        raise typer.Exit(EXIT_VALIDATION_ERROR)
 
     try:
-        options = DatasheetOptions(
-            survey_id=survey,
-            site=site,
-            plot=plot,
-            output_dir=out_dir,
-        )
-        output_path = generate_datasheet(config_dir, workspace, options)
+        if all_plots:
+            batch = generate_datasheets(
+                config_dir, workspace, survey, out_dir, site=site, jobs=jobs
+            )
+        else:
+            assert site is not None and plot is not None
+            options = DatasheetOptions(
+                survey_id=survey,
+                site=site,
+                plot=plot,
+                output_dir=out_dir,
+            )
+            output_path = generate_datasheet(config_dir, workspace, options)
     except ConfigError as exc:
         typer.echo(f"Config error: {exc}", err=True)
         raise typer.Exit(EXIT_CONFIG_ERROR) from exc
     except DatasheetsError as exc:
         typer.echo(f"Datasheets error: {exc}", err=True)
         raise typer.Exit(EXIT_IO_ERROR) from exc
+    except OSError as exc:
+        typer.echo(f"Failed to write datasheets: {exc}", err=True)
+        raise typer.Exit(EXIT_IO_ERROR) from exc
 
-    payload = {
-        "output": str(output_path),
-    }
+    if all_plots:
+        payload = {
+            "outputs": [str(path) for path in batch.outputs],
+            "skipped": batch.skipped,
+        }
+    else:
+        payload = {
+            "output": str(output_path),
+        }
     typer.echo(json.dumps(payload, indent=2, sort_keys=True))
 
 
@@ -1,6 +1,13 @@
 """Public configuration API."""
 
 from .loader import ConfigFiles, load_config_bundle
-from .models import ConfigBundle
+from .models import AssemblySettings, ConfigBundle, EngineConfig, LedgerSettings
 
-__all__ = ["ConfigFiles", "ConfigBundle", "load_config_bundle"]
+__all__ = [
+    "ConfigFiles",
+    "ConfigBundle",
+    "AssemblySettings",
+    "EngineConfig",
+    "LedgerSettings",
+    "load_config_bundle",
+]
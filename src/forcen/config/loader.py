@@ -16,6 +16,7 @@ from ..exceptions import ConfigError
 from .models import (
     ConfigBundle,
     DatasheetsConfig,
+    EngineConfig,
     SitesConfig,
     SurveysConfig,
     TaxonomyConfig,
@@ -31,6 +32,7 @@ class ConfigFiles:
     SURVEYS = "surveys.toml"
     VALIDATION = "validation.toml"
     DATASHEETS = "datasheets.toml"
+    ENGINE = "engine.toml"
 
 
 def load_config_bundle(root: Path) -> ConfigBundle:
@@ -42,12 +44,19 @@ def load_config_bundle(root: Path) -> ConfigBundle:
     surveys = _load_toml(root / ConfigFiles.SURVEYS, SurveysConfig)
     validation = _load_toml(root / ConfigFiles.VALIDATION, ValidationConfig)
     datasheets = _load_toml(root / ConfigFiles.DATASHEETS, DatasheetsConfig)
+    engine_path = root / ConfigFiles.ENGINE
+    engine = (
+        _load_toml(engine_path, EngineConfig)
+        if engine_path.exists()
+        else EngineConfig()
+    )
     return ConfigBundle(
         taxonomy=taxonomy,
         sites=sites,
         surveys=surveys,
         validation=validation,
         datasheets=datasheets,
+        engine=engine,
     )
 
 
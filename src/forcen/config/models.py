@@ -145,9 +145,28 @@ class DatasheetsConfig(BaseModel):
         return self
 
 
+class LedgerSettings(BaseModel):
+    raw_format: Literal["csv", "parquet"] = "csv"
+    jobs: int = Field(4, ge=1)
+    partitioned_observations: bool = False
+
+
+class AssemblySettings(BaseModel):
+    incremental: bool = True
+    engine: Literal["rows", "columnar"] = "rows"
+
+
+class EngineConfig(BaseModel):
+    """Optional engine tuning; every field has a default so the file may be omitted."""
+
+    ledger: LedgerSettings = Field(default_factory=LedgerSettings)
+    assembly: AssemblySettings = Field(default_factory=AssemblySettings)
+
+
 class ConfigBundle(BaseModel):
     taxonomy: TaxonomyConfig
     sites: SitesConfig
     surveys: SurveysConfig
     validation: ValidationConfig
     datasheets: DatasheetsConfig
+    engine: EngineConfig = Field(default_factory=EngineConfig)
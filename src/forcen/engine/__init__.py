@@ -1,24 +1,64 @@
 """Transaction engine orchestration."""
 
 from .build import BuildError, BuildResult, build_workspace
-from .datasheets import DatasheetOptions, DatasheetsError, generate_datasheet
+from .compact import CompactResult, compact_ledger
+from .datasheets import (
+    DatasheetBatchResult,
+    DatasheetOptions,
+    DatasheetsError,
+    generate_datasheet,
+    generate_datasheets,
+)
 from .lint import LintReport, lint_transaction
-from .submit import SubmitError, SubmitResult, submit_transaction
-from .versions import VersionNotFoundError, diff_manifests, load_manifest
+from .lint_many import LintManyEntry, lint_many
+from .queue import QueuedSubmitResult, submit_queued
+from .server import ForcenServer, ServerError, send_request
+from .submit import (
+    BatchEntryResult,
+    BatchSubmitResult,
+    SubmitError,
+    SubmitResult,
+    submit_batch,
+    submit_transaction,
+)
+from .versions import (
+    VersionNotFoundError,
+    diff_manifests,
+    diff_version_rows,
+    load_manifest,
+)
+from .watch import LintSession, watch_transaction
 
 __all__ = [
     "lint_transaction",
     "LintReport",
+    "LintSession",
+    "lint_many",
+    "LintManyEntry",
+    "watch_transaction",
     "submit_transaction",
     "SubmitResult",
     "SubmitError",
+    "submit_batch",
+    "BatchSubmitResult",
+    "BatchEntryResult",
+    "submit_queued",
+    "QueuedSubmitResult",
     "build_workspace",
     "BuildResult",
     "BuildError",
+    "compact_ledger",
+    "CompactResult",
     "load_manifest",
     "diff_manifests",
+    "diff_version_rows",
     "VersionNotFoundError",
+    "ForcenServer",
+    "ServerError",
+    "send_request",
     "DatasheetOptions",
     "DatasheetsError",
     "generate_datasheet",
+    "generate_datasheets",
+    "DatasheetBatchResult",
 ]
@@ -4,68 +4,126 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
-from ..config import load_config_bundle
+from ..config import ConfigBundle, load_config_bundle
 from ..exceptions import ForcenError
+from ..ledger.lock import WorkspaceLock
 from ..ledger.storage import Ledger
-from ..assembly.reassemble import assemble_dataset, clone_raw_measurement
+from ..ledger.writers import ArtifactWriters
 from ..assembly.tree_outputs import build_retag_suggestions, build_tree_view
 from ..assembly.survey import SurveyCatalog
+from .utils import (
+    assemble_workspace,
+    build_fingerprint,
+    update_reachability_index,
+    with_assembly_engine,
+)
 
 
 @dataclass
 class BuildResult:
     version_seq: int
     tx_count: int
+    skipped: bool = False  # inputs unchanged since version_seq was built
 
 
 class BuildError(ForcenError):
     pass
 
 
-def build_workspace(config_dir: Path, workspace: Path) -> BuildResult:
+def build_workspace(
+    config_dir: Path,
+    workspace: Path,
+    *,
+    jobs: Optional[int] = None,
+    full: bool = False,
+    force: bool = False,
+    assembly_engine: Optional[str] = None,
+) -> BuildResult:
+    """Rebuild artifacts and snapshot a version from ledger state.
+
+    Unless *force* is set, the build is skipped (reporting the existing
+    version) when the latest version was built from the same raw ledger,
+    command log, config files and code version.  *assembly_engine* ("rows"
+    or "columnar") overrides ``assembly.engine`` from engine.toml.
+    """
+
     config_dir = Path(config_dir)
     workspace = Path(workspace)
 
-    config = load_config_bundle(config_dir)
-    ledger = Ledger(workspace)
+    config = with_assembly_engine(load_config_bundle(config_dir), assembly_engine)
+    with WorkspaceLock(workspace):
+        return _build_locked(config_dir, workspace, config, jobs, full, force)
+
+
+def _build_locked(
+    config_dir: Path,
+    workspace: Path,
+    config: ConfigBundle,
+    jobs: Optional[int],
+    full: bool,
+    force: bool,
+) -> BuildResult:
+    ledger = Ledger(workspace, config.engine.ledger)
+
+    fingerprint = build_fingerprint(ledger, config_dir)
+    if not force:
+        latest = _latest_manifest(ledger)
+        if latest is not None and latest.get("build_fingerprint") == fingerprint:
+            return BuildResult(
+                version_seq=int(latest["version_seq"]),
+                tx_count=len(ledger.transaction_ids()),
+                skipped=True,
+            )
 
     raw_rows = ledger.load_raw_measurements()
     if not raw_rows:
         raise BuildError("No observations found; submit a transaction first")
 
-    records = ledger.read_transactions()
-    tx_ids = [record.get("tx_id") for record in records if "tx_id" in record]
+    records = ledger.transaction_summaries()
+    tx_ids = [record["tx_id"] for record in records]
     if not tx_ids:
         raise BuildError("No transactions recorded; nothing to build")
 
     commands = ledger.load_commands()
-    assembled_rows = assemble_dataset(raw_rows, commands, config)
-    row_counts = ledger.write_observations(config, assembled_rows)
-
-    catalog = SurveyCatalog.from_config(config)
-    tree_rows = build_tree_view(assembled_rows, catalog)
-    retag_rows = build_retag_suggestions(assembled_rows, config)
-    ledger.write_tree_outputs(tree_rows, retag_rows)
-
-    validation_summary = _aggregate_validation(records)
-    config_hashes = _hash_config(config_dir)
-    validation_payload = _build_validation_report(records, validation_summary)
-    ledger.write_validation_report(validation_payload)
-
-    version_seq = ledger.write_version(
-        tx_ids=tx_ids,
-        validation_summary=validation_summary,
-        config_hashes=config_hashes,
-        input_hashes={},
-        code_version="unknown",
-        row_counts=row_counts,
-    )
+    assembled_rows = assemble_workspace(ledger, config, raw_rows, commands, full=full)
+    update_reachability_index(ledger, raw_rows, commands)
+    with ArtifactWriters(jobs or config.engine.ledger.jobs) as writers:
+        row_counts = ledger.write_observations(config, assembled_rows, writers)
+
+        catalog = SurveyCatalog.from_config(config)
+        tree_rows = build_tree_view(assembled_rows, catalog)
+        retag_rows = build_retag_suggestions(assembled_rows, config)
+        ledger.write_tree_outputs(tree_rows, retag_rows, writers)
+
+        validation_summary = _aggregate_validation(records)
+        config_hashes = fingerprint["config_hashes"]
+        validation_payload = _build_validation_report(records, validation_summary)
+        ledger.write_validation_report(validation_payload, writers)
+
+        version_seq = ledger.write_version(
+            tx_ids=tx_ids,
+            validation_summary=validation_summary,
+            config_hashes=config_hashes,
+            input_hashes={},
+            code_version=fingerprint["code_version"],
+            row_counts=row_counts,
+            writers=writers,
+            build_fingerprint=fingerprint,
+        )
 
     return BuildResult(version_seq=version_seq, tx_count=len(tx_ids))
 
 
+def _latest_manifest(ledger: Ledger) -> Optional[dict]:
+    try:
+        return ledger.latest_manifest()
+    except (FileNotFoundError, ValueError):
+        # An interrupted snapshot left a version without a readable manifest.
+        return None
+
+
 def _aggregate_validation(records: list[dict]) -> Dict[str, int]:
     total_errors = 0
     total_warnings = 0
@@ -88,21 +146,3 @@ def _build_validation_report(records: list[dict], summary: Dict[str, int]) -> di
             for record in records
         ],
     }
-
-
-def _hash_config(config_dir: Path) -> Dict[str, str]:
-    return {
-        path.name: _sha256_file(path)
-        for path in sorted(config_dir.glob("*.toml"))
-    }
-
-
-def _sha256_file(path: Path) -> str:
-    import hashlib
-
-    digest = hashlib.sha256()
-    with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
@@ -0,0 +1,33 @@
+"""Ledger maintenance: merge raw segments into the base raw file."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..config import load_config_bundle
+from ..ledger.lock import WorkspaceLock
+from ..ledger.storage import Ledger
+
+
+@dataclass
+class CompactResult:
+    segments_merged: int
+    raw_rows: int
+
+
+def compact_ledger(config_dir: Path, workspace: Path) -> CompactResult:
+    """Fold every per-transaction raw segment into the base raw file.
+
+    Submits only append segments, so compaction is a maintenance step that can
+    run whenever convenient (e.g. from cron); readers see either the old or the
+    new layout because the base file and the segment manifest are replaced
+    atomically.
+    """
+
+    config = load_config_bundle(Path(config_dir))
+    ledger = Ledger(Path(workspace), config.engine.ledger)
+    with WorkspaceLock(ledger.root):
+        merged = ledger.compact_raw_segments()
+        raw_rows = len(ledger.load_raw_measurements())
+    return CompactResult(segments_merged=merged, raw_rows=raw_rows)
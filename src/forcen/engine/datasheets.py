@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ..assembly.reassemble import assemble_dataset
 from ..assembly.survey import SurveyCatalog
 from ..config import ConfigBundle, load_config_bundle
 from ..exceptions import ForcenError
 from ..ledger.storage import Ledger
+from ..ledger.writers import ArtifactWriters
 from ..transactions.models import MeasurementRow
+from .utils import detect_code_version, hash_config
 
 
 class DatasheetsError(ForcenError):
@@ -27,6 +29,12 @@ class DatasheetOptions:
     output_dir: Path
 
 
+@dataclass
+class DatasheetBatchResult:
+    outputs: List[Path] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)  # "site/plot" -> reason
+
+
 def generate_datasheet(
     config_dir: Path,
     workspace: Path,
@@ -35,14 +43,11 @@ def generate_datasheet(
     """Generate datasheet context JSON and return the output path."""
 
     config = load_config_bundle(config_dir)
-    ledger = Ledger(workspace)
-
-    raw_rows = ledger.load_raw_measurements()
-    if not raw_rows:
-        raise DatasheetsError("No observations found; submit transactions before generating datasheets")
+    ledger = Ledger(workspace, config.engine.ledger)
 
-    commands = ledger.load_commands()
-    assembled_rows = assemble_dataset(raw_rows, commands, config)
+    assembled_rows = _assembled_rows(
+        ledger, config, Path(config_dir), site=options.site, plot=options.plot
+    )
     context = _build_context(
         assembled_rows,
         config,
@@ -52,8 +57,147 @@ def generate_datasheet(
     )
 
     options.output_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"context_{options.site}_{options.plot}_{options.survey_id}.json"
-    output_path = options.output_dir / filename
+    return _write_context(options.output_dir, context)
+
+
+def generate_datasheets(
+    config_dir: Path,
+    workspace: Path,
+    survey_id: str,
+    output_dir: Path,
+    *,
+    site: Optional[str] = None,
+    jobs: Optional[int] = None,
+) -> DatasheetBatchResult:
+    """Generate datasheet contexts for every observed plot (of *site*, if given).
+
+    Assembles once and partitions the rows by (site, plot) in a single scan;
+    plots without eligible trees are reported in ``skipped``.  Files are
+    written on a pool of *jobs* writers (defaults to ``ledger.jobs``).
+    """
+
+    config = load_config_bundle(config_dir)
+    ledger = Ledger(workspace, config.engine.ledger)
+    catalog = SurveyCatalog.from_config(config)
+    if survey_id not in catalog.ordered_surveys():
+        raise DatasheetsError(f"Unknown survey id {survey_id}")
+
+    rows = _assembled_rows(ledger, config, Path(config_dir), site=site)
+    partitions = _partition_by_plot(rows, catalog, site)
+    if not partitions:
+        where = f" for site={site}" if site is not None else ""
+        raise DatasheetsError(f"No observations found{where}")
+
+    result = DatasheetBatchResult()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with ArtifactWriters(jobs or config.engine.ledger.jobs) as writers:
+        pending = []
+        for (plot_site, plot), rows in sorted(partitions.items()):
+            try:
+                context = _build_context(
+                    rows, config, survey_id, plot_site, plot, catalog=catalog
+                )
+            except DatasheetsError as exc:
+                result.skipped[f"{plot_site}/{plot}"] = str(exc)
+                continue
+            pending.append(writers.submit(_write_context, output_dir, context))
+        writers.wait()
+    result.outputs = [future.result() for future in pending]
+    return result
+
+
+def _assembled_rows(
+    ledger: Ledger,
+    config: ConfigBundle,
+    config_dir: Path,
+    *,
+    site: Optional[str] = None,
+    plot: Optional[str] = None,
+) -> List[MeasurementRow]:
+    """Assembled rows (at least those of *site*/*plot*), in assembly order.
+
+    Read from the latest version's observations_long.parquet when that
+    version reflects the current ledger, config and code; assembled from the
+    raw ledger otherwise.
+    """
+
+    rows = _materialized_rows(ledger, config_dir, site, plot)
+    if rows is not None:
+        return rows
+
+    raw_rows = ledger.load_raw_measurements()
+    if not raw_rows:
+        raise DatasheetsError("No observations found; submit transactions before generating datasheets")
+
+    commands = ledger.load_commands()
+    return assemble_dataset(raw_rows, commands, config)
+
+
+def _materialized_rows(
+    ledger: Ledger,
+    config_dir: Path,
+    site: Optional[str],
+    plot: Optional[str],
+) -> Optional[List[MeasurementRow]]:
+    try:
+        manifest = ledger.latest_manifest()
+    except (FileNotFoundError, ValueError):
+        return None
+    if manifest is None:
+        return None
+
+    # Each version snapshots the whole dataset but lists only the
+    # transactions it added, so it is current if it ends the ledger.
+    tx_ids = ledger.transaction_ids()
+    version_tx_ids = list(manifest.get("tx_ids") or [])
+    if not version_tx_ids or tx_ids[-len(version_tx_ids):] != version_tx_ids:
+        return None
+    if manifest.get("config_hashes") != hash_config(config_dir):
+        return None
+    if manifest.get("code_version") != detect_code_version():
+        return None
+
+    rows = ledger.read_version_observations(
+        int(manifest["version_seq"]), site=site, plot=plot
+    )
+    if rows is None:
+        return None
+    # observations_long is sorted by survey/obs_id; restore the order
+    # assemble_dataset produces, which the context builders' stable sorts see.
+    tx_rank = {tx_id: index for index, tx_id in enumerate(tx_ids)}
+    rows.sort(
+        key=lambda row: (
+            row.date,
+            row.site,
+            row.plot,
+            row.tag,
+            row.row_number,
+            row.origin == "implied",
+            tx_rank.get(row.source_tx or "", -1),
+        )
+    )
+    return rows
+
+
+def _partition_by_plot(
+    rows: Iterable[MeasurementRow],
+    catalog: SurveyCatalog,
+    site: Optional[str],
+) -> Dict[Tuple[str, str], List[MeasurementRow]]:
+    # Same row filter as _build_context, applied once for every plot.
+    partitions: Dict[Tuple[str, str], List[MeasurementRow]] = {}
+    for row in rows:
+        if row.tree_uid is None or (site is not None and row.site != site):
+            continue
+        if catalog.survey_of(row) is None:
+            continue
+        partitions.setdefault((row.site, row.plot), []).append(row)
+    return partitions
+
+
+def _write_context(output_dir: Path, context: Dict[str, object]) -> Path:
+    filename = f"context_{context['site']}_{context['plot']}_{context['survey_id']}.json"
+    output_path = output_dir / filename
     output_path.write_text(json.dumps(context, indent=2, sort_keys=True) + "\n", encoding="utf-8")
     return output_path
 
@@ -64,8 +208,10 @@ def _build_context(
     survey_id: str,
     site: str,
     plot: str,
+    *,
+    catalog: Optional[SurveyCatalog] = None,
 ) -> Dict[str, object]:
-    catalog = SurveyCatalog.from_config(config)
+    catalog = catalog or SurveyCatalog.from_config(config)
     ordered_surveys = catalog.ordered_surveys()
     if survey_id not in ordered_surveys:
         raise DatasheetsError(f"Unknown survey id {survey_id}")
@@ -92,7 +238,7 @@ def _build_context(
             continue
         if row.site != site or row.plot != plot:
             continue
-        if catalog.survey_for_date(row.date) is None:
+        if catalog.survey_of(row) is None:
             continue
         filtered_rows.append(row)
 
@@ -134,7 +280,7 @@ def _prepare_trees(
 
     per_tree: Dict[str, Dict[str, List[MeasurementRow]]] = defaultdict(lambda: defaultdict(list))
     for row in rows:
-        survey_id = catalog.survey_for_date(row.date)
+        survey_id = catalog.survey_of(row)
         if survey_id is None:
             continue
         per_tree[row.tree_uid][survey_id].append(row)
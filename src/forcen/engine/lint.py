@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Iterable, List, Optional
 
@@ -16,14 +16,35 @@ from ..validators import (
     validate_growth,
     validate_measurement_rows,
 )
-from .utils import determine_default_effective_date, with_default_effective
+from .utils import (
+    determine_default_effective_date,
+    load_assembly_state,
+    load_reachability_index,
+    with_default_effective,
+)
 from ..assembly.tree_outputs import build_tree_view, build_retag_suggestions
-from ..assembly.reassemble import assemble_dataset, clone_raw_measurement
+from ..assembly.incremental import AssemblyState, assemble_incremental
+from ..assembly.reassemble import assemble_dataset
 from ..assembly.survey import SurveyCatalog
 from ..dsl.types import Command
 from ..ledger.storage import Ledger
 
 
+@dataclass
+class LintState:
+    """Intermediate results of a lint run, reusable by submit."""
+
+    config: ConfigBundle
+    transaction: TransactionData  # normalized, with default EFFECTIVE dates applied
+    raw_new_rows: List[MeasurementRow]  # source_tx set to the tx_id
+    raw_rows: List[MeasurementRow]  # existing ledger rows + raw_new_rows
+    commands: List[Command]  # existing ledger commands + transaction commands
+    assembled_rows: List[MeasurementRow]
+    # Incremental assembly state for raw_rows/commands (None with full assembly);
+    # its tx_ids still describe the ledger before this transaction.
+    assembly_state: Optional[AssemblyState] = None
+
+
 @dataclass
 class LintReport:
     """Summary from linting a transaction."""
@@ -34,6 +55,9 @@ class LintReport:
     measurement_rows: List[dict] = field(default_factory=list)
     tree_view: List[dict] = field(default_factory=list)
     retag_suggestions: List[dict] = field(default_factory=list)
+    # "site/plot" partitions a scoped lint loaded; None for a full lint.
+    scope: Optional[List[str]] = None
+    state: Optional[LintState] = field(default=None, repr=False, compare=False)
 
     @property
     def error_count(self) -> int:
@@ -48,7 +72,7 @@ class LintReport:
         return self.error_count > 0
 
     def as_dict(self) -> dict:
-        return {
+        payload = {
             "transaction_path": str(self.transaction_path),
             "tx_id": self.tx_id,
             "issues": [
@@ -69,6 +93,9 @@ class LintReport:
             "tree_view": self.tree_view,
             "retag_suggestions": self.retag_suggestions,
         }
+        if self.scope is not None:
+            payload["scope"] = self.scope
+        return payload
 
 
 def lint_transaction(
@@ -77,12 +104,74 @@ def lint_transaction(
     *,
     normalization: NormalizationConfig | None = None,
     workspace: Optional[Path] = None,
+    keep_state: bool = False,
+    full: bool = False,
+    scoped: bool = False,
 ) -> LintReport:
-    """Lint a transaction directory against project configuration."""
+    """Lint a transaction directory against project configuration.
+
+    With *keep_state*, the report carries the :class:`LintState` it was
+    computed from.  With a *workspace*, assembly is incremental (reusing the
+    ledger's persisted assembly state) unless *full* is set or
+    ``assembly.incremental`` is disabled in engine.toml.
+
+    With *scoped* (ignored with *keep_state*), only the ledger plots the
+    transaction can reach are loaded and assembled; the report's tree_view,
+    retag_suggestions and growth issues then cover just those plots.  Falls
+    back to a full lint when the ledger's reachability index is missing or
+    stale, or when an UPDATE moves trees to an unknown plot.
+    """
 
     config_dir = Path(config_dir)
     transaction_dir = Path(transaction_dir)
     config = load_config_bundle(config_dir)
+    existing_raw_rows: List[MeasurementRow] = []
+    existing_commands: List[Command] = []
+    assembly_state: Optional[AssemblyState] = None
+    incremental = False
+    if workspace is not None:
+        ledger = Ledger(workspace, config.engine.ledger)
+        if scoped and not keep_state:
+            report = _lint_scoped(transaction_dir, config, ledger, normalization)
+            if report is not None:
+                return report
+        existing_raw_rows = ledger.load_raw_measurements()
+        existing_commands = ledger.load_commands()
+        incremental = config.engine.assembly.incremental and not full
+        if incremental:
+            assembly_state = load_assembly_state(
+                ledger, config, existing_raw_rows, existing_commands
+            )
+    return lint_against_state(
+        transaction_dir,
+        config,
+        existing_raw_rows,
+        existing_commands,
+        normalization=normalization,
+        keep_state=keep_state,
+        incremental=incremental,
+        assembly_state=assembly_state,
+    )
+
+
+def lint_against_state(
+    transaction_dir: Path,
+    config: ConfigBundle,
+    existing_raw_rows: List[MeasurementRow],
+    existing_commands: List[Command],
+    *,
+    normalization: NormalizationConfig | None = None,
+    keep_state: bool = False,
+    incremental: bool = False,
+    assembly_state: Optional[AssemblyState] = None,
+) -> LintReport:
+    """Lint a transaction against already-loaded ledger rows and commands.
+
+    With *incremental*, assembly reuses *assembly_state* (which must describe
+    the existing rows and commands) and reassembles only affected trees.
+    """
+
+    transaction_dir = Path(transaction_dir)
     normalization = normalization or NormalizationConfig(
         rounding=config.validation.rounding
     )
@@ -94,21 +183,18 @@ def lint_transaction(
     )
 
     lint_tx_id = compute_tx_id(transaction_dir)
-    raw_new_rows = [clone_raw_measurement(row) for row in transaction.measurements]
-    for row in raw_new_rows:
-        row.source_tx = lint_tx_id
-
-    existing_raw_rows: List[MeasurementRow] = []
-    existing_commands: List[Command] = []
-    if workspace is not None:
-        ledger = Ledger(workspace)
-        existing_raw_rows = ledger.load_raw_measurements()
-        existing_commands = ledger.load_commands()
+    raw_new_rows = [replace(row, source_tx=lint_tx_id) for row in transaction.measurements]
 
     combined_raw_rows = existing_raw_rows + raw_new_rows
     combined_commands = existing_commands + transaction.commands
 
-    assembled_rows = assemble_dataset(combined_raw_rows, combined_commands, config)
+    new_assembly_state: Optional[AssemblyState] = None
+    if incremental:
+        assembled_rows, new_assembly_state = assemble_incremental(
+            combined_raw_rows, combined_commands, config, assembly_state
+        )
+    else:
+        assembled_rows = assemble_dataset(combined_raw_rows, combined_commands, config)
 
     issues = _collect_issues(config, transaction, assembled_rows)
     measurement_rows = [
@@ -136,6 +222,17 @@ def lint_transaction(
     tree_view_rows = build_tree_view(assembled_rows, catalog)
     retag_rows = build_retag_suggestions(assembled_rows, config)
 
+    state = None
+    if keep_state:
+        state = LintState(
+            config=config,
+            transaction=transaction,
+            raw_new_rows=raw_new_rows,
+            raw_rows=combined_raw_rows,
+            commands=combined_commands,
+            assembled_rows=assembled_rows,
+            assembly_state=new_assembly_state,
+        )
     return LintReport(
         transaction_path=transaction_dir,
         tx_id=lint_tx_id,
@@ -143,7 +240,36 @@ def lint_transaction(
         measurement_rows=measurement_rows,
         tree_view=tree_view_rows,
         retag_suggestions=retag_rows,
+        state=state,
+    )
+
+
+def _lint_scoped(
+    transaction_dir: Path,
+    config: ConfigBundle,
+    ledger: Ledger,
+    normalization: NormalizationConfig | None,
+) -> Optional[LintReport]:
+    """Lint against only the ledger plots the transaction reaches; None to lint in full."""
+
+    index = load_reachability_index(ledger)
+    if index is None:
+        return None
+    transaction = load_transaction(
+        transaction_dir,
+        normalization=normalization
+        or NormalizationConfig(rounding=config.validation.rounding),
+    )
+    scope = index.scope(transaction.measurements, transaction.commands)
+    if scope is None:
+        return None
+    raw_rows = ledger.load_raw_measurements(plots=scope.plots)
+    commands = [command for command in ledger.load_commands() if index.reaches(scope, command)]
+    report = lint_against_state(
+        transaction_dir, config, raw_rows, commands, normalization=normalization
     )
+    report.scope = sorted(f"{site}/{plot}" for site, plot in scope.plots)
+    return report
 
 
 def _collect_issues(
@@ -0,0 +1,92 @@
+"""Lint many transaction directories against one preloaded ledger snapshot."""
+
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from ..transactions import NormalizationConfig
+from .lint import LintReport
+from .watch import LintSession
+
+
+@dataclass
+class LintManyEntry:
+    tx_dir: Path
+    report: Optional[LintReport] = None
+    error_type: Optional[str] = None  # set when the lint raised instead of reporting
+    error: Optional[str] = None
+
+    @property
+    def has_errors(self) -> bool:
+        return self.error is not None or (self.report is not None and self.report.has_errors)
+
+
+# Set in the parent just before forking the pool; workers inherit it
+# copy-on-write instead of reloading or unpickling the ledger.
+_shared_session: Optional[LintSession] = None
+
+
+def lint_many(
+    transaction_dirs: Sequence[Path],
+    config_dir: Path,
+    *,
+    workspace: Optional[Path] = None,
+    normalization: Optional[NormalizationConfig] = None,
+    jobs: Optional[int] = None,
+) -> List[LintManyEntry]:
+    """Lint each of *transaction_dirs* independently against the same ledger.
+
+    The config, ledger rows, commands and assembly state are loaded once; with
+    more than one job the lints run in forked worker processes that share that
+    snapshot.  Results are returned in input order.
+    """
+
+    global _shared_session
+
+    dirs = [Path(tx_dir) for tx_dir in transaction_dirs]
+    session = LintSession(Path(config_dir), workspace=workspace, normalization=normalization)
+    session.preload()
+
+    jobs = min(jobs or os.cpu_count() or 1, len(dirs))
+    if jobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return [_lint_entry(session, tx_dir) for tx_dir in dirs]
+
+    _shared_session = session
+    # Keep the collector from touching (and so copying) the snapshot's pages.
+    gc.freeze()
+    try:
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            with warnings.catch_warnings():
+                # Reading parquet starts Arrow's thread pool; workers only run
+                # the pure-Python lint pipeline, so forking after it is safe.
+                warnings.filterwarnings(
+                    "ignore",
+                    message=r".*use of fork\(\) may lead to deadlocks",
+                    category=DeprecationWarning,
+                )
+                return list(pool.map(_lint_in_worker, dirs))
+    finally:
+        gc.unfreeze()
+        _shared_session = None
+
+
+def _lint_in_worker(tx_dir: Path) -> LintManyEntry:
+    assert _shared_session is not None
+    return _lint_entry(_shared_session, tx_dir)
+
+
+def _lint_entry(session: LintSession, tx_dir: Path) -> LintManyEntry:
+    try:
+        report = session.lint(tx_dir)
+    except Exception as exc:  # one entry's failure must not take down the pool
+        # Reported by name: some exceptions (ForcenError subclasses among them) do not pickle.
+        return LintManyEntry(tx_dir=tx_dir, error_type=type(exc).__name__, error=str(exc))
+    return LintManyEntry(tx_dir=tx_dir, report=report)
@@ -0,0 +1,147 @@
+"""FIFO submit queue shared by concurrent callers of one workspace."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from ..ledger.lock import WorkspaceLock
+from .submit import SubmitError, submit_transaction
+
+
+QUEUE_DIR = "queue"
+_ticket_counter = itertools.count()
+
+
+@dataclass
+class QueuedSubmitResult:
+    tx_dir: str
+    tx_id: Optional[str] = None
+    accepted: bool = False
+    version_seq: Optional[int] = None
+    warnings: int = 0
+    error: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def submit_queued(
+    transaction_dirs: Sequence[Path],
+    config_dir: Path,
+    workspace: Path,
+    *,
+    jobs: Optional[int] = None,
+    full: bool = False,
+    lock_timeout: Optional[float] = None,
+) -> List[QueuedSubmitResult]:
+    """Enqueue *transaction_dirs* and return their results in the same order.
+
+    Tickets from every caller land in ``<workspace>/queue/pending`` and are
+    named by enqueue time.  Whichever caller holds the workspace lock drains
+    the whole queue in FIFO order, so a caller that waited on the lock
+    usually finds its transactions already submitted.  A rejected or failing
+    transaction is reported in its result and does not stop the queue.
+    """
+
+    workspace = Path(workspace)
+    pending_dir = workspace / QUEUE_DIR / "pending"
+    results_dir = workspace / QUEUE_DIR / "results"
+    pending_dir.mkdir(parents=True, exist_ok=True)
+    results_dir.mkdir(parents=True, exist_ok=True)
+
+    tickets = [
+        _enqueue(pending_dir, Path(tx_dir), Path(config_dir), jobs, full)
+        for tx_dir in transaction_dirs
+    ]
+
+    with WorkspaceLock(workspace, timeout=lock_timeout):
+        _drain(pending_dir, results_dir, workspace)
+
+    results: List[QueuedSubmitResult] = []
+    for ticket in tickets:
+        result_path = results_dir / ticket
+        with result_path.open("r", encoding="utf-8") as fh:
+            results.append(QueuedSubmitResult(**json.load(fh)))
+        result_path.unlink()
+    return results
+
+
+def _enqueue(
+    pending_dir: Path,
+    tx_dir: Path,
+    config_dir: Path,
+    jobs: Optional[int],
+    full: bool,
+) -> str:
+    name = f"{time.time_ns():020d}-{os.getpid()}-{next(_ticket_counter):06d}-{uuid.uuid4().hex[:8]}.json"
+    payload = {
+        "tx_dir": str(tx_dir.resolve()),
+        "config_dir": str(config_dir.resolve()),
+        "jobs": jobs,
+        "full": full,
+    }
+    tmp_path = pending_dir.parent / (name + ".tmp")
+    tmp_path.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+    tmp_path.replace(pending_dir / name)
+    return name
+
+
+def _drain(pending_dir: Path, results_dir: Path, workspace: Path) -> None:
+    for ticket_path in sorted(pending_dir.glob("*.json")):
+        # Every dequeued ticket leaves a result, so one bad ticket can neither
+        # block later submits nor leave its caller without an answer.
+        try:
+            with ticket_path.open("r", encoding="utf-8") as fh:
+                ticket = json.load(fh)
+            result = _run_ticket(ticket, workspace)
+        except Exception as exc:
+            result = QueuedSubmitResult(tx_dir="", error=f"{type(exc).__name__}: {exc}")
+        try:
+            _write_result(results_dir, ticket_path.name, result)
+        except Exception as exc:
+            _write_result(
+                results_dir,
+                ticket_path.name,
+                QueuedSubmitResult(
+                    tx_dir=result.tx_dir,
+                    error=f"result not recorded: {type(exc).__name__}: {exc}",
+                ),
+            )
+        finally:
+            ticket_path.unlink(missing_ok=True)
+
+
+def _write_result(results_dir: Path, name: str, result: QueuedSubmitResult) -> None:
+    tmp_path = results_dir / (name + ".tmp")
+    tmp_path.write_text(json.dumps(result.as_dict()) + "\n", encoding="utf-8")
+    tmp_path.replace(results_dir / name)
+
+
+def _run_ticket(ticket: dict, workspace: Path) -> QueuedSubmitResult:
+    tx_dir = ticket["tx_dir"]
+    try:
+        submitted = submit_transaction(
+            Path(tx_dir),
+            Path(ticket["config_dir"]),
+            workspace,
+            jobs=ticket.get("jobs"),
+            full=ticket.get("full", False),
+        )
+    except SubmitError as exc:
+        return QueuedSubmitResult(tx_dir=tx_dir, error=f"rejected: {exc}")
+    except Exception as exc:  # reported per ticket; the queue keeps draining
+        return QueuedSubmitResult(tx_dir=tx_dir, error=f"{type(exc).__name__}: {exc}")
+    return QueuedSubmitResult(
+        tx_dir=tx_dir,
+        tx_id=submitted.tx_id,
+        accepted=submitted.accepted,
+        version_seq=submitted.version_seq,
+        warnings=submitted.warnings,
+    )
@@ -0,0 +1,169 @@
+"""Long-lived lint/submit server on a Unix domain socket (``forcen serve``).
+
+Protocol: each request is one JSON object on its own line and gets one JSON
+line back; a connection may send any number of requests.
+
+    {"op": "ping"}
+    {"op": "lint", "tx_dir": "..."}
+    {"op": "lint", "measurements_csv": "...", "updates_tdl": "...", "survey_meta_toml": "..."}
+    {"op": "submit", ...same transaction fields as lint...}
+
+Replies are ``{"ok": true, "result": {...}}`` or ``{"ok": false, "error":
+{"type": ..., "message": ...}}``; an ``id`` field in the request is echoed.
+Lints run concurrently against one warm :class:`LintSession`; submits are
+serialized.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from ..exceptions import ForcenError
+from ..transactions import NormalizationConfig
+from ..transactions.loader import (
+    MEASUREMENTS_FILENAME,
+    SURVEY_META_FILENAME,
+    UPDATES_FILENAME,
+)
+from .submit import submit_transaction
+from .watch import LintSession
+
+
+INLINE_FIELDS = {
+    "measurements_csv": MEASUREMENTS_FILENAME,
+    "updates_tdl": UPDATES_FILENAME,
+    "survey_meta_toml": SURVEY_META_FILENAME,
+}
+
+
+class ServerError(ForcenError):
+    """Raised for malformed requests or when the socket is already served."""
+
+
+class ForcenServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, config_dir: Path, workspace: Path) -> None:
+        self.socket_path = Path(socket_path)
+        self.config_dir = Path(config_dir)
+        self.workspace = Path(workspace)
+        self.session = LintSession(
+            self.config_dir, workspace=self.workspace, normalization=NormalizationConfig()
+        )
+        self._submit_lock = threading.Lock()
+        _claim_socket_path(self.socket_path)
+        super().__init__(str(self.socket_path), _RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+    def handle_request_payload(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "ping":
+            return {"workspace": str(self.workspace)}
+        if op == "lint":
+            with _transaction_dir(request) as tx_dir:
+                return self.session.lint(tx_dir).as_dict()
+        if op == "submit":
+            with _transaction_dir(request) as tx_dir, self._submit_lock:
+                result = submit_transaction(
+                    tx_dir,
+                    self.config_dir,
+                    self.workspace,
+                    normalization=NormalizationConfig(),
+                )
+            return {
+                "tx_id": result.tx_id,
+                "accepted": result.accepted,
+                "version_seq": result.version_seq,
+                "warnings": result.warnings,
+            }
+        raise ServerError(f"unknown op {op!r}")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: ForcenServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            reply = self._reply(line)
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+    def _reply(self, line: bytes) -> Dict[str, Any]:
+        request: Dict[str, Any] = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ServerError("request must be a JSON object")
+            reply: Dict[str, Any] = {
+                "ok": True,
+                "result": self.server.handle_request_payload(request),
+            }
+        except json.JSONDecodeError as exc:
+            reply = _error_reply("ServerError", f"invalid JSON: {exc}")
+        except Exception as exc:  # answered, never a dropped connection
+            reply = _error_reply(type(exc).__name__, str(exc))
+        if "id" in request:
+            reply["id"] = request["id"]
+        return reply
+
+
+def send_request(
+    socket_path: Path, request: Dict[str, Any], *, timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """Send one request to a running server and return its reply."""
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+@contextmanager
+def _transaction_dir(request: Dict[str, Any]) -> Iterator[Path]:
+    """Yield the request's tx_dir, or a temporary directory holding its inline files."""
+
+    tx_dir = request.get("tx_dir")
+    if tx_dir is not None:
+        yield Path(tx_dir)
+        return
+    if not isinstance(request.get("measurements_csv"), str):
+        raise ServerError("request needs tx_dir or measurements_csv")
+    with tempfile.TemporaryDirectory(prefix="forcen-tx-") as tmp:
+        path = Path(tmp)
+        for field, filename in INLINE_FIELDS.items():
+            text = request.get(field)
+            if text is not None:
+                (path / filename).write_text(str(text), encoding="utf-8")
+        yield path
+
+
+def _claim_socket_path(socket_path: Path) -> None:
+    if not socket_path.exists():
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()  # stale socket from a server that exited uncleanly
+            return
+    raise ServerError(f"{socket_path} is already being served")
+
+
+def _error_reply(error_type: str, message: str) -> Dict[str, Any]:
+    return {"ok": False, "error": {"type": error_type, "message": message}}
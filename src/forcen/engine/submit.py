@@ -5,18 +5,25 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from ..config import load_config_bundle
 from ..exceptions import ConfigError, ForcenError
+from ..ledger.blobs import sha256_file
+from ..ledger.lock import WorkspaceLock
 from ..ledger.storage import Ledger
-from ..transactions import NormalizationConfig, load_transaction
+from ..ledger.writers import ArtifactWriters
+from ..transactions import NormalizationConfig
+from ..transactions.txid import compute_tx_id
 from ..validators import ValidationIssue
-from .lint import lint_transaction
-from .utils import determine_default_effective_date, with_default_effective
-from ..assembly.survey import SurveyCatalog
-from ..assembly.tree_outputs import build_retag_suggestions, build_tree_view
-from ..assembly.reassemble import assemble_dataset, clone_raw_measurement
+from .lint import lint_against_state, lint_transaction
+from .utils import (
+    build_fingerprint,
+    detect_code_version,
+    hash_config,
+    load_assembly_state,
+    update_reachability_index,
+)
 
 
 @dataclass
@@ -37,102 +44,152 @@ def submit_transaction(
     workspace: Path,
     *,
     normalization: Optional[NormalizationConfig] = None,
+    jobs: Optional[int] = None,
+    full: bool = False,
 ) -> SubmitResult:
-    """Submit a transaction and update the ledger."""
+    """Submit a transaction and update the ledger.
 
+    Holds the workspace lock for the whole submit, so concurrent submits to
+    one workspace run one after another.  *jobs* bounds the artifact writer
+    pool (defaults to ``ledger.jobs`` in engine.toml); *full* bypasses
+    incremental assembly.
+    """
+
+    with WorkspaceLock(Path(workspace)):
+        return _submit_locked(
+            transaction_dir,
+            config_dir,
+            workspace,
+            normalization=normalization,
+            jobs=jobs,
+            full=full,
+        )
+
+
+def _known_tx_id(transaction_dir: Path) -> Optional[str]:
+    """tx_id for the resubmit shortcut, or None when the inputs cannot be read.
+
+    Unreadable inputs fall through to lint, which reports them as a
+    TransactionFormatError.
+    """
+
+    try:
+        return compute_tx_id(transaction_dir)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _recorded_warnings(summary: dict) -> int:
+    """Warning count an accepted transaction was recorded with, reported again on resubmit."""
+
+    return int(summary["validation_summary"].get("warnings", 0))
+
+
+def _submit_locked(
+    transaction_dir: Path,
+    config_dir: Path,
+    workspace: Path,
+    *,
+    normalization: Optional[NormalizationConfig],
+    jobs: Optional[int],
+    full: bool,
+) -> SubmitResult:
     transaction_dir = Path(transaction_dir)
     config_dir = Path(config_dir)
     workspace = Path(workspace)
-    normalization_override = normalization
+    # Resubmits (e.g. retries from the queue) are answered before any linting.
+    known_tx_id = _known_tx_id(transaction_dir)
+    if known_tx_id is not None:
+        recorded = Ledger(workspace).transaction_summary(known_tx_id)
+        if recorded is not None:
+            return SubmitResult(
+                tx_id=known_tx_id,
+                accepted=False,
+                warnings=_recorded_warnings(recorded),
+            )
+
     lint_report = lint_transaction(
         transaction_dir=transaction_dir,
         config_dir=config_dir,
-        normalization=normalization_override,
+        normalization=normalization,
         workspace=workspace,
+        keep_state=True,
+        full=full,
     )
 
     if lint_report.has_errors:
         raise SubmitError("transaction rejected due to validation errors")
 
-    config = load_config_bundle(config_dir)
-    normalization = normalization_override or NormalizationConfig(
-        rounding=config.validation.rounding
-    )
-    tx_data = load_transaction(transaction_dir, normalization=normalization)
-    default_effective = determine_default_effective_date(config, tx_data)
-    tx_data.commands = with_default_effective(tx_data.commands, default_effective)
-    raw_new_rows = [clone_raw_measurement(row) for row in tx_data.measurements]
+    # Lint already normalized the transaction, loaded the ledger and assembled
+    # the combined dataset; reuse all of it.
+    state = lint_report.state
+    assert state is not None
+    config = state.config
+    tx_data = state.transaction
+    raw_new_rows = state.raw_new_rows
+    assembled_rows = state.assembled_rows
     tx_id = lint_report.tx_id
-    for row in raw_new_rows:
-        row.source_tx = tx_id
-
-    ledger = Ledger(workspace)
-    if ledger.has_transaction(tx_id):
-        return SubmitResult(tx_id=tx_id, accepted=False, version_seq=None, warnings=lint_report.warning_count)
-
-    existing_raw_rows = ledger.load_raw_measurements()
-    existing_commands = ledger.load_commands()
-    all_commands = existing_commands + tx_data.commands
-    combined_raw_rows = existing_raw_rows + raw_new_rows
-
-    assembled_rows = assemble_dataset(combined_raw_rows, all_commands, config)
-
-    ledger.write_raw_measurements(combined_raw_rows)
-    row_counts = ledger.write_observations(config, assembled_rows)
-
-    catalog = SurveyCatalog.from_config(config)
-    tree_view_rows = build_tree_view(assembled_rows, catalog)
-    retag_rows = build_retag_suggestions(assembled_rows, config)
-    ledger.write_tree_outputs(tree_view_rows, retag_rows)
-    dsl_lines_added = ledger.append_updates(transaction_dir)
-    rows_added = len(raw_new_rows)
-
-    config_hashes = _hash_config(config_dir)
-    input_hashes = _hash_transaction_inputs(transaction_dir)
-
-    issues_list = _rebuild_issues(lint_report.issues)
-    summary = _summarize_issues(issues_list)
-
-    code_version = _detect_code_version()
-
-    validation_payload = {
-        "tx_id": tx_id,
-        "summary": {
-            "errors": lint_report.error_count,
-            "warnings": lint_report.warning_count,
-        },
-        "issues": [
-            {
-                "code": issue.code,
-                "severity": issue.severity,
-                "message": issue.message,
-                "location": issue.location,
-            }
-            for issue in lint_report.issues
-        ],
-    }
-    ledger.write_validation_report(validation_payload)
-
-    ledger.append_transaction_entry(
-        tx_id=tx_id,
-        code_version=code_version,
-        config_hashes=config_hashes,
-        input_hashes=input_hashes,
-        rows_added=rows_added,
-        dsl_lines_added=dsl_lines_added,
-        row_counts=row_counts,
-        issues=issues_list,
-        commands=tx_data.commands,
-    )
 
-    version_seq = ledger.write_version(
-        tx_ids=[tx_id],
-        validation_summary=summary,
-        config_hashes=config_hashes,
-        input_hashes=input_hashes,
-        code_version=code_version,
-        row_counts=row_counts,
-    )
+    ledger = Ledger(workspace, config.engine.ledger)
+
+    with ArtifactWriters(jobs or config.engine.ledger.jobs) as writers:
+        row_counts = ledger.write_observations(config, assembled_rows, writers)
+
+        ledger.write_tree_outputs(
+            lint_report.tree_view, lint_report.retag_suggestions, writers
+        )
+        dsl_lines_added = ledger.append_updates(transaction_dir)
+        rows_added = len(raw_new_rows)
+
+        config_hashes = hash_config(config_dir)
+        input_hashes = _hash_transaction_inputs(transaction_dir)
+
+        issues_list = _rebuild_issues(lint_report.issues)
+        summary = _summarize_issues(issues_list)
+
+        code_version = detect_code_version()
+
+        validation_payload = {
+            "tx_id": tx_id,
+            "summary": {
+                "errors": lint_report.error_count,
+                "warnings": lint_report.warning_count,
+            },
+            "issues": [_issue_payload(issue) for issue in lint_report.issues],
+        }
+        ledger.write_validation_report(validation_payload, writers)
+
+        # The transaction (raw segment first) is recorded only once every
+        # artifact is on disk.
+        writers.wait()
+        ledger.append_raw_segment(tx_id, raw_new_rows)
+        ledger.append_transaction_entry(
+            tx_id=tx_id,
+            code_version=code_version,
+            config_hashes=config_hashes,
+            input_hashes=input_hashes,
+            rows_added=rows_added,
+            dsl_lines_added=dsl_lines_added,
+            row_counts=row_counts,
+            issues=issues_list,
+            commands=tx_data.commands,
+        )
+
+        version_seq = ledger.write_version(
+            tx_ids=[tx_id],
+            validation_summary=summary,
+            config_hashes=config_hashes,
+            input_hashes=input_hashes,
+            code_version=code_version,
+            row_counts=row_counts,
+            writers=writers,
+            build_fingerprint=build_fingerprint(ledger, config_dir),
+        )
+
+    if state.assembly_state is not None:
+        state.assembly_state.tx_ids = ledger.transaction_ids()
+        ledger.write_assembly_state(state.assembly_state)
+    update_reachability_index(ledger, state.raw_rows, state.commands)
 
     return SubmitResult(
         tx_id=tx_id,
@@ -142,10 +199,223 @@ def submit_transaction(
     )
 
 
-def _hash_config(config_dir: Path) -> Dict[str, str]:
+@dataclass
+class BatchEntryResult:
+    tx_dir: str
+    tx_id: Optional[str]
+    accepted: bool
+    errors: int = 0
+    warnings: int = 0
+    reason: Optional[str] = None
+
+
+@dataclass
+class BatchSubmitResult:
+    version_seq: Optional[int]
+    entries: List[BatchEntryResult]
+
+    @property
+    def accepted_tx_ids(self) -> List[str]:
+        return [entry.tx_id for entry in self.entries if entry.accepted and entry.tx_id]
+
+
+def submit_batch(
+    transaction_dirs: Sequence[Path],
+    config_dir: Path,
+    workspace: Path,
+    *,
+    normalization: Optional[NormalizationConfig] = None,
+    jobs: Optional[int] = None,
+    full: bool = False,
+) -> BatchSubmitResult:
+    """Submit many transactions with a single reassembly and version.
+
+    Each transaction is linted, in order, against the ledger plus the
+    transactions accepted earlier in the batch.  Accepted transactions are
+    recorded individually in the transaction log, but artifacts are written
+    once and one version lists all of them.  Rejected or unreadable
+    transactions are reported in their entry and skipped.
+    """
+
+    with WorkspaceLock(Path(workspace)):
+        return _submit_batch_locked(
+            [Path(tx_dir) for tx_dir in transaction_dirs],
+            Path(config_dir),
+            Path(workspace),
+            normalization=normalization,
+            jobs=jobs,
+            full=full,
+        )
+
+
+def _submit_batch_locked(
+    transaction_dirs: List[Path],
+    config_dir: Path,
+    workspace: Path,
+    *,
+    normalization: Optional[NormalizationConfig],
+    jobs: Optional[int],
+    full: bool,
+) -> BatchSubmitResult:
+    config = load_config_bundle(config_dir)
+    normalization = normalization or NormalizationConfig(
+        rounding=config.validation.rounding
+    )
+    ledger = Ledger(workspace, config.engine.ledger)
+    cumulative_rows = ledger.load_raw_measurements()
+    cumulative_commands = ledger.load_commands()
+    incremental = config.engine.assembly.incremental and not full
+    assembly_state = (
+        load_assembly_state(ledger, config, cumulative_rows, cumulative_commands)
+        if incremental
+        else None
+    )
+
+    entries: List[BatchEntryResult] = []
+    accepted: List[tuple] = []
+    # tx_id -> warning count of transactions accepted earlier in this batch.
+    seen: Dict[str, int] = {}
+    for transaction_dir in transaction_dirs:
+        tx_id = _known_tx_id(transaction_dir)
+        if tx_id is not None:
+            warnings = seen.get(tx_id)
+            if warnings is None:
+                recorded = ledger.transaction_summary(tx_id)
+                warnings = _recorded_warnings(recorded) if recorded is not None else None
+            if warnings is not None:
+                entries.append(
+                    BatchEntryResult(
+                        str(transaction_dir),
+                        tx_id,
+                        False,
+                        warnings=warnings,
+                        reason="already submitted",
+                    )
+                )
+                continue
+        try:
+            lint_report = lint_against_state(
+                transaction_dir,
+                config,
+                cumulative_rows,
+                cumulative_commands,
+                normalization=normalization,
+                keep_state=True,
+                incremental=incremental,
+                assembly_state=assembly_state,
+            )
+        except (ForcenError, OSError, ValueError) as exc:
+            entries.append(
+                BatchEntryResult(str(transaction_dir), None, False, reason=str(exc))
+            )
+            continue
+        tx_id = lint_report.tx_id
+        entry = BatchEntryResult(
+            str(transaction_dir),
+            tx_id,
+            not lint_report.has_errors,
+            errors=lint_report.error_count,
+            warnings=lint_report.warning_count,
+        )
+        entries.append(entry)
+        if lint_report.has_errors:
+            entry.reason = "validation errors"
+            continue
+
+        state = lint_report.state
+        assert state is not None
+        cumulative_rows = state.raw_rows
+        cumulative_commands = state.commands
+        assembly_state = state.assembly_state
+        seen[tx_id] = lint_report.warning_count
+        accepted.append((transaction_dir, lint_report, state.transaction, state.raw_new_rows))
+
+    if not accepted:
+        return BatchSubmitResult(version_seq=None, entries=entries)
+
+    # The last accepted lint already assembled the full cumulative state.
+    last_state = accepted[-1][1].state
+    assert last_state is not None
+    assembled_rows = last_state.assembled_rows
+    config_hashes = hash_config(config_dir)
+    code_version = detect_code_version()
+
+    with ArtifactWriters(jobs or config.engine.ledger.jobs) as writers:
+        row_counts = ledger.write_observations(config, assembled_rows, writers)
+        last_report = accepted[-1][1]
+        ledger.write_tree_outputs(
+            last_report.tree_view, last_report.retag_suggestions, writers
+        )
+
+        all_issues: List[ValidationIssue] = []
+        input_hashes: Dict[str, str] = {}
+        report_transactions = []
+        for transaction_dir, lint_report, _, _ in accepted:
+            all_issues.extend(lint_report.issues)
+            for name, digest in _hash_transaction_inputs(transaction_dir).items():
+                input_hashes[f"{lint_report.tx_id}/{name}"] = digest
+            report_transactions.append(
+                {
+                    "tx_id": lint_report.tx_id,
+                    "summary": {
+                        "errors": lint_report.error_count,
+                        "warnings": lint_report.warning_count,
+                    },
+                    "issues": [_issue_payload(issue) for issue in lint_report.issues],
+                }
+            )
+        summary = _summarize_issues(all_issues)
+        ledger.write_validation_report(
+            {"summary": summary, "transactions": report_transactions}, writers
+        )
+
+        dsl_lines = [ledger.append_updates(transaction_dir) for transaction_dir, *_ in accepted]
+
+        # Transactions (raw segments first) are recorded only once every
+        # artifact is on disk.
+        writers.wait()
+        for (transaction_dir, lint_report, tx_data, raw_new_rows), lines in zip(
+            accepted, dsl_lines
+        ):
+            ledger.append_raw_segment(lint_report.tx_id, raw_new_rows)
+            issues = _rebuild_issues(lint_report.issues)
+            ledger.append_transaction_entry(
+                tx_id=lint_report.tx_id,
+                code_version=code_version,
+                config_hashes=config_hashes,
+                input_hashes=_hash_transaction_inputs(transaction_dir),
+                rows_added=len(raw_new_rows),
+                dsl_lines_added=lines,
+                row_counts=row_counts,
+                issues=issues,
+                commands=tx_data.commands,
+            )
+
+        version_seq = ledger.write_version(
+            tx_ids=[lint_report.tx_id for _, lint_report, _, _ in accepted],
+            validation_summary=summary,
+            config_hashes=config_hashes,
+            input_hashes=input_hashes,
+            code_version=code_version,
+            row_counts=row_counts,
+            writers=writers,
+            build_fingerprint=build_fingerprint(ledger, config_dir),
+        )
+
+    if assembly_state is not None:
+        assembly_state.tx_ids = ledger.transaction_ids()
+        ledger.write_assembly_state(assembly_state)
+    update_reachability_index(ledger, cumulative_rows, cumulative_commands)
+
+    return BatchSubmitResult(version_seq=version_seq, entries=entries)
+
+
+def _issue_payload(issue: ValidationIssue) -> dict:
     return {
-        path.name: _sha256_file(path)
-        for path in sorted(config_dir.glob("*.toml"))
+        "code": issue.code,
+        "severity": issue.severity,
+        "message": issue.message,
+        "location": issue.location,
     }
 
 
@@ -153,24 +423,10 @@ def _hash_transaction_inputs(tx_dir: Path) -> Dict[str, str]:
     hashes: Dict[str, str] = {}
     for path in sorted(tx_dir.rglob("*")):
         if path.is_file():
-            hashes[str(path.relative_to(tx_dir))] = _sha256_file(path)
+            hashes[str(path.relative_to(tx_dir))] = sha256_file(path)
     return hashes
 
 
-def _sha256_file(path: Path) -> str:
-    import hashlib
-
-    digest = hashlib.sha256()
-    with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
-def _detect_code_version() -> str:
-    return "unknown"
-
-
 def _rebuild_issues(issues: List[ValidationIssue]) -> List[ValidationIssue]:
     # Issues are already ValidationIssue instances, but ensure a copy for ledger writes.
     return list(issues)
@@ -4,13 +4,20 @@ from __future__ import annotations
 
 from dataclasses import replace
 from datetime import date
-from typing import Iterable, List
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from ..assembly import SurveyCatalog
+from ..assembly.incremental import AssemblyState, assemble_incremental
+from ..assembly.reachability import ReachabilityIndex
+from ..assembly.reassemble import assemble_dataset
 from ..config import ConfigBundle
 from ..dsl.types import AliasCommand, Command, SplitCommand, UpdateCommand
 from ..exceptions import ForcenError
-from ..transactions.models import TransactionData
+from ..ledger.blobs import sha256_file
+from ..ledger.storage import Ledger
+from ..transactions.models import MeasurementRow, TransactionData
 
 
 def determine_default_effective_date(
@@ -77,3 +84,116 @@ def with_default_effective(
         else:
             updated.append(command)
     return updated
+
+
+def with_assembly_engine(config: ConfigBundle, engine: Optional[str]) -> ConfigBundle:
+    """Return *config* with ``assembly.engine`` overridden (unchanged when *engine* is None)."""
+
+    if engine is None:
+        return config
+    assembly = config.engine.assembly.model_copy(update={"engine": engine})
+    return config.model_copy(
+        update={"engine": config.engine.model_copy(update={"assembly": assembly})}
+    )
+
+
+def load_assembly_state(
+    ledger: Ledger,
+    config: ConfigBundle,
+    raw_rows: Sequence[MeasurementRow],
+    commands: Sequence[Command],
+) -> Optional[AssemblyState]:
+    """Return the ledger's assembly state if it describes exactly *raw_rows*/*commands*."""
+
+    state = ledger.load_assembly_state()
+    if state is None or not state.matches(
+        config, ledger.transaction_ids(), len(raw_rows), len(commands)
+    ):
+        return None
+    return state
+
+
+def assemble_workspace(
+    ledger: Ledger,
+    config: ConfigBundle,
+    raw_rows: Sequence[MeasurementRow],
+    commands: Sequence[Command],
+    *,
+    full: bool = False,
+) -> List[MeasurementRow]:
+    """Assemble the ledger's full history, incrementally unless disabled or *full*.
+
+    The refreshed incremental state is persisted for the next run.
+    """
+
+    if full or not config.engine.assembly.incremental:
+        return assemble_dataset(raw_rows, commands, config)
+    state = load_assembly_state(ledger, config, raw_rows, commands)
+    assembled, new_state = assemble_incremental(raw_rows, commands, config, state)
+    new_state.tx_ids = ledger.transaction_ids()
+    ledger.write_assembly_state(new_state)
+    return assembled
+
+
+def load_reachability_index(ledger: Ledger) -> Optional[ReachabilityIndex]:
+    """Return the ledger's reachability index if it covers every accepted transaction."""
+
+    index = ledger.load_reachability_index()
+    if index is None or index.tx_ids != ledger.transaction_ids():
+        return None
+    return index
+
+
+def update_reachability_index(
+    ledger: Ledger,
+    raw_rows: Sequence[MeasurementRow],
+    commands: Sequence[Command],
+) -> None:
+    """Extend (or rebuild) the persisted reachability index to *raw_rows*/*commands*.
+
+    Call after the transactions behind *raw_rows*/*commands* are recorded.
+    """
+
+    tx_ids = ledger.transaction_ids()
+    index = ledger.load_reachability_index()
+    if (
+        index is None
+        or index.tx_ids != tx_ids[: len(index.tx_ids)]
+        or index.raw_count > len(raw_rows)
+        or index.command_count > len(commands)
+    ):
+        index = ReachabilityIndex()
+    index.extend(raw_rows, commands)
+    index.tx_ids = tx_ids
+    ledger.write_reachability_index(index)
+
+
+# The distribution name in pyproject.toml; the import package is ``forcen``.
+DISTRIBUTION_NAME = "forestcensus"
+
+
+def detect_code_version() -> str:
+    """Return the installed forestcensus version, or "unknown" when not installed."""
+
+    try:
+        return metadata.version(DISTRIBUTION_NAME)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def hash_config(config_dir: Path) -> Dict[str, str]:
+    """sha256 of each config TOML in *config_dir*, keyed by file name."""
+
+    return {path.name: sha256_file(path) for path in sorted(Path(config_dir).glob("*.toml"))}
+
+
+def build_fingerprint(ledger: Ledger, config_dir: Path) -> dict:
+    """Everything a build's outputs depend on; an unchanged fingerprint means
+    rebuilding would reproduce the latest version."""
+
+    return {
+        "raw_sha256": ledger.raw_fingerprint(),
+        "commands_sha256": ledger.commands_fingerprint(),
+        "config_hashes": hash_config(config_dir),
+        "code_version": detect_code_version(),
+    }
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import json
+import math
+import tempfile
+from collections import Counter
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import pyarrow.parquet as pq
 
 from ..exceptions import ForcenError
 from ..ledger.storage import Ledger
 
 
+# Target rows per hash bucket in diff_version_rows; bounds its memory use.
+DIFF_BUCKET_ROWS = 200_000
+# Spill files open at once while partitioning; buckets that are still too
+# large are partitioned again on the next slice of obs_id.
+MAX_OPEN_SPILLS = 256
+# obs_id is a 64-digit hex sha256, hashed 8 digits per partitioning level.
+_OBS_ID_LEVELS = 8
+
+
 class VersionNotFoundError(ForcenError):
     """Raised when a requested version manifest does not exist."""
 
@@ -41,6 +57,9 @@ def diff_manifests(manifest_a: Dict[str, Any], manifest_b: Dict[str, Any]) -> Di
         "tx_ids": _diff_sets(manifest_a.get("tx_ids", []), manifest_b.get("tx_ids", [])),
         "artifact_checksums": _diff_dicts(checksums_a, checksums_b),
         "artifact_sizes": _diff_dicts(sizes_a, sizes_b),
+        "partition_checksums": _diff_dicts(
+            _partition_checksums(manifest_a), _partition_checksums(manifest_b)
+        ),
         "row_counts": {
             "a": row_counts_a,
             "b": row_counts_b,
@@ -54,6 +73,181 @@ def diff_manifests(manifest_a: Dict[str, Any], manifest_b: Dict[str, Any]) -> Di
     }
 
 
+def diff_version_rows(
+    workspace: Path,
+    seq_a: int,
+    seq_b: int,
+    *,
+    bucket_rows: int = DIFF_BUCKET_ROWS,
+) -> Iterator[Dict[str, Any]]:
+    """Yield row-level differences between two versions' observations_long.
+
+    Rows are matched by obs_id.  Both snapshots are streamed in record
+    batches and spilled (under the system temp dir) into hash buckets on
+    obs_id; buckets are then compared one at a time, so memory is bounded
+    by *bucket_rows* rather than by the dataset.  Yields ``added``/``removed`` records (with the
+    row) and ``changed`` records (with the changed columns), followed by a
+    final ``summary`` record.
+    """
+
+    ledger = Ledger(workspace)
+    file_a = pq.ParquetFile(_observations_path(ledger, seq_a))
+    file_b = pq.ParquetFile(_observations_path(ledger, seq_b))
+    columns_a = set(file_a.schema_arrow.names) - {"obs_id"}
+    columns_b = set(file_b.schema_arrow.names) - {"obs_id"}
+    compared = sorted(columns_a & columns_b)
+
+    bucket_rows = max(bucket_rows, 1)
+    buckets = _bucket_count(max(file_a.metadata.num_rows, file_b.metadata.num_rows), bucket_rows)
+
+    counts: Counter = Counter()
+    changed_columns: Counter = Counter()
+    with tempfile.TemporaryDirectory(prefix="forcen-diff-") as tmp:
+        spill_a = _spill_buckets(_parquet_records(file_a), Path(tmp) / "a", buckets, 0)
+        spill_b = _spill_buckets(_parquet_records(file_b), Path(tmp) / "b", buckets, 0)
+        for record in _diff_spills(spill_a, spill_b, compared, bucket_rows, 0):
+            counts[record["type"]] += 1
+            for column in record.get("columns", []):
+                changed_columns[column] += 1
+            if record["type"] != "unchanged":
+                yield record
+
+    yield {
+        "type": "summary",
+        "seq_a": seq_a,
+        "seq_b": seq_b,
+        "added": counts["added"],
+        "removed": counts["removed"],
+        "changed": counts["changed"],
+        "unchanged": counts["unchanged"],
+        "changed_columns": dict(sorted(changed_columns.items())),
+        "columns_only_in_a": sorted(columns_a - columns_b),
+        "columns_only_in_b": sorted(columns_b - columns_a),
+    }
+
+
+def _observations_path(ledger: Ledger, seq: int) -> Path:
+    path = ledger.version_dir(seq) / ledger.observations_parquet.name
+    if not path.exists():
+        raise VersionNotFoundError(f"version {seq} has no observations_long.parquet")
+    return path
+
+
+def _bucket_count(rows: int, bucket_rows: int) -> int:
+    return min(MAX_OPEN_SPILLS, max(1, math.ceil(rows / bucket_rows)))
+
+
+def _parquet_records(parquet: pq.ParquetFile) -> Iterator[Dict[str, Any]]:
+    for batch in parquet.iter_batches():
+        yield from batch.to_pylist()
+
+
+def _spill_buckets(
+    records: Iterable[Dict[str, Any]], directory: Path, buckets: int, level: int
+) -> List[Tuple[Path, int]]:
+    """Partition *records* into *buckets* files on the *level*-th slice of obs_id.
+
+    Returns each bucket's path and row count.
+    """
+
+    directory.mkdir()
+    paths = [directory / f"{index:04d}.jsonl" for index in range(buckets)]
+    sizes = [0] * buckets
+    start = level * 8
+    with ExitStack() as stack:
+        handles = [stack.enter_context(path.open("w", encoding="utf-8")) for path in paths]
+        for record in records:
+            # obs_id is a sha256 hex digest, so every slice of it is uniform.
+            bucket = int(record["obs_id"][start : start + 8], 16) % buckets
+            handles[bucket].write(json.dumps(record, default=str) + "\n")
+            sizes[bucket] += 1
+    return list(zip(paths, sizes))
+
+
+def _diff_spills(
+    spill_a: List[Tuple[Path, int]],
+    spill_b: List[Tuple[Path, int]],
+    columns: List[str],
+    bucket_rows: int,
+    level: int,
+) -> Iterator[Dict[str, Any]]:
+    for (path_a, rows_a), (path_b, rows_b) in zip(spill_a, spill_b):
+        rows = max(rows_a, rows_b)
+        if rows <= bucket_rows or level + 1 >= _OBS_ID_LEVELS:
+            yield from _diff_bucket(path_a, path_b, columns)
+            continue
+        buckets = _bucket_count(rows, bucket_rows)
+        split_a = _spill_buckets(_read_spill(path_a), path_a.with_suffix(""), buckets, level + 1)
+        split_b = _spill_buckets(_read_spill(path_b), path_b.with_suffix(""), buckets, level + 1)
+        path_a.unlink()
+        path_b.unlink()
+        yield from _diff_spills(split_a, split_b, columns, bucket_rows, level + 1)
+
+
+def _diff_bucket(path_a: Path, path_b: Path, columns: List[str]) -> Iterator[Dict[str, Any]]:
+    rows_a: Dict[str, List[dict]] = {}
+    for record in _read_spill(path_a):
+        rows_a.setdefault(record["obs_id"], []).append(record)
+
+    pending: List[Tuple[str, Dict[str, Any]]] = []
+    for record_b in _read_spill(path_b):
+        obs_id = record_b["obs_id"]
+        matches = rows_a.get(obs_id)
+        if not matches:
+            pending.append((obs_id, {"type": "added", "obs_id": obs_id, "row": record_b}))
+            continue
+        record_a = matches.pop(0)
+        changed = [
+            column
+            for column in columns
+            if _normalize(record_a.get(column)) != _normalize(record_b.get(column))
+        ]
+        if not changed:
+            pending.append((obs_id, {"type": "unchanged", "obs_id": obs_id}))
+            continue
+        pending.append(
+            (
+                obs_id,
+                {
+                    "type": "changed",
+                    "obs_id": obs_id,
+                    "columns": changed,
+                    "a": {column: _normalize(record_a.get(column)) for column in changed},
+                    "b": {column: _normalize(record_b.get(column)) for column in changed},
+                },
+            )
+        )
+    for obs_id, remaining in rows_a.items():
+        for record_a in remaining:
+            pending.append((obs_id, {"type": "removed", "obs_id": obs_id, "row": record_a}))
+
+    pending.sort(key=lambda item: item[0])
+    for _, record in pending:
+        yield record
+
+
+def _read_spill(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            record = json.loads(line)
+            yield {key: _normalize(value) for key, value in record.items()}
+
+
+def _normalize(value: Any) -> Any:
+    # dbh_mm/health are floats in versions where the column had nulls.
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if value.is_integer():
+            return int(value)
+    return value
+
+
+def _partition_checksums(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    partitions = manifest.get("partitions", {}) or {}
+    return {key: entry.get("sha256") for key, entry in partitions.items()}
+
+
 def _diff_sets(values_a: Any, values_b: Any) -> Dict[str, Any]:
     set_a = set(values_a or [])
     set_b = set(values_b or [])
@@ -0,0 +1,138 @@
+"""Warm lint sessions and the polling loop behind ``forcen tx lint --watch``."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from ..assembly.incremental import AssemblyState, assemble_incremental
+from ..config import load_config_bundle
+from ..dsl.types import Command
+from ..ledger.storage import Ledger
+from ..transactions import NormalizationConfig
+from ..transactions.loader import (
+    MEASUREMENTS_FILENAME,
+    SURVEY_META_FILENAME,
+    UPDATES_FILENAME,
+)
+from ..transactions.models import MeasurementRow
+from .lint import LintReport, lint_against_state
+from .utils import load_assembly_state
+
+
+WATCHED_FILES = (MEASUREMENTS_FILENAME, UPDATES_FILENAME, SURVEY_META_FILENAME)
+
+Stamp = Tuple[Optional[Tuple[int, int]], ...]
+
+
+class LintSession:
+    """Config, ledger rows/commands and assembly state kept resident across lints.
+
+    The ledger is reloaded only when transactions.jsonl changes (e.g. after a
+    submit from another process); each lint then reassembles just the trees
+    the transaction touches.  Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        config_dir: Path,
+        *,
+        workspace: Optional[Path] = None,
+        normalization: Optional[NormalizationConfig] = None,
+    ) -> None:
+        self.config = load_config_bundle(Path(config_dir))
+        self.normalization = normalization
+        self._ledger = (
+            Ledger(Path(workspace), self.config.engine.ledger) if workspace is not None else None
+        )
+        self._incremental = self.config.engine.assembly.incremental
+        self._ledger_stamp: Optional[Tuple[int, int]] = None
+        self._raw_rows: List[MeasurementRow] = []
+        self._commands: List[Command] = []
+        self._assembly_state: Optional[AssemblyState] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def preload(self) -> None:
+        """Load the ledger snapshot now rather than on the first lint."""
+
+        self._refresh_ledger()
+
+    def lint(self, transaction_dir: Path) -> LintReport:
+        raw_rows, commands, assembly_state = self._refresh_ledger()
+        return lint_against_state(
+            Path(transaction_dir),
+            self.config,
+            raw_rows,
+            commands,
+            normalization=self.normalization,
+            incremental=self._incremental,
+            assembly_state=assembly_state,
+        )
+
+    def _refresh_ledger(
+        self,
+    ) -> Tuple[List[MeasurementRow], List[Command], Optional[AssemblyState]]:
+        with self._lock:
+            if self._ledger is not None:
+                stamp = _file_stamp(self._ledger.transactions_log)
+                if not self._loaded or stamp != self._ledger_stamp:
+                    self._load_ledger(self._ledger, stamp)
+            self._loaded = True
+            return self._raw_rows, self._commands, self._assembly_state
+
+    def _load_ledger(self, ledger: Ledger, stamp: Optional[Tuple[int, int]]) -> None:
+        self._raw_rows = ledger.load_raw_measurements()
+        self._commands = ledger.load_commands()
+        self._assembly_state = None
+        if self._incremental:
+            state = load_assembly_state(ledger, self.config, self._raw_rows, self._commands)
+            if state is None:
+                _, state = assemble_incremental(self._raw_rows, self._commands, self.config)
+            self._assembly_state = state
+        self._ledger_stamp = stamp
+
+
+def watch_transaction(
+    transaction_dir: Path,
+    session: LintSession,
+    on_result: Callable[[Optional[LintReport], Optional[Exception]], None],
+    *,
+    poll_interval: float = 0.25,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> None:
+    """Lint *transaction_dir* now and again whenever one of its input files changes.
+
+    *on_result* receives either the report or the exception the lint raised
+    (e.g. on a half-written file); errors do not end the loop.  Runs until *should_stop* returns True (or
+    forever, when not given).
+    """
+
+    transaction_dir = Path(transaction_dir)
+    last: Optional[Stamp] = None
+    while should_stop is None or not should_stop():
+        stamp = _transaction_stamp(transaction_dir)
+        if stamp != last:
+            last = stamp
+            try:
+                report = session.lint(transaction_dir)
+            except Exception as exc:  # reported for this change; keep watching
+                on_result(None, exc)
+            else:
+                on_result(report, None)
+            continue
+        time.sleep(poll_interval)
+
+
+def _transaction_stamp(transaction_dir: Path) -> Stamp:
+    return tuple(_file_stamp(transaction_dir / name) for name in WATCHED_FILES)
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,68 @@
+"""Content-addressed blob store backing version snapshots."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+class BlobStore:
+    """Stores files once under ``objects/<sha[:2]>/<sha256>``.
+
+    Blobs are written once and made read-only; version directories reference
+    them through hardlinks when the filesystem allows, so an artifact that is
+    byte-identical across versions costs its disk space only once.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, src: Path, digest: Optional[str] = None) -> str:
+        """Add *src* to the store (if new) and return its sha256."""
+
+        src = Path(src)
+        digest = digest or sha256_file(src)
+        blob_path = self.path_for(digest)
+        if blob_path.exists():
+            return digest
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        # A private temp name per writer: concurrent puts of the same content
+        # each publish a complete copy, and the last rename wins harmlessly.
+        fd, tmp_name = tempfile.mkstemp(dir=blob_path.parent, prefix=f"{digest}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as tmp, src.open("rb") as fh:
+                shutil.copyfileobj(fh, tmp)
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            tmp_path.replace(blob_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return digest
+
+    def materialize(self, digest: str, dest: Path) -> None:
+        """Expose blob *digest* at *dest*, hardlinking when possible."""
+
+        blob_path = self.path_for(digest)
+        dest = Path(dest)
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(blob_path, dest)
+        except OSError:
+            shutil.copyfile(blob_path, dest)
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
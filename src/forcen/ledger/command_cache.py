@@ -0,0 +1,112 @@
+"""Binary cache of deserialized DSL commands from the transaction log."""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from ..dsl.types import Command
+
+
+CACHE_FORMAT = 1
+
+
+@dataclass
+class PendingAppend:
+    """Log fingerprint captured just before a record is appended."""
+
+    digest: Any  # hashlib sha256 object covering the log prefix
+    log_size: int
+    commands: Optional[List[Command]]
+
+
+class CommandCache:
+    """Pickled command list keyed by the transaction log's size and sha256.
+
+    Validating the cache costs one streaming hash of the log, which is far
+    cheaper than JSON-decoding every record and rebuilding every TagRef,
+    TreeRef and Selector.  A cache that does not match the log is discarded
+    and rebuilt from the log on the next load.
+    """
+
+    def __init__(self, log_path: Path, cache_path: Path) -> None:
+        self.log_path = Path(log_path)
+        self.cache_path = Path(cache_path)
+
+    def load(self, parse: Callable[[], List[Command]]) -> List[Command]:
+        if not self.log_path.exists():
+            return []
+        digest, log_size = _fingerprint(self.log_path)
+        commands = self._cached_commands(log_size, digest.hexdigest())
+        if commands is not None:
+            return commands
+        commands = parse()
+        self._write(log_size, digest.hexdigest(), commands)
+        return commands
+
+    def prepare_append(self) -> PendingAppend:
+        digest, log_size = _fingerprint(self.log_path)
+        if log_size == 0:
+            commands: Optional[List[Command]] = []
+        else:
+            commands = self._cached_commands(log_size, digest.hexdigest())
+        return PendingAppend(digest=digest, log_size=log_size, commands=commands)
+
+    def commit_append(
+        self, pending: PendingAppend, line: bytes, new_commands: List[Command]
+    ) -> None:
+        """Extend the cache with the commands of the record *line* just appended."""
+
+        if pending.commands is None:
+            # The cache was already stale; the next load rebuilds it.
+            return
+        pending.digest.update(line)
+        self._write(
+            pending.log_size + len(line),
+            pending.digest.hexdigest(),
+            pending.commands + list(new_commands),
+        )
+
+    # ------------------------------------------------------------------
+    def _cached_commands(self, log_size: int, log_sha256: str) -> Optional[List[Command]]:
+        if not self.cache_path.exists():
+            return None
+        try:
+            with self.cache_path.open("rb") as fh:
+                payload = pickle.load(fh)
+        except Exception:
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != CACHE_FORMAT
+            or payload.get("log_size") != log_size
+            or payload.get("log_sha256") != log_sha256
+        ):
+            return None
+        return list(payload["commands"])
+
+    def _write(self, log_size: int, log_sha256: str, commands: List[Command]) -> None:
+        payload = {
+            "format": CACHE_FORMAT,
+            "log_size": log_size,
+            "log_sha256": log_sha256,
+            "commands": commands,
+        }
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        with tmp_path.open("wb") as fh:
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.cache_path)
+
+
+def _fingerprint(path: Path) -> tuple[Any, int]:
+    digest = hashlib.sha256()
+    size = 0
+    if path.exists():
+        with path.open("rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(chunk)
+                size += len(chunk)
+    return digest, size
@@ -0,0 +1,72 @@
+"""Write artifacts through a sink that hashes and counts bytes as they pass."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Callable, Iterator
+
+
+@dataclass(frozen=True)
+class ArtifactDigest:
+    sha256: str
+    size: int
+
+
+class HashingSink(io.RawIOBase):
+    """Binary sink that forwards writes to *raw* while updating a sha256."""
+
+    def __init__(self, raw: IO[bytes]) -> None:
+        super().__init__()
+        self._raw = raw
+        self._digest = hashlib.sha256()
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        view = memoryview(data).cast("B")
+        self._digest.update(view)
+        self._raw.write(view)
+        self._size += len(view)
+        return len(view)
+
+    def tell(self) -> int:
+        return self._size
+
+    def flush(self) -> None:
+        if not self._raw.closed:
+            self._raw.flush()
+
+    def digest(self) -> ArtifactDigest:
+        return ArtifactDigest(sha256=self._digest.hexdigest(), size=self._size)
+
+
+@contextmanager
+def hashed_binary(path: Path, on_done: Callable[[ArtifactDigest], None]) -> Iterator[IO[bytes]]:
+    """Open *path* for binary writing; report its digest once the block completes."""
+
+    with Path(path).open("wb") as raw:
+        sink = HashingSink(raw)
+        yield sink  # type: ignore[misc]
+        sink.close()
+    on_done(sink.digest())
+
+
+@contextmanager
+def hashed_text(path: Path, on_done: Callable[[ArtifactDigest], None]) -> Iterator[IO[str]]:
+    """Text variant of :func:`hashed_binary` (UTF-8, no newline translation)."""
+
+    with Path(path).open("wb") as raw:
+        sink = HashingSink(raw)
+        buffered = io.BufferedWriter(sink)
+        text = io.TextIOWrapper(buffered, encoding="utf-8", newline="")
+        yield text
+        text.flush()
+        text.detach()
+        buffered.close()
+    on_done(sink.digest())
@@ -0,0 +1,88 @@
+"""Advisory lock serializing writers of one workspace."""
+
+from __future__ import annotations
+
+import fcntl
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..exceptions import ForcenError
+
+
+LOCK_FILE = "workspace.lock"
+
+_held_guard = threading.Lock()
+_held: Dict[Tuple[str, int], Tuple[int, int]] = {}
+
+
+class WorkspaceLockedError(ForcenError):
+    """Raised when the workspace lock could not be acquired in time."""
+
+
+class WorkspaceLock:
+    """``flock`` on ``<workspace>/workspace.lock``.
+
+    The lock is re-entrant within a thread, so a queue drainer can call
+    submit_transaction while holding it; other threads and processes block.
+    ``timeout=None`` waits indefinitely.
+    """
+
+    def __init__(
+        self, workspace: Path, timeout: Optional[float] = None, poll_interval: float = 0.05
+    ) -> None:
+        self.path = Path(workspace) / LOCK_FILE
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._key = (str(self.path.resolve()), threading.get_ident())
+
+    def acquire(self) -> None:
+        with _held_guard:
+            held = _held.get(self._key)
+            if held is not None:
+                _held[self._key] = (held[0], held[1] + 1)
+                return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            self._lock_fd(fd)
+        except BaseException:
+            os.close(fd)
+            raise
+        with _held_guard:
+            _held[self._key] = (fd, 1)
+
+    def release(self) -> None:
+        with _held_guard:
+            fd, depth = _held[self._key]
+            if depth > 1:
+                _held[self._key] = (fd, depth - 1)
+                return
+            del _held[self._key]
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def _lock_fd(self, fd: int) -> None:
+        if self.timeout is None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            return
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise WorkspaceLockedError(
+                        f"workspace {self.path.parent} is locked by another process"
+                    ) from None
+                time.sleep(self.poll_interval)
+
+    def __enter__(self) -> "WorkspaceLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
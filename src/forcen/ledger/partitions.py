@@ -0,0 +1,125 @@
+"""Hive-partitioned layout for observations_long (survey_id=/site=/part.parquet)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import quote
+
+import pandas as pd
+
+from .hashing import ArtifactDigest, hashed_binary
+
+
+PARTITION_COLUMNS = ("survey_id", "site")
+PART_FILE = "part.parquet"
+STATE_FILE = "_partitions.json"
+STATE_FORMAT = 1
+
+
+def partition_key(survey_id: str, site: str) -> str:
+    """Relative path of a partition file, URI-encoding values as pyarrow expects."""
+
+    return f"survey_id={quote(str(survey_id), safe='')}/site={quote(str(site), safe='')}/{PART_FILE}"
+
+
+def split_partitions(df: pd.DataFrame) -> List[Tuple[str, pd.DataFrame]]:
+    """Split *df* by survey and site, dropping the partition columns from each part."""
+
+    if df.empty:
+        return []
+    parts: List[Tuple[str, pd.DataFrame]] = []
+    for (survey_id, site), group in df.groupby(list(PARTITION_COLUMNS), sort=True):
+        frame = group.drop(columns=list(PARTITION_COLUMNS)).reset_index(drop=True)
+        parts.append((partition_key(survey_id, site), frame))
+    return parts
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a partition's rows, computed without serializing to Parquet."""
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[c, str(t)] for c, t in df.dtypes.items()]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def read_state(dataset_dir: Path) -> Dict[str, dict]:
+    state_path = dataset_dir / STATE_FILE
+    if not state_path.exists():
+        return {}
+    try:
+        with state_path.open("r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if payload.get("format") != STATE_FORMAT:
+        return {}
+    return dict(payload.get("partitions", {}))
+
+
+def write_partitions(
+    dataset_dir: Path,
+    df: pd.DataFrame,
+    on_written: Callable[[Path, ArtifactDigest], None],
+) -> Dict[str, dict]:
+    """Bring *dataset_dir* in line with *df*, rewriting only changed partitions.
+
+    Returns the new partition state: ``{key: {rows, rows_sha256, sha256, size}}``.
+    Partitions that no longer have rows are removed.
+    """
+
+    dataset_dir.mkdir(parents=True, exist_ok=True)
+    previous = read_state(dataset_dir)
+    state: Dict[str, dict] = {}
+    for key, frame in split_partitions(df):
+        path = dataset_dir / key
+        fingerprint = frame_fingerprint(frame)
+        known = previous.get(key)
+        if (
+            known is not None
+            and known.get("rows_sha256") == fingerprint
+            and path.exists()
+            and path.stat().st_size == known.get("size")
+        ):
+            state[key] = known
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        written: List[ArtifactDigest] = []
+        with hashed_binary(tmp_path, written.append) as fh:
+            frame.to_parquet(fh, index=False)
+        tmp_path.replace(path)
+        digest = written[0]
+        on_written(path, digest)
+        state[key] = {
+            "rows": int(len(frame)),
+            "rows_sha256": fingerprint,
+            "sha256": digest.sha256,
+            "size": digest.size,
+        }
+
+    for key in previous:
+        if key not in state:
+            _remove_partition(dataset_dir, key)
+
+    tmp_state = dataset_dir / (STATE_FILE + ".tmp")
+    tmp_state.write_text(
+        json.dumps({"format": STATE_FORMAT, "partitions": state}, indent=2, sort_keys=True)
+        + "\n",
+        encoding="utf-8",
+    )
+    tmp_state.replace(dataset_dir / STATE_FILE)
+    return state
+
+
+def _remove_partition(dataset_dir: Path, key: str) -> None:
+    path = dataset_dir / key
+    path.unlink(missing_ok=True)
+    for parent in (path.parent, path.parent.parent):
+        try:
+            parent.rmdir()
+        except OSError:
+            break
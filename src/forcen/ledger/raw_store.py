@@ -0,0 +1,228 @@
+"""Readers and writers for the raw observation store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..transactions.models import MeasurementRow
+
+
+RAW_SCHEMA = pa.schema(
+    [
+        pa.field("row_number", pa.int64()),
+        pa.field("site", pa.string()),
+        pa.field("plot", pa.string()),
+        pa.field("tag", pa.string()),
+        pa.field("date", pa.date32()),
+        pa.field("dbh_mm", pa.int64()),
+        pa.field("health", pa.int64()),
+        pa.field("standing", pa.bool_()),
+        pa.field("notes", pa.string()),
+        pa.field("genus", pa.string()),
+        pa.field("species", pa.string()),
+        pa.field("code", pa.string()),
+        pa.field("origin", pa.string()),
+        pa.field("source_tx", pa.string()),
+    ]
+)
+
+RAW_COLUMNS = list(RAW_SCHEMA.names)
+
+# Text columns read verbatim from the CSV store: tags and plots such as "007"
+# must not pass through numeric type inference.
+CSV_TEXT_COLUMNS = (
+    "site", "plot", "tag", "notes", "genus", "species", "code", "origin", "source_tx"
+)
+
+# Low-cardinality columns decoded to one Python object per distinct value.
+SHARED_COLUMNS = frozenset(
+    ["site", "plot", "tag", "date", "notes", "genus", "species", "code", "origin", "source_tx"]
+)
+
+
+def rows_to_table(rows: Iterable[MeasurementRow]) -> pa.Table:
+    """Build a typed Arrow table holding the canonical raw columns of *rows*."""
+
+    columns: dict[str, list] = {name: [] for name in RAW_COLUMNS}
+    for row in rows:
+        columns["row_number"].append(row.row_number)
+        columns["site"].append(row.site)
+        columns["plot"].append(row.plot)
+        columns["tag"].append(row.tag)
+        columns["date"].append(row.date)
+        columns["dbh_mm"].append(row.dbh_mm)
+        columns["health"].append(row.health)
+        columns["standing"].append(row.standing)
+        columns["notes"].append(row.notes)
+        columns["genus"].append(row.genus)
+        columns["species"].append(row.species)
+        columns["code"].append(row.code)
+        columns["origin"].append(row.origin)
+        columns["source_tx"].append(row.source_tx)
+    return pa.Table.from_pydict(columns, schema=RAW_SCHEMA)
+
+
+def table_to_rows(table: pa.Table) -> List[MeasurementRow]:
+    """Decode a raw Arrow table into MeasurementRow objects column by column."""
+
+    table = table.select(RAW_COLUMNS).cast(RAW_SCHEMA)
+    columns = [
+        shared_values(table.column(name))
+        if name in SHARED_COLUMNS
+        else table.column(name).to_pylist()
+        for name in RAW_COLUMNS
+    ]
+    rows: List[MeasurementRow] = []
+    for (
+        row_number,
+        site,
+        plot,
+        tag,
+        when,
+        dbh_mm,
+        health,
+        standing,
+        notes,
+        genus,
+        species,
+        code,
+        origin,
+        source_tx,
+    ) in zip(*columns):
+        rows.append(
+            MeasurementRow(
+                row_number=row_number or 0,
+                site=site or "",
+                plot=plot or "",
+                tag=tag or "",
+                date=when,
+                dbh_mm=dbh_mm,
+                health=health,
+                standing=standing,
+                notes=notes or "",
+                genus=genus or None,
+                species=species or None,
+                code=code or None,
+                origin=origin or "field",
+                tree_uid=None,
+                public_tag=None,
+                source_tx=source_tx or None,
+            )
+        )
+    return rows
+
+
+def shared_values(column: pa.ChunkedArray) -> list:
+    """Like ``column.to_pylist()``, but equal values share one object.
+
+    Decodes each distinct value once via a dictionary encoding; sites,
+    plots, dates and source tx ids repeat across most of the ledger.
+    """
+
+    encoded = column.dictionary_encode().combine_chunks()
+    values = encoded.dictionary.to_pylist()
+    values.append(None)
+    indices = encoded.indices.fill_null(len(values) - 1).to_numpy()
+    return [values[index] for index in indices.tolist()]
+
+
+def read_raw_parquet(path: Path, filters: Optional[list] = None) -> List[MeasurementRow]:
+    return table_to_rows(pq.read_table(path, filters=filters))
+
+
+def write_raw_parquet(path: Path, rows: Iterable[MeasurementRow]) -> None:
+    pq.write_table(rows_to_table(rows), path)
+
+
+def read_raw_csv(path: Path) -> List[MeasurementRow]:
+    """Read the legacy CSV raw store (pre-Parquet workspaces)."""
+
+    # Only empty numeric/bool cells are missing; text such as "NA" is kept.
+    df = pd.read_csv(
+        path,
+        dtype={name: str for name in CSV_TEXT_COLUMNS},
+        keep_default_na=False,
+        na_values={name: [""] for name in ("row_number", "dbh_mm", "health", "standing")},
+    )
+    rows: List[MeasurementRow] = []
+    for record in df.to_dict(orient="records"):
+        rows.append(
+            MeasurementRow(
+                row_number=int(record.get("row_number", 0)),
+                site=str(record.get("site", "")),
+                plot=str(record.get("plot", "")),
+                tag=str(record.get("tag", "")),
+                date=pd.to_datetime(record.get("date")).date(),
+                dbh_mm=_maybe_int(record.get("dbh_mm")),
+                health=_maybe_int(record.get("health")),
+                standing=_maybe_bool(record.get("standing")),
+                notes=_maybe_str(record.get("notes")) or "",
+                genus=_maybe_str(record.get("genus")),
+                species=_maybe_str(record.get("species")),
+                code=_maybe_str(record.get("code")),
+                origin=str(record.get("origin") or "field"),
+                tree_uid=None,
+                public_tag=None,
+                source_tx=_maybe_str(record.get("source_tx")),
+            )
+        )
+    return rows
+
+
+def write_raw_csv(path: Path, rows: Iterable[MeasurementRow]) -> None:
+    records = [
+        {
+            "row_number": row.row_number,
+            "site": row.site,
+            "plot": row.plot,
+            "tag": row.tag,
+            "date": row.date.isoformat(),
+            "dbh_mm": row.dbh_mm,
+            "health": row.health,
+            "standing": row.standing,
+            "notes": row.notes,
+            "genus": row.genus,
+            "species": row.species,
+            "code": row.code,
+            "origin": row.origin,
+            "source_tx": row.source_tx,
+        }
+        for row in rows
+    ]
+    df = pd.DataFrame(records)
+    if not df.empty:
+        df["standing"] = df["standing"].astype("boolean")
+    df.to_csv(path, index=False)
+
+
+def _maybe_int(value) -> Optional[int]:
+    if value is None or pd.isna(value):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _maybe_str(value) -> Optional[str]:
+    if value is None or pd.isna(value):
+        return None
+    return str(value) or None
+
+
+def _maybe_bool(value) -> Optional[bool]:
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, bool):
+        return value
+    text = str(value).lower()
+    if text in {"true", "t", "1", "yes"}:
+        return True
+    if text in {"false", "f", "0", "no"}:
+        return False
+    return None
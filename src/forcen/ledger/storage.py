@@ -4,50 +4,89 @@ from __future__ import annotations
 
 import hashlib
 import json
-from datetime import datetime, timezone
+import pickle
+from concurrent.futures import Future
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from ..config import ConfigBundle
+from ..config import ConfigBundle, LedgerSettings
 from ..transactions.models import MeasurementRow
 from ..dsl.types import Command
 from ..dsl.serialization import deserialize_command, serialize_command
+from ..assembly.incremental import AssemblyState
+from ..assembly.reachability import INDEX_FORMAT, ReachabilityIndex
 from ..assembly.survey import SurveyCatalog
 from ..validators import ValidationIssue
+from .raw_store import (
+    read_raw_csv,
+    read_raw_parquet,
+    shared_values,
+    write_raw_csv,
+    write_raw_parquet,
+)
+from .blobs import BlobStore, sha256_file
+from .command_cache import CommandCache
+from .hashing import ArtifactDigest, hashed_binary, hashed_text
+from .partitions import read_state as read_partition_state, write_partitions
+from .tx_index import TransactionIndex
+from .writers import ArtifactWriters
 
 
 class Ledger:
     """Filesystem-backed ledger for accepted transactions."""
 
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, settings: Optional[LedgerSettings] = None) -> None:
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
+        self.settings = settings or LedgerSettings()
         self.observations_raw_csv = self.root / "observations_raw.csv"
+        self.observations_raw_parquet = self.root / "observations_raw.parquet"
+        self.raw_segments_dir = self.root / "raw_segments"
+        self.raw_segments_manifest = self.raw_segments_dir / "manifest.json"
         self.observations_csv = self.root / "observations_long.csv"
         self.observations_parquet = self.root / "observations_long.parquet"
+        self.observations_dataset = self.root / "observations_long"
         self.updates_log = self.root / "updates_log.tdl"
         self.trees_view = self.root / "trees_view.csv"
         self.retag_suggestions = self.root / "retag_suggestions.csv"
         self.validation_report = self.root / "validation_report.json"
         self.transactions_log = self.root / "transactions.jsonl"
+        self.transactions_index = self.root / "transactions.index.json"
+        self._tx_index = TransactionIndex(self.transactions_log, self.transactions_index)
+        self.commands_cache = self.root / "commands.cache"
+        self._command_cache = CommandCache(self.transactions_log, self.commands_cache)
+        self.assembly_state_path = self.root / "assembly.state"
+        self.reachability_index_path = self.root / "reachability.index"
         self.versions_dir = self.root / "versions"
         self.versions_dir.mkdir(exist_ok=True)
+        self.blobs = BlobStore(self.root / "objects")
+        self._digests: Dict[Path, ArtifactDigest] = {}
 
     # ------------------------------------------------------------------
     def has_transaction(self, tx_id: str) -> bool:
-        if not self.transactions_log.exists():
-            return False
-        with self.transactions_log.open("r", encoding="utf-8") as fh:
-            for line in fh:
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if record.get("tx_id") == tx_id:
-                    return True
-        return False
+        return self._tx_index.lookup(tx_id) is not None
+
+    def transaction_ids(self) -> List[str]:
+        return [entry["tx_id"] for entry in self._tx_index.entries()]
+
+    def transaction_summaries(self) -> List[dict]:
+        """Return tx_id, validation_summary and row_counts per accepted tx, in log order."""
+
+        return [_transaction_summary(entry) for entry in self._tx_index.entries()]
+
+    def transaction_summary(self, tx_id: str) -> Optional[dict]:
+        """The transaction_summaries() entry for *tx_id*, or None if it was never accepted."""
+
+        entry = self._tx_index.lookup(tx_id)
+        return _transaction_summary(entry) if entry is not None else None
+
+    def read_transaction(self, tx_id: str) -> Optional[dict]:
+        return self._tx_index.read_record(tx_id)
 
     def append_updates(self, tx_dir: Path) -> int:
         updates_path = tx_dir / "updates.tdl"
@@ -61,68 +100,171 @@ class Ledger:
             fh.write(text)
         return len(lines)
 
-    def load_raw_measurements(self) -> List[MeasurementRow]:
-        if not self.observations_raw_csv.exists():
+    def load_raw_measurements(
+        self, plots: Optional[Collection[Tuple[str, str]]] = None
+    ) -> List[MeasurementRow]:
+        """Load raw rows in ledger order, optionally only those in *plots* (site, plot).
+
+        The plot filter is pushed down to the Parquet reader; segments whose
+        manifest entry lists none of *plots* are not opened.
+        """
+
+        wanted = set(plots) if plots is not None else None
+        if wanted is not None and not wanted:
             return []
-        df = pd.read_csv(self.observations_raw_csv)
-        rows: List[MeasurementRow] = []
-        for record in df.to_dict(orient="records"):
-            rows.append(
-                MeasurementRow(
-                    row_number=int(record.get("row_number", 0)),
-                    site=str(record.get("site", "")),
-                    plot=str(record.get("plot", "")),
-                    tag=str(record.get("tag", "")),
-                    date=pd.to_datetime(record.get("date")).date(),
-                    dbh_mm=_maybe_int(record.get("dbh_mm")),
-                    health=_maybe_int(record.get("health")),
-                    standing=_maybe_bool(record.get("standing")),
-                    notes=str(record.get("notes", "")),
-                    genus=record.get("genus") or None,
-                    species=record.get("species") or None,
-                    code=record.get("code") or None,
-                    origin=str(record.get("origin", "field")),
-                    normalization_flags=[],
-                    raw={},
-                    tree_uid=None,
-                    public_tag=None,
-                    source_tx=record.get("source_tx") or None,
-                )
-            )
+        filters = _plot_filters(wanted) if wanted is not None else None
+        rows = self._load_raw_base(filters)
+        if wanted is not None:
+            rows = [row for row in rows if (row.site, row.plot) in wanted]
+        # A segment whose tx already appears in the base was compacted but not
+        # yet dropped from the manifest (interrupted compaction); one whose tx
+        # is not in the log was left by a submit that failed before recording
+        # it.  Skip both.
+        compacted = {row.source_tx for row in rows}
+        recorded = set(self.transaction_ids())
+        for entry in self.read_raw_segments():
+            if entry["tx_id"] in compacted or entry["tx_id"] not in recorded:
+                continue
+            listed = entry.get("plots")
+            if wanted is not None and listed is not None:
+                if not any(tuple(plot) in wanted for plot in listed):
+                    continue
+            rows.extend(read_raw_parquet(self.raw_segments_dir / entry["file"], filters))
         return rows
 
     def write_raw_measurements(self, rows: Iterable[MeasurementRow]) -> None:
-        records = [
+        """Rewrite the full raw history as a single base file and drop all segments."""
+
+        self._write_raw_base(rows)
+        self.drop_raw_segments(entry["tx_id"] for entry in self.read_raw_segments())
+
+    def append_raw_segment(self, tx_id: str, rows: List[MeasurementRow]) -> None:
+        """Store the raw rows of one accepted transaction as an immutable segment."""
+
+        if not rows:
+            return
+        entries = self.read_raw_segments()
+        if any(entry["tx_id"] == tx_id for entry in entries):
+            return
+        self.raw_segments_dir.mkdir(exist_ok=True)
+        filename = f"{tx_id}.parquet"
+        segment_path = self.raw_segments_dir / filename
+        tmp_path = segment_path.with_name(filename + ".tmp")
+        write_raw_parquet(tmp_path, rows)
+        tmp_path.replace(segment_path)
+        plots = sorted({(row.site, row.plot) for row in rows})
+        entries.append(
             {
-                "row_number": row.row_number,
-                "site": row.site,
-                "plot": row.plot,
-                "tag": row.tag,
-                "date": row.date.isoformat(),
-                "dbh_mm": row.dbh_mm,
-                "health": row.health,
-                "standing": row.standing,
-                "notes": row.notes,
-                "genus": row.genus,
-                "species": row.species,
-                "code": row.code,
-                "origin": row.origin,
-                "source_tx": row.source_tx,
+                "tx_id": tx_id,
+                "file": filename,
+                "rows": len(rows),
+                "plots": [list(plot) for plot in plots],
             }
-            for row in rows
-        ]
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["standing"] = df["standing"].astype("boolean")
-        df.to_csv(self.observations_raw_csv, index=False)
+        )
+        _write_json_atomic(self.raw_segments_manifest, {"segments": entries})
+
+    def read_raw_segments(self) -> List[dict]:
+        if not self.raw_segments_manifest.exists():
+            return []
+        with self.raw_segments_manifest.open("r", encoding="utf-8") as fh:
+            return list(json.load(fh).get("segments", []))
+
+    def drop_raw_segments(self, tx_ids: Iterable[str]) -> None:
+        dropped = set(tx_ids)
+        if not dropped:
+            return
+        entries = self.read_raw_segments()
+        remaining = [entry for entry in entries if entry["tx_id"] not in dropped]
+        _write_json_atomic(self.raw_segments_manifest, {"segments": remaining})
+        for entry in entries:
+            if entry["tx_id"] in dropped:
+                (self.raw_segments_dir / entry["file"]).unlink(missing_ok=True)
+
+    def compact_raw_segments(self) -> int:
+        """Merge all segments into the base raw file; return the number merged."""
+
+        entries = self.read_raw_segments()
+        if not entries:
+            return 0
+        self._write_raw_base(self.load_raw_measurements())
+        self.drop_raw_segments(entry["tx_id"] for entry in entries)
+        return len(entries)
+
+    def _write_raw_base(self, rows: Iterable[MeasurementRow]) -> None:
+        if self.settings.raw_format == "parquet":
+            target, stale, writer = (
+                self.observations_raw_parquet,
+                self.observations_raw_csv,
+                write_raw_parquet,
+            )
+        else:
+            target, stale, writer = (
+                self.observations_raw_csv,
+                self.observations_raw_parquet,
+                write_raw_csv,
+            )
+        tmp_path = target.with_name(target.name + ".tmp")
+        writer(tmp_path, rows)
+        tmp_path.replace(target)
+        # Workspaces switching raw_format migrate on their first write.
+        stale.unlink(missing_ok=True)
+
+    def raw_fingerprint(self) -> str:
+        """Hash the raw ledger's logical contents: accepted tx_ids and their row counts.
+
+        Independent of the physical layout, so ``ledger compact`` (or a
+        raw_format switch) leaves it unchanged.
+        """
+
+        counts = self.raw_row_counts()
+        payload = [[tx_id, counts.get(tx_id, 0)] for tx_id in self.transaction_ids()]
+        return hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+
+    def raw_row_counts(self) -> Dict[str, int]:
+        """Raw rows per source tx, counted the way load_raw_measurements reads them."""
+
+        counts: Dict[str, int] = {}
+        if self.observations_raw_parquet.exists():
+            column = pq.read_table(self.observations_raw_parquet, columns=["source_tx"])
+            base = column.column("source_tx").to_pylist()
+        elif self.observations_raw_csv.exists():
+            frame = pd.read_csv(
+                self.observations_raw_csv, usecols=["source_tx"], dtype=str, keep_default_na=False
+            )
+            base = frame["source_tx"].tolist()
+        else:
+            base = []
+        for tx_id in base:
+            counts[tx_id or ""] = counts.get(tx_id or "", 0) + 1
+        for entry in self.read_raw_segments():
+            if entry["tx_id"] not in counts:
+                counts[entry["tx_id"]] = int(entry["rows"])
+        return counts
+
+    def commands_fingerprint(self) -> str:
+        """Hash transactions.jsonl, the source of the cumulative command list."""
+
+        if not self.transactions_log.exists():
+            return hashlib.sha256(b"").hexdigest()
+        return sha256_file(self.transactions_log)
+
+    def _load_raw_base(self, filters: Optional[list] = None) -> List[MeasurementRow]:
+        if self.observations_raw_parquet.exists():
+            return read_raw_parquet(self.observations_raw_parquet, filters)
+        if self.observations_raw_csv.exists():
+            return read_raw_csv(self.observations_raw_csv)
+        return []
 
     def write_observations(
-        self, config: ConfigBundle, measurements: List[MeasurementRow]
+        self,
+        config: ConfigBundle,
+        measurements: List[MeasurementRow],
+        writers: Optional[ArtifactWriters] = None,
     ) -> Dict[str, int]:
         catalog = SurveyCatalog.from_config(config)
         records = []
         for row in measurements:
-            survey_id = catalog.survey_for_date(row.date)
+            survey_id = catalog.survey_of(row)
             if survey_id is None:
                 continue
             obs_id = _observation_id(row)
@@ -141,6 +283,7 @@ class Ledger:
                     "notes": row.notes,
                     "origin": row.origin,
                     "source_tx": row.source_tx,
+                    "row_number": row.row_number,
                     "tree_uid": row.tree_uid,
                     "genus": row.genus,
                     "species": row.species,
@@ -170,8 +313,10 @@ class Ledger:
             ]:
                 df[column] = df[column].astype("string")
 
-        df.to_csv(self.observations_csv, index=False)
-        df.to_parquet(self.observations_parquet, index=False)
+        _run(writers, self._write_csv_artifact, self.observations_csv, df)
+        _run(writers, self._write_parquet_artifact, self.observations_parquet, df)
+        if self.settings.partitioned_observations:
+            _run(writers, self._write_observation_partitions, df)
 
         by_origin = (
             df["origin"].value_counts().sort_index().to_dict() if not df.empty else {}
@@ -202,8 +347,16 @@ class Ledger:
             "validation_summary": _summarize_issues(list(issues)),
             "commands": [serialize_command(cmd) for cmd in commands],
         }
-        with self.transactions_log.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(record, sort_keys=True) + "\n")
+        line = (json.dumps(record, sort_keys=True) + "\n").encode("utf-8")
+        self._tx_index.entries()
+        pending = self._command_cache.prepare_append()
+        offset = _file_size(self.transactions_log)
+        with self.transactions_log.open("ab") as fh:
+            fh.write(line)
+        self._tx_index.record_append(offset, len(line), record)
+        self._command_cache.commit_append(
+            pending, line, _deserialize_commands(record["commands"])
+        )
 
     def read_transactions(self) -> List[dict]:
         if not self.transactions_log.exists():
@@ -221,13 +374,52 @@ class Ledger:
         return records
 
     def load_commands(self) -> List[Command]:
+        return self._command_cache.load(self._parse_commands)
+
+    def load_assembly_state(self) -> Optional[AssemblyState]:
+        """Return the persisted incremental assembly state, or None if absent/unreadable."""
+
+        if not self.assembly_state_path.exists():
+            return None
+        try:
+            with self.assembly_state_path.open("rb") as fh:
+                state = pickle.load(fh)
+        except Exception:
+            return None
+        return state if isinstance(state, AssemblyState) else None
+
+    def write_assembly_state(self, state: AssemblyState) -> None:
+        tmp_path = self.assembly_state_path.with_name(self.assembly_state_path.name + ".tmp")
+        with tmp_path.open("wb") as fh:
+            pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.assembly_state_path)
+
+    def load_reachability_index(self) -> Optional[ReachabilityIndex]:
+        """Return the persisted plot reachability index, or None if absent/unreadable."""
+
+        if not self.reachability_index_path.exists():
+            return None
+        try:
+            with self.reachability_index_path.open("rb") as fh:
+                index = pickle.load(fh)
+        except Exception:
+            return None
+        if not isinstance(index, ReachabilityIndex) or index.format != INDEX_FORMAT:
+            return None
+        return index
+
+    def write_reachability_index(self, index: ReachabilityIndex) -> None:
+        tmp_path = self.reachability_index_path.with_name(
+            self.reachability_index_path.name + ".tmp"
+        )
+        with tmp_path.open("wb") as fh:
+            pickle.dump(index, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.reachability_index_path)
+
+    def _parse_commands(self) -> List[Command]:
         commands: List[Command] = []
         for record in self.read_transactions():
-            for data in record.get("commands", []):
-                try:
-                    commands.append(deserialize_command(data))
-                except Exception:
-                    continue
+            commands.extend(_deserialize_commands(record.get("commands", [])))
         return commands
 
     def list_versions(self) -> List[int]:
@@ -238,9 +430,12 @@ class Ledger:
         ]
         return sorted(versions)
 
-    def write_tree_outputs(self, tree_rows: List[dict], retag_rows: List[dict]) -> None:
-        import pandas as pd
-
+    def write_tree_outputs(
+        self,
+        tree_rows: List[dict],
+        retag_rows: List[dict],
+        writers: Optional[ArtifactWriters] = None,
+    ) -> None:
         tree_columns = [
             "tree_uid",
             "survey_id",
@@ -266,15 +461,24 @@ class Ledger:
             "suggested_alias_line",
         ]
 
-        pd.DataFrame(tree_rows, columns=tree_columns).to_csv(
-            self.trees_view, index=False
+        _run(
+            writers,
+            self._write_csv_artifact,
+            self.trees_view,
+            pd.DataFrame(tree_rows, columns=tree_columns),
         )
-        pd.DataFrame(retag_rows, columns=retag_columns).to_csv(
-            self.retag_suggestions, index=False
+        _run(
+            writers,
+            self._write_csv_artifact,
+            self.retag_suggestions,
+            pd.DataFrame(retag_rows, columns=retag_columns),
         )
 
-    def write_validation_report(self, payload: dict) -> None:
-        self.validation_report.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    def write_validation_report(
+        self, payload: dict, writers: Optional[ArtifactWriters] = None
+    ) -> None:
+        text = json.dumps(payload, indent=2) + "\n"
+        _run(writers, self._write_text_artifact, self.validation_report, text)
 
     def write_version(
         self,
@@ -284,29 +488,72 @@ class Ledger:
         input_hashes: Dict[str, str],
         code_version: str,
         row_counts: Dict[str, int],
+        writers: Optional[ArtifactWriters] = None,
+        build_fingerprint: Optional[dict] = None,
     ) -> int:
+        """Snapshot the current artifacts as a new version.
+
+        With *writers*, artifacts are added to the blob store concurrently;
+        any writes already queued on *writers* are awaited first.
+        *build_fingerprint* is recorded in the manifest so a later build of
+        the same inputs can be skipped.
+        """
+
+        if writers is not None:
+            writers.wait()
         seq = self._next_version_seq()
-        version_dir = self.versions_dir / f"{seq:04d}"
+        version_dir = self.version_dir(seq)
         version_dir.mkdir(parents=True, exist_ok=True)
 
-        observations_dest = version_dir / "observations_long.csv"
-        parquet_dest = version_dir / "observations_long.parquet"
-        trees_dest = version_dir / "trees_view.csv"
-        retag_dest = version_dir / "retag_suggestions.csv"
-        updates_dest = version_dir / "updates_log.tdl"
-        validation_dest = version_dir / "validation_report.json"
         manifest_path = version_dir / "manifest.json"
 
-        _copy_file(self.observations_csv, observations_dest)
-        _copy_file(self.observations_parquet, parquet_dest)
-        if self.trees_view.exists():
-            _copy_file(self.trees_view, trees_dest)
-        if self.retag_suggestions.exists():
-            _copy_file(self.retag_suggestions, retag_dest)
-        if self.updates_log.exists():
-            _copy_file(self.updates_log, updates_dest)
-        if self.validation_report.exists():
-            _copy_file(self.validation_report, validation_dest)
+        artifacts = [
+            ("observations_long.csv", self.observations_csv, True),
+            ("observations_long.parquet", self.observations_parquet, True),
+            ("trees_view.csv", self.trees_view, False),
+            ("retag_suggestions.csv", self.retag_suggestions, False),
+            ("updates_log.tdl", self.updates_log, False),
+            ("validation_report.json", self.validation_report, False),
+        ]
+        snapshots = [
+            (name, _run(writers, self._snapshot_artifact, source, version_dir / name))
+            for name, source, required in artifacts
+            if required or source.exists()
+        ]
+        partitions = (
+            read_partition_state(self.observations_dataset)
+            if self.settings.partitioned_observations
+            else {}
+        )
+        partition_snapshots = []
+        for key, entry in sorted(partitions.items()):
+            source = self.observations_dataset / key
+            self._digests.setdefault(source, ArtifactDigest(entry["sha256"], entry["size"]))
+            dest = version_dir / self.observations_dataset.name / key
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            partition_snapshots.append(
+                (key, _run(writers, self._snapshot_artifact, source, dest))
+            )
+        if writers is not None:
+            writers.wait()
+
+        checksums: Dict[str, str] = {}
+        sizes: Dict[str, int] = {}
+        blobs: Dict[str, str] = {}
+        for name, outcome in snapshots:
+            digest, size = outcome.result() if isinstance(outcome, Future) else outcome
+            checksums[name] = digest
+            sizes[name] = size
+            blobs[name] = self.blobs.path_for(digest).relative_to(self.root).as_posix()
+        partition_entries: Dict[str, dict] = {}
+        for key, outcome in partition_snapshots:
+            digest, size = outcome.result() if isinstance(outcome, Future) else outcome
+            partition_entries[key] = {
+                "sha256": digest,
+                "size": size,
+                "rows": partitions[key]["rows"],
+                "blob": self.blobs.path_for(digest).relative_to(self.root).as_posix(),
+            }
 
         manifest = {
             "version_seq": seq,
@@ -317,59 +564,54 @@ class Ledger:
             "input_checksums": input_hashes,
             "validation_summary": validation_summary,
             "row_counts": row_counts,
-            "artifact_checksums": {
-                "observations_long.csv": _sha256_file(observations_dest),
-                "observations_long.parquet": _sha256_file(parquet_dest),
-                **(
-                    {"trees_view.csv": _sha256_file(trees_dest)}
-                    if trees_dest.exists()
-                    else {}
-                ),
-                **(
-                    {"retag_suggestions.csv": _sha256_file(retag_dest)}
-                    if retag_dest.exists()
-                    else {}
-                ),
-                **(
-                    {"updates_log.tdl": _sha256_file(updates_dest)}
-                    if updates_dest.exists()
-                    else {}
-                ),
-                **(
-                    {"validation_report.json": _sha256_file(validation_dest)}
-                    if validation_dest.exists()
-                    else {}
-                ),
-            },
-            "artifact_sizes": {
-                "observations_long.csv": _file_size(observations_dest),
-                "observations_long.parquet": _file_size(parquet_dest),
-                **(
-                    {"trees_view.csv": _file_size(trees_dest)}
-                    if trees_dest.exists()
-                    else {}
-                ),
-                **(
-                    {"retag_suggestions.csv": _file_size(retag_dest)}
-                    if retag_dest.exists()
-                    else {}
-                ),
-                **(
-                    {"updates_log.tdl": _file_size(updates_dest)}
-                    if updates_dest.exists()
-                    else {}
-                ),
-                **(
-                    {"validation_report.json": _file_size(validation_dest)}
-                    if validation_dest.exists()
-                    else {}
-                ),
-            },
+            "artifact_checksums": checksums,
+            "artifact_sizes": sizes,
+            "artifact_blobs": blobs,
         }
+        if self.settings.partitioned_observations:
+            manifest["partitions"] = partition_entries
+        if build_fingerprint is not None:
+            manifest["build_fingerprint"] = build_fingerprint
         manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
         return seq
 
     # ------------------------------------------------------------------
+    def _write_csv_artifact(self, path: Path, df: pd.DataFrame) -> None:
+        with hashed_text(path, self._digest_recorder(path)) as fh:
+            df.to_csv(fh, index=False)
+
+    def _write_parquet_artifact(self, path: Path, df: pd.DataFrame) -> None:
+        with hashed_binary(path, self._digest_recorder(path)) as fh:
+            df.to_parquet(fh, index=False)
+
+    def _write_text_artifact(self, path: Path, text: str) -> None:
+        with hashed_text(path, self._digest_recorder(path)) as fh:
+            fh.write(text)
+
+    def _write_observation_partitions(self, df: pd.DataFrame) -> None:
+        write_partitions(self.observations_dataset, df, self._record_digest)
+
+    def _snapshot_artifact(self, source: Path, dest: Path) -> Tuple[str, int]:
+        known = self._digests.get(source)
+        if known is not None and _file_size(source) == known.size:
+            digest, size = self.blobs.put(source, known.sha256), known.size
+        else:
+            # Artifacts appended to (updates_log.tdl) or written by an
+            # earlier process are hashed from disk.
+            digest = self.blobs.put(source)
+            size = _file_size(self.blobs.path_for(digest))
+        self.blobs.materialize(digest, dest)
+        return digest, size
+
+    def _digest_recorder(self, path: Path):
+        def record(digest: ArtifactDigest) -> None:
+            self._record_digest(path, digest)
+
+        return record
+
+    def _record_digest(self, path: Path, digest: ArtifactDigest) -> None:
+        self._digests[path] = digest
+
     def _next_version_seq(self) -> int:
         existing = [
             int(path.name)
@@ -378,11 +620,40 @@ class Ledger:
         ]
         return (max(existing) + 1) if existing else 1
 
+    def latest_manifest(self) -> Optional[Dict[str, object]]:
+        versions = self.list_versions()
+        return self.read_manifest(versions[-1]) if versions else None
+
+    def version_dir(self, seq: int) -> Path:
+        return self.versions_dir / f"{seq:04d}"
+
+    def read_version_observations(
+        self, seq: int, *, site: Optional[str] = None, plot: Optional[str] = None
+    ) -> Optional[List[MeasurementRow]]:
+        """Read version *seq*'s observations_long.parquet rows for *site*/*plot*.
+
+        The filter is pushed down to the Parquet reader, so only matching row
+        groups are decoded.  Returns None when the snapshot is missing or was
+        written before observations_long carried row_number.
+        """
+
+        path = self.version_dir(seq) / self.observations_parquet.name
+        if not path.exists():
+            return None
+        if "row_number" not in pq.read_schema(path).names:
+            return None
+        filters = [
+            (name, "=", value)
+            for name, value in (("site", site), ("plot", plot))
+            if value is not None
+        ]
+        table = pq.read_table(path, columns=OBSERVATION_COLUMNS, filters=filters or None)
+        return _observation_rows(table)
+
     def read_manifest(self, seq: int) -> Dict[str, object]:
         """Load manifest for the given *seq* or raise FileNotFoundError."""
 
-        version_dir = self.versions_dir / f"{seq:04d}"
-        manifest_path = version_dir / "manifest.json"
+        manifest_path = self.version_dir(seq) / "manifest.json"
         if not manifest_path.exists():
             raise FileNotFoundError(f"manifest not found for version {seq}")
         try:
@@ -392,16 +663,33 @@ class Ledger:
             raise ValueError(f"manifest for version {seq} is invalid JSON") from exc
 
 
-def _copy_file(src: Path, dest: Path) -> None:
-    dest.write_bytes(src.read_bytes())
+def _write_json_atomic(path: Path, payload: dict) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _transaction_summary(entry: dict) -> dict:
+    return {
+        "tx_id": entry["tx_id"],
+        "validation_summary": entry.get("validation_summary", {}),
+        "row_counts": entry.get("row_counts", {}),
+    }
+
+
+def _plot_filters(plots: Collection[Tuple[str, str]]) -> list:
+    # Disjunctive normal form: any of the (site, plot) pairs.
+    return [[("site", "=", site), ("plot", "=", plot)] for site, plot in sorted(plots)]
 
 
-def _sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+def _deserialize_commands(payloads: Iterable[dict]) -> List[Command]:
+    commands: List[Command] = []
+    for data in payloads:
+        try:
+            commands.append(deserialize_command(data))
+        except Exception:
+            continue
+    return commands
 
 
 def _summarize_issues(issues: List[ValidationIssue]) -> dict:
@@ -411,6 +699,84 @@ def _summarize_issues(issues: List[ValidationIssue]) -> dict:
     }
 
 
+OBSERVATION_COLUMNS = [
+    "row_number",
+    "site",
+    "plot",
+    "tag",
+    "date",
+    "dbh_mm",
+    "health",
+    "standing",
+    "notes",
+    "genus",
+    "species",
+    "code",
+    "origin",
+    "tree_uid",
+    "public_tag",
+    "source_tx",
+    "survey_id",
+]
+
+
+def _observation_rows(table: pa.Table) -> List[MeasurementRow]:
+    # dbh_mm/health are stored as doubles when a column has nulls.
+    for name in ("row_number", "dbh_mm", "health"):
+        index = table.schema.get_field_index(name)
+        table = table.set_column(index, name, table.column(name).cast(pa.int64()))
+    rows: List[MeasurementRow] = []
+    columns = [
+        table.column(name).to_pylist()
+        if name in ("row_number", "dbh_mm", "health", "standing")
+        else shared_values(table.column(name))
+        for name in OBSERVATION_COLUMNS
+    ]
+    date_texts = set(columns[OBSERVATION_COLUMNS.index("date")])
+    dates = {text: date.fromisoformat(text) for text in date_texts}
+    for (
+        row_number,
+        site,
+        plot,
+        tag,
+        when,
+        dbh_mm,
+        health,
+        standing,
+        notes,
+        genus,
+        species,
+        code,
+        origin,
+        tree_uid,
+        public_tag,
+        source_tx,
+        survey_id,
+    ) in zip(*columns):
+        rows.append(
+            MeasurementRow(
+                row_number=row_number,
+                site=site,
+                plot=plot,
+                tag=tag,
+                date=dates[when],
+                dbh_mm=dbh_mm,
+                health=health,
+                standing=standing,
+                notes=notes or "",
+                genus=genus,
+                species=species,
+                code=code,
+                origin=origin,
+                tree_uid=tree_uid,
+                public_tag=public_tag,
+                source_tx=source_tx,
+                survey_id=survey_id,
+            )
+        )
+    return rows
+
+
 def _observation_id(row: MeasurementRow) -> str:
     seed = "|".join(
         [
@@ -425,27 +791,13 @@ def _observation_id(row: MeasurementRow) -> str:
     return hashlib.sha256(seed.encode("utf-8")).hexdigest()
 
 
-def _maybe_int(value) -> Optional[int]:
-    if value is None or pd.isna(value):
-        return None
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
-
+def _file_size(path: Path) -> int:
+    return path.stat().st_size if path.exists() else 0
 
-def _maybe_bool(value) -> Optional[bool]:
-    if value is None or pd.isna(value):
-        return None
-    if isinstance(value, bool):
-        return value
-    text = str(value).lower()
-    if text in {"true", "t", "1", "yes"}:
-        return True
-    if text in {"false", "f", "0", "no"}:
-        return False
-    return None
 
+def _run(writers: Optional[ArtifactWriters], fn, *args):
+    """Queue *fn* on *writers*, or call it now when no pool is given."""
 
-def _file_size(path: Path) -> int:
-    return path.stat().st_size if path.exists() else 0
+    if writers is None:
+        return fn(*args)
+    return writers.submit(fn, *args)
@@ -0,0 +1,137 @@
+"""Sidecar index over transactions.jsonl."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+SUMMARY_FIELDS = ("validation_summary", "row_counts")
+
+
+class TransactionIndex:
+    """Maps tx_id to the byte span of its record in the transaction log.
+
+    Each entry also carries the small summary fields that build/report
+    aggregation needs, so those callers never parse the full log.  The index
+    remembers the log size and mtime it describes; if the log has changed
+    behind its back, or the index file is absent or unreadable, the index is
+    rebuilt with a single pass over the log.
+    """
+
+    def __init__(self, log_path: Path, index_path: Path) -> None:
+        self.log_path = Path(log_path)
+        self.index_path = Path(index_path)
+        self._entries: Optional[List[dict]] = None
+        self._by_id: Dict[str, dict] = {}
+        self._log_stamp: Tuple[int, int] = (-1, -1)
+
+    def entries(self) -> List[dict]:
+        log_stamp = _file_stamp(self.log_path)
+        if self._entries is None or self._log_stamp != log_stamp:
+            self._load(log_stamp)
+        assert self._entries is not None
+        return self._entries
+
+    def lookup(self, tx_id: str) -> Optional[dict]:
+        self.entries()
+        return self._by_id.get(tx_id)
+
+    def read_record(self, tx_id: str) -> Optional[dict]:
+        entry = self.lookup(tx_id)
+        if entry is None:
+            return None
+        with self.log_path.open("rb") as fh:
+            fh.seek(entry["offset"])
+            return json.loads(fh.read(entry["length"]))
+
+    def record_append(self, offset: int, length: int, record: dict) -> None:
+        """Register a record just appended at *offset* and persist the index.
+
+        Callers must have consulted the index (e.g. via entries()) before
+        appending so that its in-memory state describes the log prefix.
+        """
+
+        log_stamp = _file_stamp(self.log_path)
+        if (
+            self._entries is None
+            or self._log_stamp[0] != offset
+            or log_stamp[0] != offset + length
+        ):
+            # The log changed underneath us; fall back to a rebuild.
+            self._load(log_stamp, force_rebuild=True)
+            return
+        self._set(self._entries + [_entry_for(record, offset, length)], log_stamp)
+        self._write()
+
+    # ------------------------------------------------------------------
+    def _load(self, log_stamp: Tuple[int, int], force_rebuild: bool = False) -> None:
+        if not force_rebuild:
+            stored = self._read_stored()
+            if stored is not None and (
+                stored.get("log_size"),
+                stored.get("log_mtime_ns"),
+            ) == log_stamp:
+                self._set(list(stored.get("entries", [])), log_stamp)
+                return
+        self._set(_scan_log(self.log_path), log_stamp)
+        if log_stamp[0] > 0:
+            self._write()
+
+    def _set(self, entries: List[dict], log_stamp: Tuple[int, int]) -> None:
+        self._entries = entries
+        self._by_id = {entry["tx_id"]: entry for entry in entries}
+        self._log_stamp = log_stamp
+
+    def _read_stored(self) -> Optional[dict]:
+        if not self.index_path.exists():
+            return None
+        try:
+            with self.index_path.open("r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write(self) -> None:
+        log_size, log_mtime_ns = self._log_stamp
+        payload = {"log_size": log_size, "log_mtime_ns": log_mtime_ns, "entries": self._entries}
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+        tmp_path.replace(self.index_path)
+
+
+def _scan_log(log_path: Path) -> List[dict]:
+    entries: List[dict] = []
+    if not log_path.exists():
+        return entries
+    offset = 0
+    with log_path.open("rb") as fh:
+        for line in fh:
+            length = len(line)
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                if isinstance(record, dict) and "tx_id" in record:
+                    entries.append(_entry_for(record, offset, length))
+            offset += length
+    return entries
+
+
+def _entry_for(record: dict, offset: int, length: int) -> dict:
+    entry = {"tx_id": record["tx_id"], "offset": offset, "length": length}
+    for field in SUMMARY_FIELDS:
+        entry[field] = record.get(field, {})
+    return entry
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    """(size, mtime_ns) of *path*; a rewrite that keeps the size still changes the mtime."""
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_size, stat.st_mtime_ns)
@@ -0,0 +1,69 @@
+"""Bounded thread pool for independent artifact writes."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+
+class ArtifactWriters:
+    """Runs artifact writers on up to *jobs* threads.
+
+    Each writer owns its output file, so tasks share no mutable state and
+    the bytes written do not depend on scheduling.  ``jobs == 1`` runs every
+    task inline.  ``wait`` blocks until all submitted tasks finish and then
+    re-raises the first failure in submission order.
+    """
+
+    def __init__(self, jobs: int = 1) -> None:
+        if jobs < 1:
+            raise ValueError("jobs must be >= 1")
+        self.jobs = jobs
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="forcen-writer")
+            if jobs > 1
+            else None
+        )
+        self._pending: List[Future] = []
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        if self._executor is None:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:  # surfaced by wait()
+                future.set_exception(exc)
+        else:
+            future = self._executor.submit(fn, *args, **kwargs)
+        self._pending.append(future)
+        return future
+
+    def wait(self) -> None:
+        pending, self._pending = self._pending, []
+        first_error: Optional[BaseException] = None
+        for future in pending:
+            exc = future.exception()
+            if exc is not None and first_error is None:
+                first_error = exc
+        if first_error is not None:
+            raise first_error
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "ArtifactWriters":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.wait()
+            else:
+                # Let in-flight writers settle before the original error propagates.
+                for future in self._pending:
+                    future.exception()
+                self._pending = []
+        finally:
+            self.close()
@@ -2,15 +2,45 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from ..dsl import Command
 
 
-@dataclass
+class _EmptyMapping(Mapping[str, str]):
+    """Immutable empty mapping that pickles as a reference to NO_RAW."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> str:
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __hash__(self) -> int:
+        return hash(())
+
+    def __repr__(self) -> str:
+        return "{}"
+
+    def __reduce__(self) -> str:
+        return "NO_RAW"
+
+
+# Shared by every row without flags or raw CSV values (all ledger and
+# assembled rows); neither container is ever mutated after construction.
+NO_FLAGS: Tuple[str, ...] = ()
+NO_RAW: Mapping[str, str] = _EmptyMapping()
+
+
+@dataclass(slots=True)
 class MeasurementRow:
     row_number: int
     site: str
@@ -25,11 +55,13 @@ class MeasurementRow:
     species: Optional[str] = None
     code: Optional[str] = None
     origin: str = "field"
-    normalization_flags: List[str] = field(default_factory=list)
-    raw: Dict[str, str] = field(default_factory=dict)
+    normalization_flags: Sequence[str] = NO_FLAGS
+    raw: Mapping[str, str] = NO_RAW
     tree_uid: Optional[str] = None
     public_tag: Optional[str] = None
     source_tx: Optional[str] = None
+    # Set by assembly (None for raw rows and rows outside every survey).
+    survey_id: Optional[str] = None
 
 
 @dataclass
@@ -93,7 +93,7 @@ def _build_tree_history(
         tree_uid = row.tree_uid
         if tree_uid is None:
             continue
-        survey_id = catalog.survey_for_date(row.date)
+        survey_id = catalog.survey_of(row)
         if survey_id is None:
             continue
         if row.origin == "implied":
@@ -0,0 +1,143 @@
+"""Shared fixtures for the assembly equivalence suites."""
+
+from __future__ import annotations
+
+import random
+import shutil
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from forcen.assembly.treebuilder import tree_uid_for_tag
+from forcen.config import load_config_bundle
+from forcen.dsl.types import (
+    AliasCommand,
+    Command,
+    Selector,
+    SelectorDateFilter,
+    SelectorStrategy,
+    SplitCommand,
+    TagRef,
+    TreeRef,
+    UpdateCommand,
+)
+from forcen.transactions.models import MeasurementRow
+
+
+CONFIG_DIR = Path("planning/fixtures/configs")
+SURVEY_STARTS = [date(2017, 6, 15), date(2018, 6, 15), date(2019, 6, 15), date(2020, 6, 15)]
+
+
+@pytest.fixture(scope="module")
+def survey_config(tmp_path_factory):
+    config_dir = tmp_path_factory.mktemp("config")
+    shutil.copytree(CONFIG_DIR, config_dir, dirs_exist_ok=True)
+    (config_dir / "surveys.toml").write_text(
+        "surveys = [\n"
+        + ",\n".join(
+            f'{{ id = "S{start.year}", start = "{start}", end = "{start + timedelta(days=6)}" }}'
+            for start in SURVEY_STARTS
+        )
+        + "\n]\n"
+    )
+    return load_config_bundle(config_dir)
+
+
+def _random_tag(rng: random.Random) -> TagRef:
+    return TagRef(rng.choice("AB"), rng.choice(["P1", "P2"]), str(rng.randint(1, 5)))
+
+
+def _random_ref(rng: random.Random) -> TreeRef:
+    tag = _random_tag(rng)
+    if rng.random() < 0.3:
+        return TreeRef.from_tree_uid(tree_uid_for_tag(tag.key()))
+    return TreeRef.from_tag(tag.with_date(rng.choice(SURVEY_STARTS)) if rng.random() < 0.2 else tag)
+
+
+def _random_selector(rng: random.Random, when: date) -> Selector:
+    strategy = rng.choice(list(SelectorStrategy))
+    date_filter = rng.choice(
+        [
+            None,
+            SelectorDateFilter("before", when),
+            SelectorDateFilter("after", SURVEY_STARTS[0]),
+            SelectorDateFilter("between", SURVEY_STARTS[0], SURVEY_STARTS[2]),
+        ]
+    )
+    ranks = tuple(rng.sample([1, 2, 3], rng.randint(1, 2))) if strategy is SelectorStrategy.RANKS else ()
+    return Selector(strategy=strategy, ranks=ranks, date_filter=date_filter)
+
+
+def _random_history(seed: int) -> Tuple[List[MeasurementRow], List[Command]]:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(rng.randint(0, 90)):
+        tag = _random_tag(rng)
+        start = rng.choice(SURVEY_STARTS)
+        # A few rows fall between surveys and never join a tree's survey history.
+        offset = rng.randint(0, 2) if rng.random() < 0.9 else 30
+        rows.append(
+            MeasurementRow(
+                row_number=rng.randint(1, 4),
+                site=tag.site,
+                plot=tag.plot,
+                tag=tag.tag,
+                date=start + timedelta(days=offset),
+                dbh_mm=rng.choice([None, rng.randint(50, 300), 120]),
+                health=rng.choice([None, rng.randint(0, 10)]),
+                standing=True,
+                notes="",
+                genus=rng.choice([None, "Acer"]),
+                normalization_flags=["rounded"] if rng.random() < 0.1 else [],
+                source_tx=f"tx{rng.randint(1, 5)}",
+            )
+        )
+    commands: List[Command] = []
+    for line_no in range(rng.randint(0, 14)):
+        when = rng.choice(SURVEY_STARTS[1:])
+        kind = rng.random()
+        if kind < 0.35:
+            commands.append(
+                AliasCommand(
+                    line_no=line_no,
+                    target=_random_tag(rng),
+                    tree_ref=_random_ref(rng),
+                    primary=rng.random() < 0.5,
+                    effective_date=when,
+                )
+            )
+        elif kind < 0.7:
+            commands.append(
+                SplitCommand(
+                    line_no=line_no,
+                    source=_random_ref(rng),
+                    target=_random_tag(rng),
+                    effective_date=when,
+                    selector=_random_selector(rng, when) if rng.random() < 0.9 else None,
+                )
+            )
+        else:
+            assignments = rng.choice(
+                [
+                    {"genus": rng.choice(["Pinus", "Quercus"]), "code": "X"},
+                    {"species": "alba"},
+                    {"site": "A", "plot": rng.choice(["P1", "P3"])},
+                    {"tag": str(rng.randint(10, 12))},
+                ]
+            )
+            commands.append(
+                UpdateCommand(
+                    line_no=line_no,
+                    tree_ref=_random_ref(rng),
+                    assignments=assignments,
+                    effective_date=when,
+                )
+            )
+    return rows, commands
+
+
+@pytest.fixture
+def random_history():
+    return _random_history
@@ -0,0 +1,43 @@
+"""Equivalence harness: incremental assembly must match a full rebuild exactly."""
+
+from __future__ import annotations
+
+import random
+from datetime import date
+
+import pytest
+
+from forcen.assembly.incremental import assemble_incremental
+from forcen.assembly.reassemble import assemble_dataset
+from forcen.transactions.models import MeasurementRow
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_incremental_matches_full_rebuild(survey_config, random_history, seed: int) -> None:
+    rows, commands = random_history(seed)
+    rng = random.Random(seed + 1000)
+    row_cuts = sorted(rng.choice(range(len(rows) + 1)) for _ in range(3)) + [len(rows)]
+    command_cuts = sorted(rng.choice(range(len(commands) + 1)) for _ in range(3)) + [len(commands)]
+
+    state = None
+    for row_cut, command_cut in zip(row_cuts, command_cuts):
+        expected = assemble_dataset(rows[:row_cut], commands[:command_cut], survey_config)
+        actual, state = assemble_incremental(rows[:row_cut], commands[:command_cut], survey_config, state)
+        assert actual == expected
+
+
+def test_untouched_components_are_reused(survey_config, random_history) -> None:
+    rows, commands = random_history(7)
+    _, state = assemble_incremental(rows, commands, survey_config)
+    before = {cid: component.rows for cid, component in state.components.items()}
+
+    extra = MeasurementRow(
+        row_number=1, site="Z", plot="P9", tag="1", date=date(2017, 6, 15),
+        dbh_mm=100, health=9, standing=True, notes="",
+    )
+    actual, new_state = assemble_incremental(rows + [extra], commands, survey_config, state)
+
+    assert actual == assemble_dataset(rows + [extra], commands, survey_config)
+    reused = [cid for cid in before if cid in new_state.components]
+    assert reused and all(new_state.components[cid].rows is before[cid] for cid in reused)
+    assert len(new_state.components) == len(state.components) + 1
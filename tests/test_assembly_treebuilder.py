@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import date
 from datetime import date
 from pathlib import Path
 
@@ -19,16 +18,25 @@ from forcen.config.models import (
     ValidationConfig,
 )
 from forcen.engine.utils import determine_default_effective_date, with_default_effective
-from forcen.assembly.treebuilder import assign_tree_uids, build_alias_resolver
+from forcen.assembly.reassemble import assemble_dataset
+from forcen.assembly.treebuilder import build_alias_resolver, resolve_tree_uids
 from forcen.assembly.trees import generate_implied_rows
-from forcen.assembly.split import apply_splits
+from forcen.assembly.split import TreeRowIndex, split_tree_uids
 from forcen.assembly.survey import SurveyCatalog
-from forcen.assembly.properties import apply_properties, build_property_timelines
+from forcen.assembly.properties import build_property_timelines, resolve_properties
 from forcen.transactions import NormalizationConfig, load_transaction
 from forcen.transactions.models import MeasurementRow
 from forcen.dsl import DSLParser
-from forcen.dsl.types import AliasCommand, SplitCommand, TagRef, UpdateCommand
-from forcen.assembly.primary import apply_primary_tags, build_primary_timelines
+from forcen.dsl.types import (
+    AliasCommand,
+    Selector,
+    SelectorStrategy,
+    SplitCommand,
+    TagRef,
+    TreeRef,
+    UpdateCommand,
+)
+from forcen.assembly.primary import build_primary_timelines, primary_tag
 
 
 CONFIG_DIR = Path("planning/fixtures/configs")
@@ -36,28 +44,24 @@ TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
 TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
 
 
-def _prepare_transaction(tx_dir: Path):
+def _transaction_tree_uids(tx_dir: Path):
     config = load_config_bundle(CONFIG_DIR)
     tx = load_transaction(tx_dir, normalization=NormalizationConfig())
     default_effective = determine_default_effective_date(config, tx)
     tx.commands = with_default_effective(tx.commands, default_effective)
     resolver = build_alias_resolver(tx.measurements, tx.commands)
-    assign_tree_uids(tx.measurements, resolver)
-    return tx
+    return resolve_tree_uids(tx.measurements, resolver)
 
 
 def test_tree_uid_consistent_for_same_tag():
-    tx = _prepare_transaction(TX1_DIR)
-    tree_uids = {row.tree_uid for row in tx.measurements}
+    tree_uids = set(_transaction_tree_uids(TX1_DIR))
     assert len(tree_uids) == 1
 
 
 def test_alias_rebinds_tag_to_existing_tree():
-    tx_initial = _prepare_transaction(TX1_DIR)
-    base_tree_uid = tx_initial.measurements[0].tree_uid
+    base_tree_uid = _transaction_tree_uids(TX1_DIR)[0]
 
-    tx_alias = _prepare_transaction(TX2_DIR)
-    alias_tree_uid = tx_alias.measurements[0].tree_uid
+    alias_tree_uid = _transaction_tree_uids(TX2_DIR)[0]
 
     assert alias_tree_uid == base_tree_uid
 
@@ -70,15 +74,16 @@ def test_split_selector_reassigns_historical_rows():
     commands = with_default_effective(tx_split.commands, default_effective)
 
     resolver = build_alias_resolver(measurements, commands)
-    assign_tree_uids(measurements, resolver)
+    tree_uids = resolve_tree_uids(measurements, resolver)
+    survey_ids = SurveyCatalog.from_config(config).survey_ids([row.date for row in measurements])
     splits = [cmd for cmd in commands if isinstance(cmd, SplitCommand)]
-    apply_splits(measurements, splits, resolver, SurveyCatalog.from_config(config))
+    split_tree_uids(measurements, tree_uids, survey_ids, splits, resolver)
 
     split_cmd = splits[0]
     target_uid = resolver.resolve(split_cmd.target, split_cmd.effective_date)
 
-    largest_row = max(measurements, key=lambda row: row.dbh_mm or 0)
-    assert largest_row.tree_uid == target_uid
+    largest = max(range(len(measurements)), key=lambda index: measurements[index].dbh_mm or 0)
+    assert tree_uids[largest] == target_uid
 
 
 def test_update_and_primary_applied_to_measurements():
@@ -97,27 +102,23 @@ def test_update_and_primary_applied_to_measurements():
     )
 
     resolver = build_alias_resolver(tx.measurements, commands)
-    assign_tree_uids(tx.measurements, resolver)
-    catalog = SurveyCatalog.from_config(config)
+    tree_uids = resolve_tree_uids(tx.measurements, resolver)
 
     property_timelines = build_property_timelines(
         [cmd for cmd in commands if isinstance(cmd, UpdateCommand)],
         resolver,
     )
-    apply_properties(tx.measurements, property_timelines)
+    properties = resolve_properties(tx.measurements, tree_uids, property_timelines)
 
     primary_timelines = build_primary_timelines(
         [cmd for cmd in commands if isinstance(cmd, AliasCommand)],
         resolver,
     )
-    apply_primary_tags(tx.measurements, primary_timelines, catalog)
 
-    for row in tx.measurements:
-        assert row.genus == "Pinus"
-        assert row.species == "taeda"
-        assert row.code == "PINTAE"
+    for index, row in enumerate(tx.measurements):
+        assert properties[index] == {"genus": "Pinus", "species": "taeda", "code": "PINTAE"}
         if row.date.year == 2020:
-            assert row.public_tag == "508"
+            assert primary_tag(primary_timelines, tree_uids[index], row.date) == "508"
 
 
 def _make_config_with_three_surveys() -> ConfigBundle:
@@ -212,3 +213,78 @@ def test_generate_implied_removed_when_rediscovered():
     row1.tree_uid = row2.tree_uid = "tree-uid"
     implied_rows = generate_implied_rows([row1, row2], config)
     assert implied_rows == []
+
+
+def test_survey_ids_match_survey_for_date():
+    catalog = SurveyCatalog.from_config(_make_config_with_three_surveys())
+    dates = [date(2018, 12, 31), date(2019, 1, 1), date(2019, 1, 15), date(2019, 7, 1), date(2022, 1, 1)]
+
+    assert catalog.survey_ids(dates) == [catalog.survey_for_date(when) for when in dates]
+    assert SurveyCatalog([]).survey_ids(dates) == [None] * len(dates)
+
+
+def test_assembled_rows_carry_survey_id():
+    config = load_config_bundle(CONFIG_DIR)
+    catalog = SurveyCatalog.from_config(config)
+    tx = load_transaction(TX1_DIR, normalization=NormalizationConfig())
+
+    rows = assemble_dataset(tx.measurements, tx.commands, config)
+
+    assert rows
+    assert all(row.survey_id == catalog.survey_for_date(row.date) for row in rows)
+    assert all(row.survey_id is None for row in tx.measurements)
+
+
+def test_tree_row_index_tracks_reassigned_rows():
+    index = TreeRowIndex(["a", "b", None, "a", "a"], ["S1", "S1", "S1", None, "S2"])
+    assert index.rows("a") == [0, 4]
+
+    index.move({4}, "a", "b")
+    index.move({0}, "a", "a")
+
+    assert index.rows("a") == [0]
+    assert index.rows("b") == [1, 4]
+    assert index.rows("c") == []
+
+
+def test_chained_splits_follow_reassigned_rows():
+    config = _make_config_with_three_surveys()
+    rows = [
+        MeasurementRow(
+            row_number=number,
+            site="BRNV",
+            plot="H1",
+            tag="100",
+            date=date(2019, 1, 15),
+            dbh_mm=100 + number,
+            health=9,
+            standing=True,
+            notes="",
+        )
+        for number in (1, 2, 3)
+    ]
+    source = resolve_tree_uids(rows[:1], build_alias_resolver(rows, []))[0]
+    splits = [
+        SplitCommand(
+            line_no=1,
+            source=TreeRef.from_tag(TagRef("BRNV", "H1", "100")),
+            target=TagRef("BRNV", "H1", "200"),
+            effective_date=date(2020, 1, 1),
+            selector=Selector(strategy=SelectorStrategy.LARGEST),
+        ),
+        SplitCommand(
+            line_no=2,
+            source=TreeRef.from_tag(TagRef("BRNV", "H1", "200")),
+            target=TagRef("BRNV", "H1", "300"),
+            effective_date=date(2021, 1, 1),
+            selector=Selector(strategy=SelectorStrategy.ALL),
+        ),
+    ]
+    resolver = build_alias_resolver(rows, splits)
+    tree_uids = resolve_tree_uids(rows, resolver)
+    survey_ids = SurveyCatalog.from_config(config).survey_ids([row.date for row in rows])
+
+    split_tree_uids(rows, tree_uids, survey_ids, splits, resolver)
+
+    third = resolver.resolve(TagRef("BRNV", "H1", "300"), date(2021, 1, 1))
+    assert tree_uids == [source, source, third]
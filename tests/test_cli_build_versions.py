@@ -45,6 +45,7 @@ def test_build_creates_new_version(tmp_path: Path) -> None:
             str(CONFIG_DIR),
             "--workspace",
             str(workspace),
+            "--force",
         ]
     )
     assert build_result.exit_code == 0
@@ -73,6 +74,7 @@ def test_versions_list(tmp_path: Path) -> None:
             str(CONFIG_DIR),
             "--workspace",
             str(workspace),
+            "--force",
         ]
     )
 
@@ -112,6 +114,7 @@ def test_versions_show_and_diff(tmp_path: Path) -> None:
             str(CONFIG_DIR),
             "--workspace",
             str(workspace),
+            "--force",
         ]
     )
     assert build_out.exit_code == 0
@@ -148,6 +151,74 @@ def test_versions_show_and_diff(tmp_path: Path) -> None:
     assert diff_payload["tx_ids"]["only_in_b"] == []
 
 
+def test_versions_diff_rows_reports_split_reassignment(tmp_path: Path) -> None:
+    from forcen.engine import diff_version_rows
+
+    workspace = tmp_path / "ledger"
+    for tx_dir in (TX1_DIR, Path("planning/fixtures/transactions/tx-2-ops")):
+        submitted = run_cli(
+            ["tx", "submit", str(tx_dir), "--config", str(CONFIG_DIR), "--workspace", str(workspace)]
+        )
+        assert submitted.exit_code == 0
+
+    result = run_cli(["versions", "diff", "1", "2", "--rows", "--workspace", str(workspace)])
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    summary = records[-1]
+    assert summary["type"] == "summary"
+    assert (summary["added"], summary["removed"], summary["changed"], summary["unchanged"]) == (
+        2,
+        0,
+        1,
+        1,
+    )
+    assert summary["changed_columns"] == {"tree_uid": 1}
+    changed = [record for record in records if record["type"] == "changed"]
+    assert changed[0]["columns"] == ["tree_uid"]
+    assert changed[0]["a"]["tree_uid"] != changed[0]["b"]["tree_uid"]
+
+    # Many tiny buckets give the same records.
+    def key(record: dict) -> tuple:
+        return (record["type"], record.get("obs_id", ""))
+
+    tiny = json.loads(json.dumps(list(diff_version_rows(workspace, 1, 2, bucket_rows=1))))
+    assert sorted(tiny, key=key) == sorted(records, key=key)
+
+
+def test_versions_diff_rows_repartitions_oversized_buckets(tmp_path: Path, monkeypatch) -> None:
+    import tempfile
+
+    from forcen.engine import diff_version_rows, versions
+
+    workspace = tmp_path / "ledger"
+    for tx_dir in (TX1_DIR, Path("planning/fixtures/transactions/tx-2-ops")):
+        run_cli(["tx", "submit", str(tx_dir), "--config", str(CONFIG_DIR), "--workspace", str(workspace)])
+    expected = list(diff_version_rows(workspace, 1, 2))
+
+    spill_root = tmp_path / "tmp"
+    spill_root.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(spill_root))
+    monkeypatch.setattr(versions, "MAX_OPEN_SPILLS", 2)
+    spill_buckets = versions._spill_buckets
+    calls: list = []
+
+    def recording(records, directory, buckets, level):
+        # relative_to() fails for spills outside the system temp dir.
+        calls.append((directory.relative_to(spill_root), buckets, level))
+        return spill_buckets(records, directory, buckets, level)
+
+    monkeypatch.setattr(versions, "_spill_buckets", recording)
+
+    def key(record: dict) -> tuple:
+        return (record["type"], record.get("obs_id", ""))
+
+    records = list(diff_version_rows(workspace, 1, 2, bucket_rows=1))
+
+    assert sorted(records, key=key) == sorted(expected, key=key)
+    assert max(buckets for _, buckets, _ in calls) == 2
+    assert max(level for _, _, level in calls) >= 1
+
+
 def test_versions_show_missing(tmp_path: Path) -> None:
     workspace = tmp_path / "ledger"
 
@@ -161,3 +232,54 @@ def test_versions_show_missing(tmp_path: Path) -> None:
         ]
     )
     assert result.exit_code == 4
+
+
+def test_ledger_compact(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    run_cli(
+        [
+            "tx",
+            "submit",
+            str(TX1_DIR),
+            "--config",
+            str(CONFIG_DIR),
+            "--workspace",
+            str(workspace),
+        ]
+    )
+
+    result = run_cli(
+        [
+            "ledger",
+            "compact",
+            "--config",
+            str(CONFIG_DIR),
+            "--workspace",
+            str(workspace),
+        ]
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload == {"segments_merged": 1, "raw_rows": 2}
+    assert (workspace / "observations_raw.csv").exists()
+
+
+def test_tx_submit_batch(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    result = run_cli(
+        [
+            "tx",
+            "submit-batch",
+            str(TX1_DIR),
+            "planning/fixtures/transactions/tx-2-ops",
+            "--config",
+            str(CONFIG_DIR),
+            "--workspace",
+            str(workspace),
+        ]
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["version_seq"] == 1
+    assert len(payload["accepted"]) == 2
+    assert all(entry["accepted"] for entry in payload["results"])
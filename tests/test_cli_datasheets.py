@@ -119,3 +119,72 @@ def test_datasheets_generate_requires_prior_survey(tmp_path: Path) -> None:
         ]
     )
     assert result.exit_code == 4
+
+
+def test_datasheets_generate_all_plots(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    _prepare_workspace(workspace)
+    extra_rows = {
+        "tx-3": "BRNV,H5,7,2019-06-17,120,9,TRUE,\n",
+        "tx-4": "BRNV,H6,8,2020-06-17,80,9,TRUE,\n",
+    }
+    for name, row in extra_rows.items():
+        tx_dir = tmp_path / name
+        tx_dir.mkdir()
+        (tx_dir / "measurements.csv").write_text(
+            "site,plot,tag,date,dbh_mm,health,standing,notes\n" + row, encoding="utf-8"
+        )
+        (tx_dir / "updates.tdl").write_text("", encoding="utf-8")
+        submit = run_cli(
+            ["tx", "submit", str(tx_dir), "--config", str(CONFIG_DIR), "--workspace", str(workspace)]
+        )
+        assert submit.exit_code == 0, submit.output
+
+    single_dir = tmp_path / "single"
+    single = run_cli(
+        [
+            "datasheets",
+            "generate",
+            "--survey",
+            "2020_Jun",
+            "--site",
+            "BRNV",
+            "--plot",
+            "H4",
+            "--config",
+            str(CONFIG_DIR),
+            "--workspace",
+            str(workspace),
+            "--out",
+            str(single_dir),
+        ]
+    )
+    assert single.exit_code == 0
+
+    out_dir = tmp_path / "all"
+    result = run_cli(
+        [
+            "datasheets",
+            "generate",
+            "--survey",
+            "2020_Jun",
+            "--all",
+            "--site",
+            "BRNV",
+            "--config",
+            str(CONFIG_DIR),
+            "--workspace",
+            str(workspace),
+            "--out",
+            str(out_dir),
+        ]
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert [Path(path).name for path in payload["outputs"]] == [
+        "context_BRNV_H4_2020_Jun.json",
+        "context_BRNV_H5_2020_Jun.json",
+    ]
+    assert list(payload["skipped"]) == ["BRNV/H6"]
+    name = "context_BRNV_H4_2020_Jun.json"
+    assert (out_dir / name).read_bytes() == (single_dir / name).read_bytes()
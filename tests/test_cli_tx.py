@@ -128,3 +128,56 @@ def test_tx_new_scaffold(tmp_path: Path) -> None:
         ]
     )
     assert forced.exit_code == 0
+
+
+def test_tx_lint_many_matches_single_lints(tmp_path: Path) -> None:
+    import shutil
+
+    from forcen.engine import lint_transaction, submit_transaction
+
+    config_dir = Path("planning/fixtures/configs")
+    fixtures = Path("planning/fixtures/transactions")
+    workspace = tmp_path / "ledger"
+    submit_transaction(fixtures / "tx-1-initial", config_dir, workspace)
+
+    good = []
+    for name in ("tx-1-initial", "tx-2-ops"):
+        shutil.copytree(fixtures / name, tmp_path / name)
+        good.append(tmp_path / name)
+    bad = tmp_path / "tx-bad"
+    bad.mkdir()
+    (bad / "measurements.csv").write_text("site,plot\n", encoding="utf-8")
+    expected = [
+        json.loads(json.dumps(lint_transaction(tx_dir, config_dir, workspace=workspace).as_dict()))
+        for tx_dir in good
+    ]
+
+    result = run_cli(
+        [
+            "tx",
+            "lint-many",
+            *(str(path) for path in good + [bad]),
+            "--config",
+            str(config_dir),
+            "--workspace",
+            str(workspace),
+            "--jobs",
+            "2",
+        ]
+    )
+
+    assert result.exit_code == 4
+    payload = json.loads(result.stdout)
+    assert [entry["tx_dir"] for entry in payload["results"]] == [str(p) for p in good + [bad]]
+    assert payload["summary"] == {
+        "transactions": 3,
+        "clean": 2,
+        "with_errors": 0,
+        "failed": 1,
+        "errors": 0,
+        "warnings": payload["summary"]["warnings"],
+    }
+    assert payload["results"][2]["error"].startswith("TransactionFormatError")
+    for tx_dir, expected_report in zip(good, expected):
+        report = json.loads((tx_dir / "lint-report.json").read_text(encoding="utf-8"))
+        assert report == expected_report
@@ -62,6 +62,24 @@ surveys = [
     assert "surveys" in str(exc.value)
 
 
+def test_load_config_bundle_engine_defaults_and_overrides(tmp_path: Path) -> None:
+    _write_minimal_configs(tmp_path)
+    assert load_config_bundle(tmp_path).engine.ledger.raw_format == "csv"
+
+    (tmp_path / "engine.toml").write_text(
+        """
+[ledger]
+raw_format = "parquet"
+""".strip()
+    )
+    assert load_config_bundle(tmp_path).engine.ledger.raw_format == "parquet"
+
+    (tmp_path / "engine.toml").write_text('[ledger]\nraw_format = "feather"\n')
+    with pytest.raises(ConfigError) as exc:
+        load_config_bundle(tmp_path)
+    assert "engine.toml" in str(exc.value)
+
+
 def _write_minimal_configs(target: Path) -> None:
     (target / "taxonomy.toml").write_text(
         """
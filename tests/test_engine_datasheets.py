@@ -0,0 +1,68 @@
+"""Tests for datasheet generation from materialized versions."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from forcen.engine import DatasheetOptions, generate_datasheet, submit_transaction
+from forcen.engine import datasheets as datasheets_module
+from forcen.ledger.storage import Ledger
+
+CONFIG_DIR = Path("planning/fixtures/configs")
+TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
+TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    submit_transaction(TX2_DIR, CONFIG_DIR, workspace)
+    return workspace
+
+
+def _generate(config_dir: Path, workspace: Path, out_dir: Path) -> bytes:
+    options = DatasheetOptions(survey_id="2020_Jun", site="BRNV", plot="H4", output_dir=out_dir)
+    return generate_datasheet(config_dir, workspace, options).read_bytes()
+
+
+def test_datasheet_reads_current_version_without_assembling(
+    tmp_path: Path, workspace: Path, monkeypatch
+) -> None:
+    # Force the fallback once to get the reference output from assembly.
+    monkeypatch.setattr(datasheets_module, "_materialized_rows", lambda *args: None)
+    reference = _generate(CONFIG_DIR, workspace, tmp_path / "reference")
+    monkeypatch.undo()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("datasheet reassembled a current workspace")
+
+    monkeypatch.setattr(datasheets_module, "assemble_dataset", fail)
+    assert _generate(CONFIG_DIR, workspace, tmp_path / "materialized") == reference
+
+    rows = Ledger(workspace).read_version_observations(2, site="BRNV", plot="H4")
+    assert rows and all((row.site, row.plot) == ("BRNV", "H4") for row in rows)
+    assert Ledger(workspace).read_version_observations(2, site="BRNV", plot="H0") == []
+
+
+def test_datasheet_falls_back_to_assembly_when_stale(
+    tmp_path: Path, workspace: Path, monkeypatch
+) -> None:
+    config_dir = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, config_dir)
+    with (config_dir / "sites.toml").open("a", encoding="utf-8") as fh:
+        fh.write("\n# edited after the last submit\n")
+
+    calls = []
+    original = datasheets_module.assemble_dataset
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(datasheets_module, "assemble_dataset", counting)
+    _generate(config_dir, workspace, tmp_path / "out")
+    assert calls == [1]
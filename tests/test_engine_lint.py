@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from forcen.config import load_config_bundle
+from forcen.dsl.exceptions import DSLParseError
 from forcen.engine import lint_transaction
 from forcen.transactions import NormalizationConfig
 from forcen.transactions import loader as tx_loader
@@ -70,3 +71,189 @@ def test_lint_uses_config_rounding(monkeypatch: pytest.MonkeyPatch) -> None:
 
     expected_rounding = load_config_bundle(CONFIG_DIR).validation.rounding
     assert captured["rounding"] == expected_rounding
+
+
+def test_watch_relints_on_change_with_warm_session(tmp_path: Path) -> None:
+    import shutil
+
+    from forcen.engine import LintSession, submit_transaction, watch_transaction
+
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    tx_dir = tmp_path / "tx"
+    shutil.copytree(Path("planning/fixtures/transactions/tx-2-ops"), tx_dir)
+
+    session = LintSession(CONFIG_DIR, workspace=workspace)
+    results = []
+
+    def on_result(report, error) -> None:
+        results.append((report, error))
+        if len(results) == 1:
+            with (tx_dir / "updates.tdl").open("a", encoding="utf-8") as fh:
+                fh.write("THIS IS NOT DSL\n")
+        elif len(results) == 2:
+            shutil.copy(
+                Path("planning/fixtures/transactions/tx-2-ops/updates.tdl"),
+                tx_dir / "updates.tdl",
+            )
+
+    watch_transaction(
+        tx_dir, session, on_result, poll_interval=0.01, should_stop=lambda: len(results) >= 3
+    )
+
+    first, broken, fixed = results
+    assert first[1] is None and fixed[1] is None
+    assert broken[0] is None and isinstance(broken[1], DSLParseError)
+    expected = lint_transaction(tx_dir, CONFIG_DIR, workspace=workspace, full=True)
+    assert fixed[0].as_dict() == expected.as_dict()
+    assert first[0].as_dict() == expected.as_dict()
+
+
+def test_watch_survives_unexpected_errors(tmp_path: Path, monkeypatch) -> None:
+    from forcen.engine import LintSession, watch_transaction
+
+    session = LintSession(CONFIG_DIR)
+    lint = session.lint
+    calls = []
+
+    def flaky(tx_dir):
+        calls.append(tx_dir)
+        if len(calls) == 1:
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "half-written file")
+        return lint(tx_dir)
+
+    monkeypatch.setattr(session, "lint", flaky)
+    tx_dir = _write_tx(tmp_path / "tx", "BRNV,H4,112,2019-06-16,171,9,TRUE,\n")
+    results = []
+
+    def on_result(report, error) -> None:
+        results.append((report, error))
+        if len(results) == 1:
+            (tx_dir / "updates.tdl").write_text("\n", encoding="utf-8")
+
+    watch_transaction(
+        tx_dir, session, on_result, poll_interval=0.01, should_stop=lambda: len(results) >= 2
+    )
+
+    assert isinstance(results[0][1], UnicodeDecodeError)
+    assert results[1][0] is not None and results[1][1] is None
+
+
+def test_lint_many_reports_unexpected_errors_per_entry(tmp_path: Path, monkeypatch) -> None:
+    from forcen.engine import LintSession, lint_many
+
+    lint = LintSession.lint
+
+    def flaky(self, tx_dir):
+        if Path(tx_dir).name == "tx-bad":
+            raise ValueError("unexpected")
+        return lint(self, tx_dir)
+
+    monkeypatch.setattr(LintSession, "lint", flaky)
+    rows = "BRNV,H4,112,2019-06-16,171,9,TRUE,\n"
+    dirs = [_write_tx(tmp_path / name, rows) for name in ("tx-a", "tx-bad", "tx-b")]
+
+    entries = lint_many(dirs, CONFIG_DIR, jobs=2)
+
+    assert [entry.error_type for entry in entries] == [None, "ValueError", None]
+    assert entries[1].error == "unexpected"
+    assert entries[0].report is not None and entries[2].report is not None
+
+
+def _write_tx(tx_dir: Path, rows: str, updates: str = "") -> Path:
+    tx_dir.mkdir(parents=True)
+    (tx_dir / "measurements.csv").write_text(
+        "site,plot,tag,date,dbh_mm,health,standing,notes\n" + rows, encoding="utf-8"
+    )
+    (tx_dir / "updates.tdl").write_text(updates, encoding="utf-8")
+    return tx_dir
+
+
+def _restricted(payload: dict, scope: list) -> dict:
+    outside = {
+        row["tree_uid"]
+        for row in payload["tree_view"]
+        if f"{row['site']}/{row['plot']}" not in scope
+    }
+    issues = [
+        issue
+        for issue in payload["issues"]
+        if not any(uid in issue["location"] for uid in outside)
+    ]
+    return {
+        **payload,
+        "issues": issues,
+        "summary": {**payload["summary"], "warnings": len(issues) - payload["summary"]["errors"]},
+        "tree_view": [
+            row for row in payload["tree_view"] if f"{row['site']}/{row['plot']}" in scope
+        ],
+        "retag_suggestions": [
+            row for row in payload["retag_suggestions"] if row["plot"] in scope
+        ],
+    }
+
+
+def test_scoped_lint_loads_only_reachable_plots(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from forcen.engine import submit_transaction
+    from forcen.ledger import storage
+    from forcen.transactions.txid import compute_tx_id
+
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    other = _write_tx(
+        tmp_path / "m1",
+        "BRNV,M1,1,2019-06-16,120,9,TRUE,\nBRNV,M1,2,2019-06-16,80,9,TRUE,\n",
+    )
+    submit_transaction(other, CONFIG_DIR, workspace)
+    linked = _write_tx(
+        tmp_path / "h5",
+        "BRNV,H5,7,2019-06-16,150,9,TRUE,\nBRNV,H6,3,2019-06-16,60,9,TRUE,\n",
+        'ALIAS BRNV/H6/4 TO BRNV/H5/7 EFFECTIVE 2019-06-15 NOTE "moved"\n',
+    )
+    submit_transaction(linked, CONFIG_DIR, workspace)
+
+    read = []
+    original = storage.read_raw_parquet
+
+    def recording(path: Path, filters=None):
+        read.append(path.name)
+        return original(path, filters)
+
+    monkeypatch.setattr(storage, "read_raw_parquet", recording)
+
+    tx2_dir = Path("planning/fixtures/transactions/tx-2-ops")
+    scoped = lint_transaction(tx2_dir, CONFIG_DIR, workspace=workspace, scoped=True)
+    assert scoped.scope == ["BRNV/H4"]
+    assert read == [f"{compute_tx_id(TX1_DIR)}.parquet"]
+    full = lint_transaction(tx2_dir, CONFIG_DIR, workspace=workspace, full=True)
+    payload = scoped.as_dict()
+    assert payload.pop("scope") == ["BRNV/H4"]
+    assert payload == _restricted(full.as_dict(), scoped.scope)
+
+    h6 = _write_tx(tmp_path / "h6", "BRNV,H6,4,2020-06-16,62,9,TRUE,\n")
+    scoped = lint_transaction(h6, CONFIG_DIR, workspace=workspace, scoped=True)
+    assert scoped.scope == ["BRNV/H5", "BRNV/H6"]
+    payload = scoped.as_dict()
+    payload.pop("scope")
+    full = lint_transaction(h6, CONFIG_DIR, workspace=workspace, full=True)
+    assert payload == _restricted(full.as_dict(), scoped.scope)
+
+
+def test_scoped_lint_falls_back_when_an_update_moves_trees(tmp_path: Path) -> None:
+    from forcen.engine import submit_transaction
+
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    rows = "BRNV,H5,7,2019-06-16,150,9,TRUE,\n"
+    plain = _write_tx(tmp_path / "plain", rows)
+    moving = _write_tx(
+        tmp_path / "moving", rows, "UPDATE BRNV/H4/112 SET plot=H5 EFFECTIVE 2019-06-15\n"
+    )
+
+    assert lint_transaction(plain, CONFIG_DIR, workspace=workspace, scoped=True).scope == [
+        "BRNV/H5"
+    ]
+    report = lint_transaction(moving, CONFIG_DIR, workspace=workspace, scoped=True)
+    assert report.scope is None
@@ -0,0 +1,117 @@
+"""Tests for the workspace lock and the queued submit scheduler."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from forcen.engine import submit_queued
+from forcen.ledger.lock import WorkspaceLock, WorkspaceLockedError
+
+
+CONFIG_DIR = Path("planning/fixtures/configs")
+TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
+TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
+
+
+def test_workspace_lock_excludes_other_threads(tmp_path: Path) -> None:
+    held = threading.Event()
+    release = threading.Event()
+
+    def holder() -> None:
+        with WorkspaceLock(tmp_path):
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    held.wait(5)
+    try:
+        with pytest.raises(WorkspaceLockedError):
+            with WorkspaceLock(tmp_path, timeout=0.1):
+                pass
+    finally:
+        release.set()
+        thread.join()
+
+    with WorkspaceLock(tmp_path, timeout=0.1):
+        with WorkspaceLock(tmp_path, timeout=0.1):  # re-entrant in one thread
+            pass
+
+
+def test_submit_queued_runs_in_fifo_order(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    results = submit_queued([TX1_DIR, TX2_DIR, TX1_DIR, tmp_path / "missing"], CONFIG_DIR, workspace)
+
+    assert [result.accepted for result in results] == [True, True, False, False]
+    assert [result.version_seq for result in results] == [1, 2, None, None]
+    assert results[2].tx_id == results[0].tx_id
+    assert results[3].error is not None
+    assert list((workspace / "queue" / "pending").iterdir()) == []
+    assert list((workspace / "queue" / "results").iterdir()) == []
+
+
+def test_malformed_ticket_does_not_block_the_queue(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    bad_tx = tmp_path / "bad-tx"
+    shutil.copytree(TX1_DIR, bad_tx)
+    (bad_tx / "survey_meta.toml").write_text("survey_id = [unterminated\n")
+
+    results = submit_queued([bad_tx, TX1_DIR], CONFIG_DIR, workspace)
+
+    assert not results[0].accepted
+    assert results[0].error is not None and "TransactionFormatError" in results[0].error
+    assert results[1].accepted and results[1].version_seq == 1
+    assert list((workspace / "queue" / "pending").iterdir()) == []
+
+
+def test_unrecordable_result_is_reported_as_an_error(tmp_path: Path, monkeypatch) -> None:
+    from forcen.engine import queue
+
+    run_ticket = queue._run_ticket
+
+    def unserializable(ticket: dict, workspace: Path) -> queue.QueuedSubmitResult:
+        result = run_ticket(ticket, workspace)
+        if ticket["tx_dir"] == str(TX1_DIR.resolve()):
+            result.tx_id = object()
+        return result
+
+    monkeypatch.setattr(queue, "_run_ticket", unserializable)
+    workspace = tmp_path / "ledger"
+
+    results = submit_queued([TX1_DIR, TX2_DIR], CONFIG_DIR, workspace)
+
+    assert results[0].error is not None and "result not recorded" in results[0].error
+    assert results[0].tx_dir == str(TX1_DIR.resolve())
+    assert results[1].accepted and results[1].version_seq == 2
+    assert list((workspace / "queue" / "pending").iterdir()) == []
+
+
+def test_concurrent_callers_share_one_ledger(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    outcomes: dict = {}
+
+    def caller(name: str, dirs: list) -> None:
+        outcomes[name] = submit_queued(dirs, CONFIG_DIR, workspace)
+
+    threads = [
+        threading.Thread(target=caller, args=("a", [TX1_DIR])),
+        threading.Thread(target=caller, args=("b", [TX1_DIR, TX2_DIR])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    accepted = [r for results in outcomes.values() for r in results if r.accepted]
+    assert len(accepted) == 2
+    assert all(r.error is None for results in outcomes.values() for r in results)
+
+    lines = (workspace / "transactions.jsonl").read_text().splitlines()
+    tx_ids = [json.loads(line)["tx_id"] for line in lines]
+    assert len(tx_ids) == len(set(tx_ids)) == 2
+    assert sorted(p.name for p in (workspace / "versions").iterdir()) == ["0001", "0002"]
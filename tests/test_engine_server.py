@@ -0,0 +1,90 @@
+"""Tests for the Unix-socket lint/submit server."""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from forcen.engine import ForcenServer, ServerError, lint_transaction, send_request
+
+CONFIG_DIR = Path("planning/fixtures/configs")
+TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
+TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
+
+
+@pytest.fixture
+def server(tmp_path: Path):
+    server = ForcenServer(tmp_path / "forcen.sock", CONFIG_DIR, tmp_path / "ledger")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_server_lints_concurrently_and_serializes_submits(server: ForcenServer) -> None:
+    sock = server.socket_path
+    assert send_request(sock, {"op": "ping", "id": 7}) == {
+        "ok": True,
+        "result": {"workspace": str(server.workspace)},
+        "id": 7,
+    }
+
+    inline = {
+        "op": "lint",
+        "measurements_csv": (TX1_DIR / "measurements.csv").read_text(encoding="utf-8"),
+        "updates_tdl": (TX1_DIR / "updates.tdl").read_text(encoding="utf-8"),
+    }
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        replies = list(pool.map(lambda _: send_request(sock, inline, timeout=30), range(8)))
+    expected = lint_transaction(TX1_DIR, CONFIG_DIR).as_dict()
+    for reply in replies:
+        assert reply["ok"] is True
+        assert reply["result"]["tx_id"] == expected["tx_id"]
+        assert reply["result"]["measurement_rows"] == expected["measurement_rows"]
+
+    submit = {"op": "submit", "tx_dir": str(TX1_DIR)}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        submits = list(pool.map(lambda _: send_request(sock, submit, timeout=30), range(2)))
+    assert sorted(reply["result"]["accepted"] for reply in submits) == [False, True]
+
+    # Lints after a submit see the new ledger state.
+    reply = send_request(sock, {"op": "lint", "tx_dir": str(TX2_DIR)}, timeout=30)
+    expected = lint_transaction(TX2_DIR, CONFIG_DIR, workspace=server.workspace, full=True)
+    assert reply["result"] == expected.as_dict()
+
+
+def test_server_reports_errors_and_refuses_live_socket(server: ForcenServer) -> None:
+    reply = send_request(server.socket_path, {"op": "lint", "measurements_csv": "site\n"})
+    assert reply["ok"] is False
+    assert reply["error"]["type"] == "TransactionFormatError"
+    reply = send_request(server.socket_path, {"op": "nope"})
+    assert reply["error"] == {"type": "ServerError", "message": "unknown op 'nope'"}
+
+    with pytest.raises(ServerError):
+        ForcenServer(server.socket_path, CONFIG_DIR, server.workspace)
+
+
+def test_server_answers_unexpected_errors(server: ForcenServer, monkeypatch) -> None:
+    def explode(tx_dir):
+        raise ValueError("bad cell")
+
+    monkeypatch.setattr(server.session, "lint", explode)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(server.socket_path))
+        with sock.makefile("rwb") as stream:
+            stream.write(b'{"op": "lint", "tx_dir": "x", "id": 1}\n{"op": "ping"}\n')
+            stream.flush()
+            assert json.loads(stream.readline()) == {
+                "ok": False,
+                "error": {"type": "ValueError", "message": "bad cell"},
+                "id": 1,
+            }
+            # The connection survives the failed request.
+            assert json.loads(stream.readline())["ok"] is True
@@ -5,11 +5,14 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
 from forcen.engine import SubmitError, submit_transaction
 
 
 CONFIG_DIR = Path("planning/fixtures/configs")
 TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
+TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
 
 
 def test_submit_transaction_creates_ledger(tmp_path: Path) -> None:
@@ -60,6 +63,31 @@ def test_submit_transaction_idempotent(tmp_path: Path) -> None:
     assert len(versions) == 1
 
 
+def test_resubmit_reports_the_recorded_warnings(tmp_path: Path) -> None:
+    from forcen.engine import submit_batch
+
+    growth_dir = tmp_path / "tx-growth"
+    growth_dir.mkdir()
+    # 171mm -> 186mm between surveys crosses the growth warning threshold only.
+    (growth_dir / "measurements.csv").write_text(
+        "site,plot,tag,date,dbh_mm,health,standing,notes\n"
+        'BRNV,H4,112,2020-06-16,186,9,TRUE,""\n'
+    )
+    (growth_dir / "updates.tdl").write_text("")
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    first = submit_transaction(growth_dir, CONFIG_DIR, workspace)
+    assert (first.accepted, first.warnings) == (True, 1)
+
+    again = submit_transaction(growth_dir, CONFIG_DIR, workspace)
+    assert (again.accepted, again.warnings) == (False, 1)
+
+    batch = submit_batch([growth_dir], CONFIG_DIR, workspace)
+    assert [(e.accepted, e.warnings) for e in batch.entries] == [(False, 1)]
+    batch = submit_batch([TX1_DIR, growth_dir, growth_dir], CONFIG_DIR, tmp_path / "batched")
+    assert [(e.accepted, e.warnings) for e in batch.entries] == [(True, 0), (True, 1), (False, 1)]
+
+
 def test_submit_second_transaction_produces_retag(tmp_path: Path) -> None:
     workspace = tmp_path / "ledger"
     submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
@@ -88,3 +116,259 @@ def test_submit_second_transaction_produces_retag(tmp_path: Path) -> None:
             found = True
             break
     assert found
+
+
+def test_versions_deduplicate_identical_artifacts(tmp_path: Path) -> None:
+    from forcen.engine import build_workspace
+
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    build_workspace(CONFIG_DIR, workspace, force=True)
+
+    first = json.loads((workspace / "versions" / "0001" / "manifest.json").read_text())
+    second = json.loads((workspace / "versions" / "0002" / "manifest.json").read_text())
+
+    checksum = first["artifact_checksums"]["trees_view.csv"]
+    assert second["artifact_checksums"]["trees_view.csv"] == checksum
+    blob_path = workspace / first["artifact_blobs"]["trees_view.csv"]
+    assert blob_path == workspace / "objects" / checksum[:2] / checksum
+    assert second["artifact_blobs"]["trees_view.csv"] == first["artifact_blobs"]["trees_view.csv"]
+
+    v1_file = workspace / "versions" / "0001" / "trees_view.csv"
+    v2_file = workspace / "versions" / "0002" / "trees_view.csv"
+    assert v1_file.read_bytes() == v2_file.read_bytes() == blob_path.read_bytes()
+    assert v1_file.stat().st_ino == v2_file.stat().st_ino == blob_path.stat().st_ino
+
+
+def test_concurrent_blob_puts_of_same_content(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from forcen.ledger.blobs import BlobStore, sha256_file
+
+    src = tmp_path / "artifact.csv"
+    src.write_bytes(b"x" * (1 << 21))
+    store = BlobStore(tmp_path / "objects")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        digests = list(pool.map(lambda _: store.put(src), range(16)))
+
+    assert set(digests) == {sha256_file(src)}
+    assert store.path_for(digests[0]).read_bytes() == src.read_bytes()
+    assert not list((tmp_path / "objects").rglob("*.tmp"))
+
+
+def test_manifest_checksums_come_from_write_time_digests(tmp_path: Path, monkeypatch) -> None:
+    import hashlib
+
+    from forcen.ledger import blobs
+
+    hashed: list[str] = []
+    original = blobs.sha256_file
+
+    def tracking_sha256(path: Path) -> str:
+        hashed.append(Path(path).name)
+        return original(path)
+
+    monkeypatch.setattr(blobs, "sha256_file", tracking_sha256)
+
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+
+    # Only the appended DSL log is hashed after the fact.
+    assert hashed == ["updates_log.tdl"]
+
+    manifest = json.loads((workspace / "versions" / "0001" / "manifest.json").read_text())
+    for name, checksum in manifest["artifact_checksums"].items():
+        data = (workspace / name).read_bytes()
+        assert checksum == hashlib.sha256(data).hexdigest()
+        assert manifest["artifact_sizes"][name] == len(data)
+
+
+def test_parallel_writers_match_sequential_output(tmp_path: Path) -> None:
+    checksums = []
+    for jobs in (1, 4):
+        workspace = tmp_path / f"ledger-{jobs}"
+        submit_transaction(TX1_DIR, CONFIG_DIR, workspace, jobs=jobs)
+        manifest = json.loads((workspace / "versions" / "0001" / "manifest.json").read_text())
+        checksums.append(manifest["artifact_checksums"])
+    assert checksums[0] == checksums[1]
+
+
+def test_writer_failure_fails_submit(tmp_path: Path, monkeypatch) -> None:
+    from forcen.ledger.storage import Ledger
+
+    def broken_writer(self, path: Path, df) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Ledger, "_write_parquet_artifact", broken_writer)
+    workspace = tmp_path / "ledger"
+    with pytest.raises(OSError, match="disk full"):
+        submit_transaction(TX1_DIR, CONFIG_DIR, workspace, jobs=4)
+
+    assert not (workspace / "transactions.jsonl").exists()
+    assert list((workspace / "versions").iterdir()) == []
+    assert Ledger(workspace).read_raw_segments() == []
+
+
+def test_failed_submit_leaves_no_raw_rows_behind(tmp_path: Path, monkeypatch) -> None:
+    from forcen.ledger.storage import Ledger
+
+    def broken_log(self, **kwargs) -> None:
+        raise OSError("log unwritable")
+
+    workspace = tmp_path / "ledger"
+    with monkeypatch.context() as patch:
+        patch.setattr(Ledger, "append_transaction_entry", broken_log)
+        with pytest.raises(OSError, match="log unwritable"):
+            submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    # The segment was written, but its transaction never reached the log.
+    assert Ledger(workspace).load_raw_measurements() == []
+
+    result = submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+
+    assert result.accepted is True
+    assert len(Ledger(workspace).load_raw_measurements()) == 2
+
+
+def test_submit_batch_matches_sequential_submits(tmp_path: Path) -> None:
+    from forcen.engine import submit_batch
+
+    bad_dir = tmp_path / "tx-bad"
+    bad_dir.mkdir()
+    (bad_dir / "measurements.csv").write_text(
+        "site,plot,tag,date,dbh_mm,health,standing,notes\n"
+        "NOPE,H4,900,2019-06-16,120,9,TRUE,\n"
+    )
+
+    sequential = tmp_path / "sequential"
+    submit_transaction(TX1_DIR, CONFIG_DIR, sequential)
+    submit_transaction(TX2_DIR, CONFIG_DIR, sequential)
+
+    batched = tmp_path / "batched"
+    result = submit_batch([TX1_DIR, bad_dir, TX2_DIR, TX1_DIR], CONFIG_DIR, batched)
+
+    assert [entry.accepted for entry in result.entries] == [True, False, True, False]
+    assert result.entries[1].errors > 0
+    assert result.entries[3].reason == "already submitted"
+    assert result.version_seq == 1
+    manifest = json.loads((batched / "versions" / "0001" / "manifest.json").read_text())
+    assert manifest["tx_ids"] == result.accepted_tx_ids
+    assert len(list((batched / "versions").iterdir())) == 1
+
+    for name in ("observations_long.csv", "trees_view.csv", "retag_suggestions.csv"):
+        assert (batched / name).read_bytes() == (sequential / name).read_bytes()
+    assert (batched / "transactions.jsonl").read_text().count("\n") == 2
+
+
+def test_submit_batch_reports_unreadable_directories_per_entry(tmp_path: Path) -> None:
+    import shutil
+
+    from forcen.engine import submit_batch
+
+    bad_toml = tmp_path / "tx-bad-toml"
+    shutil.copytree(TX1_DIR, bad_toml)
+    (bad_toml / "survey_meta.toml").write_text("survey_id = [unterminated\n")
+    bad_bytes = tmp_path / "tx-bad-bytes"
+    shutil.copytree(TX1_DIR, bad_bytes)
+    (bad_bytes / "updates.tdl").write_bytes(b"\xff\xfe\x00")
+
+    result = submit_batch([bad_toml, bad_bytes, TX1_DIR], CONFIG_DIR, tmp_path / "ledger")
+
+    assert [entry.accepted for entry in result.entries] == [False, False, True]
+    assert "invalid TOML" in (result.entries[0].reason or "")
+    assert result.entries[1].reason
+    assert result.version_seq == 1
+
+
+def test_submit_reuses_lint_assembly(tmp_path: Path, monkeypatch) -> None:
+    from forcen.engine import lint as lint_module
+
+    calls = []
+
+    def counting(name):
+        original = getattr(lint_module, name)
+
+        def counting_assemble(*args, **kwargs):
+            calls.append(name)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(lint_module, name, counting_assemble)
+
+    counting("assemble_dataset")
+    counting("assemble_incremental")
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    submit_transaction(TX2_DIR, CONFIG_DIR, workspace)
+
+    # One assembly per submit: the lint pass's result is written directly.
+    assert len(calls) == 2
+
+
+def test_incremental_submits_match_full_assembly(tmp_path: Path) -> None:
+    incremental = tmp_path / "incremental"
+    full = tmp_path / "full"
+    for tx_dir in (TX1_DIR, TX2_DIR):
+        submit_transaction(tx_dir, CONFIG_DIR, incremental)
+        submit_transaction(tx_dir, CONFIG_DIR, full, full=True)
+
+    assert (incremental / "assembly.state").exists()
+    assert not (full / "assembly.state").exists()
+    for name in ("observations_long.csv", "observations_long.parquet"):
+        assert (incremental / name).read_bytes() == (full / name).read_bytes()
+
+
+def test_build_skips_when_inputs_are_unchanged(tmp_path: Path) -> None:
+    import shutil
+
+    from forcen.engine import build_workspace
+
+    workspace = tmp_path / "ledger"
+    config_dir = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, config_dir)
+    submit_transaction(TX1_DIR, config_dir, workspace)
+    manifest = json.loads((workspace / "versions" / "0001" / "manifest.json").read_text())
+    assert set(manifest["build_fingerprint"]) == {
+        "raw_sha256",
+        "commands_sha256",
+        "config_hashes",
+        "code_version",
+    }
+
+    # The submit already wrote what a build would.
+    first = build_workspace(config_dir, workspace)
+    assert (first.version_seq, first.tx_count, first.skipped) == (1, 1, True)
+    assert build_workspace(config_dir, workspace, force=True).version_seq == 2
+    again = build_workspace(config_dir, workspace)
+    assert (again.version_seq, again.skipped) == (2, True)
+
+    with (config_dir / "validation.toml").open("a", encoding="utf-8") as fh:
+        fh.write("\n# tweak\n")
+    assert build_workspace(config_dir, workspace).version_seq == 3
+
+    submit_transaction(TX2_DIR, config_dir, workspace)
+    skipped = build_workspace(config_dir, workspace)
+    assert (skipped.version_seq, skipped.tx_count, skipped.skipped) == (4, 2, True)
+
+
+def test_batch_submit_records_the_build_fingerprint(tmp_path: Path) -> None:
+    from forcen.engine import build_workspace, submit_batch
+
+    workspace = tmp_path / "ledger"
+    result = submit_batch([TX1_DIR, TX2_DIR], CONFIG_DIR, workspace)
+
+    skipped = build_workspace(CONFIG_DIR, workspace)
+    assert (skipped.version_seq, skipped.tx_count, skipped.skipped) == (result.version_seq, 2, True)
+
+
+def test_code_version_change_invalidates_build_fingerprint(tmp_path: Path, monkeypatch) -> None:
+    from forcen.engine import build_workspace, utils
+    from forcen.engine.utils import detect_code_version
+
+    assert detect_code_version() != "unknown"
+
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    assert build_workspace(CONFIG_DIR, workspace).skipped is True
+
+    monkeypatch.setattr(utils, "detect_code_version", lambda: "99.0.0")
+    assert build_workspace(CONFIG_DIR, workspace).skipped is False
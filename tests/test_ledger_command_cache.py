@@ -0,0 +1,53 @@
+"""Tests for the compiled command cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from forcen.dsl.types import AliasCommand, SplitCommand
+from forcen.engine import submit_transaction
+from forcen.ledger.storage import Ledger
+
+
+CONFIG_DIR = Path("planning/fixtures/configs")
+TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
+TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
+
+
+def test_cache_extended_on_append_and_served_without_parsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    submit_transaction(TX2_DIR, CONFIG_DIR, workspace)
+
+    ledger = Ledger(workspace)
+    assert ledger.commands_cache.exists()
+    expected = ledger._parse_commands()
+
+    def fail() -> list:
+        raise AssertionError("log should not be re-parsed")
+
+    monkeypatch.setattr(ledger, "_parse_commands", fail)
+    commands = ledger.load_commands()
+    assert commands == expected
+    assert [type(cmd) for cmd in commands] == [AliasCommand, SplitCommand]
+
+
+def test_cache_discarded_when_log_changes(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX2_DIR, CONFIG_DIR, workspace)
+    ledger = Ledger(workspace)
+    assert len(ledger.load_commands()) == 2
+
+    # Rewrite the log behind the cache's back: drop the commands.
+    text = ledger.transactions_log.read_text(encoding="utf-8")
+    ledger.transactions_log.write_text(
+        text.replace('"commands": [', '"commands": [], "dropped": ['), encoding="utf-8"
+    )
+    assert Ledger(workspace).load_commands() == []
+
+    ledger.commands_cache.write_bytes(b"not a pickle")
+    assert Ledger(workspace).load_commands() == []
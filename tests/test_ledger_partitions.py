@@ -0,0 +1,77 @@
+"""Tests for the partitioned observations_long dataset."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import pyarrow.dataset as ds
+
+from forcen.engine import build_workspace, submit_transaction
+
+
+CONFIG_DIR = Path("planning/fixtures/configs")
+TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
+TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
+
+
+def _partitioned_config(tmp_path: Path) -> Path:
+    config_dir = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, config_dir)
+    (config_dir / "engine.toml").write_text("[ledger]\npartitioned_observations = true\n")
+    return config_dir
+
+
+def _part_mtimes(dataset: Path) -> dict:
+    return {
+        path.relative_to(dataset).as_posix(): path.stat().st_mtime_ns
+        for path in dataset.rglob("part.parquet")
+    }
+
+
+def test_partitioned_dataset_is_written_and_pruned(tmp_path: Path) -> None:
+    config_dir = _partitioned_config(tmp_path)
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, config_dir, workspace)
+    submit_transaction(TX2_DIR, config_dir, workspace)
+
+    dataset_dir = workspace / "observations_long"
+    assert sorted(_part_mtimes(dataset_dir)) == [
+        "survey_id=2019_Jun/site=BRNV/part.parquet",
+        "survey_id=2020_Jun/site=BRNV/part.parquet",
+    ]
+
+    dataset = ds.dataset(dataset_dir, format="parquet", partitioning="hive")
+    total = dataset.to_table().num_rows
+    assert total == len((workspace / "observations_long.csv").read_text().splitlines()) - 1
+    pruned = dataset.to_table(filter=ds.field("survey_id") == "2020_Jun")
+    assert 0 < pruned.num_rows < total
+
+    manifest = json.loads((workspace / "versions" / "0002" / "manifest.json").read_text())
+    for key, entry in manifest["partitions"].items():
+        data = (dataset_dir / key).read_bytes()
+        assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+        snapshot = workspace / "versions" / "0002" / "observations_long" / key
+        assert snapshot.read_bytes() == data
+
+
+def test_unchanged_partitions_are_not_rewritten(tmp_path: Path) -> None:
+    config_dir = _partitioned_config(tmp_path)
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, config_dir, workspace)
+    before = _part_mtimes(workspace / "observations_long")
+
+    build_workspace(config_dir, workspace)
+
+    assert _part_mtimes(workspace / "observations_long") == before
+
+
+def test_partitioned_layout_is_off_by_default(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+
+    assert not (workspace / "observations_long").exists()
+    manifest = json.loads((workspace / "versions" / "0001" / "manifest.json").read_text())
+    assert "partitions" not in manifest
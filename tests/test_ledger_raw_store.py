@@ -0,0 +1,140 @@
+"""Tests for the raw observation store formats."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from forcen.config import LedgerSettings
+from forcen.engine import compact_ledger, submit_transaction
+from forcen.ledger.raw_store import RAW_SCHEMA
+from forcen.ledger.storage import Ledger
+from forcen.transactions.models import MeasurementRow
+
+
+CONFIG_DIR = Path("planning/fixtures/configs")
+TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
+TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
+
+
+def _row(row_number: int, **overrides) -> MeasurementRow:
+    values = dict(
+        row_number=row_number,
+        site="BRNV",
+        plot="H4",
+        tag="007",
+        date=date(2019, 6, 16),
+        dbh_mm=171,
+        health=9,
+        standing=True,
+        notes="",
+        origin="field",
+        source_tx="tx1",
+    )
+    values.update(overrides)
+    return MeasurementRow(**values)
+
+
+def test_parquet_raw_store_round_trips_typed_columns(tmp_path: Path) -> None:
+    ledger = Ledger(tmp_path, LedgerSettings(raw_format="parquet"))
+    rows = [
+        _row(2),
+        _row(3, dbh_mm=None, health=None, standing=None, genus="Pinus", species="taeda", code="PINTAE"),
+    ]
+    ledger.write_raw_measurements(rows)
+
+    assert pq.read_schema(ledger.observations_raw_parquet).equals(RAW_SCHEMA)
+    assert not ledger.observations_raw_csv.exists()
+
+    loaded = ledger.load_raw_measurements()
+    assert loaded == rows
+    assert loaded[0].tag == "007"
+    assert loaded[1].standing is None
+
+
+def test_parquet_raw_store_migrates_existing_csv(tmp_path: Path) -> None:
+    rows = [_row(2, tag="112", notes="first"), _row(3, tag="112", standing=False)]
+    Ledger(tmp_path).write_raw_measurements(rows)
+    assert (tmp_path / "observations_raw.csv").exists()
+
+    ledger = Ledger(tmp_path, LedgerSettings(raw_format="parquet"))
+    migrated = ledger.load_raw_measurements()
+    assert migrated == rows
+
+    ledger.write_raw_measurements(migrated + [_row(4, tag="113")])
+    assert ledger.observations_raw_parquet.exists()
+    assert not ledger.observations_raw_csv.exists()
+    assert [row.row_number for row in ledger.load_raw_measurements()] == [2, 3, 4]
+
+
+def test_submit_appends_segments_and_compact_merges(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    first = submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    second = submit_transaction(TX2_DIR, CONFIG_DIR, workspace)
+
+    ledger = Ledger(workspace)
+    segments = ledger.read_raw_segments()
+    assert [entry["tx_id"] for entry in segments] == [first.tx_id, second.tx_id]
+    assert [entry["rows"] for entry in segments] == [2, 2]
+    assert not ledger.observations_raw_csv.exists()
+    before = ledger.load_raw_measurements()
+    assert [row.source_tx for row in before] == [first.tx_id] * 2 + [second.tx_id] * 2
+
+    result = compact_ledger(CONFIG_DIR, workspace)
+    assert result.segments_merged == 2
+    assert result.raw_rows == 4
+    assert ledger.read_raw_segments() == []
+    assert not any(ledger.raw_segments_dir.glob("*.parquet"))
+    assert ledger.load_raw_measurements() == before
+    assert compact_ledger(CONFIG_DIR, workspace).segments_merged == 0
+
+
+def test_interrupted_compaction_does_not_duplicate_rows(tmp_path: Path) -> None:
+    ledger = Ledger(tmp_path)
+    rows = [_row(2, source_tx="tx1"), _row(3, source_tx="tx1")]
+    ledger.append_raw_segment("tx1", rows)
+    # Simulate a crash after the base was rewritten but before the manifest was pruned.
+    ledger._write_raw_base(rows)
+
+    assert ledger.read_raw_segments()
+    assert len(ledger.load_raw_measurements()) == 2
+
+
+def test_compaction_keeps_leading_zero_tags(tmp_path: Path) -> None:
+    import shutil
+
+    from forcen.engine import build_workspace
+
+    tx_dir = tmp_path / "tx-007"
+    shutil.copytree(TX1_DIR, tx_dir)
+    measurements = tx_dir / "measurements.csv"
+    measurements.write_text(measurements.read_text().replace(",112,", ",007,"))
+    workspace = tmp_path / "ledger"
+    submit_transaction(tx_dir, CONFIG_DIR, workspace)
+    ledger = Ledger(workspace)
+    incremental = ledger.observations_csv.read_bytes()
+
+    compact_ledger(CONFIG_DIR, workspace)
+
+    assert {row.tag for row in ledger.load_raw_measurements()} == {"007"}
+    build_workspace(CONFIG_DIR, workspace, full=True, force=True)
+    assert ledger.observations_csv.read_bytes() == incremental
+    assert b",007," in incremental
+
+
+def test_compaction_keeps_the_build_fingerprint(tmp_path: Path) -> None:
+    from forcen.engine import build_workspace
+
+    workspace = tmp_path / "ledger"
+    submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    submit_transaction(TX2_DIR, CONFIG_DIR, workspace)
+    ledger = Ledger(workspace)
+    assert build_workspace(CONFIG_DIR, workspace).skipped is True
+    fingerprint = ledger.raw_fingerprint()
+
+    compact_ledger(CONFIG_DIR, workspace)
+
+    assert ledger.raw_fingerprint() == fingerprint
+    assert build_workspace(CONFIG_DIR, workspace).skipped is True
@@ -0,0 +1,73 @@
+"""Tests for the transaction log sidecar index."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from forcen.engine import submit_transaction
+from forcen.ledger.storage import Ledger
+
+
+CONFIG_DIR = Path("planning/fixtures/configs")
+TX1_DIR = Path("planning/fixtures/transactions/tx-1-initial")
+TX2_DIR = Path("planning/fixtures/transactions/tx-2-ops")
+
+
+def test_index_tracks_appended_transactions(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    first = submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    second = submit_transaction(TX2_DIR, CONFIG_DIR, workspace)
+
+    ledger = Ledger(workspace)
+    assert ledger.transaction_ids() == [first.tx_id, second.tx_id]
+    assert ledger.has_transaction(second.tx_id)
+    assert not ledger.has_transaction("missing")
+
+    stored = json.loads(ledger.transactions_index.read_text())
+    log_stat = ledger.transactions_log.stat()
+    assert (stored["log_size"], stored["log_mtime_ns"]) == (log_stat.st_size, log_stat.st_mtime_ns)
+
+    record = ledger.read_transaction(second.tx_id)
+    assert record == ledger.read_transactions()[1]
+
+    summaries = ledger.transaction_summaries()
+    assert summaries[0]["validation_summary"] == {"errors": 0, "warnings": 0}
+    assert summaries[0]["row_counts"]["field"] == 2
+
+
+def test_index_rebuilds_when_missing_or_stale(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    first = submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    ledger = Ledger(workspace)
+
+    ledger.transactions_index.unlink()
+    assert Ledger(workspace).has_transaction(first.tx_id)
+    assert ledger.transactions_index.exists()
+
+    # A record appended without going through the ledger leaves the index stale.
+    with ledger.transactions_log.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps({"tx_id": "external", "row_counts": {}}) + "\n")
+    fresh = Ledger(workspace)
+    assert fresh.transaction_ids() == [first.tx_id, "external"]
+    assert fresh.read_transaction("external")["tx_id"] == "external"
+
+
+def test_index_rebuilds_when_log_is_rewritten_in_place(tmp_path: Path) -> None:
+    workspace = tmp_path / "ledger"
+    first = submit_transaction(TX1_DIR, CONFIG_DIR, workspace)
+    ledger = Ledger(workspace)
+    assert ledger.transaction_ids() == [first.tx_id]
+
+    # Same size, different tx_id: only the mtime tells the index apart.
+    log = ledger.transactions_log
+    before = log.stat()
+    replaced = "f" * len(first.tx_id)
+    log.write_text(log.read_text(encoding="utf-8").replace(first.tx_id, replaced), encoding="utf-8")
+    os.utime(log, ns=(before.st_atime_ns, before.st_mtime_ns + 1_000_000))
+    assert log.stat().st_size == before.st_size
+
+    assert Ledger(workspace).transaction_ids() == [replaced]
+    assert ledger.transaction_ids() == [replaced]
+    assert not ledger.has_transaction(first.tx_id)
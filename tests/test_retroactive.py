@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import date
 from pathlib import Path
 
@@ -22,7 +23,7 @@ from forcen.config.models import (
 from forcen.engine import lint_transaction, submit_transaction
 from forcen.engine.utils import determine_default_effective_date, with_default_effective
 from forcen.assembly.tree_outputs import build_retag_suggestions
-from forcen.assembly.reassemble import assemble_dataset, clone_raw_measurement
+from forcen.assembly.reassemble import assemble_dataset
 from forcen.assembly.trees import generate_implied_rows
 from forcen.ledger.storage import Ledger
 from forcen.transactions import NormalizationConfig, load_transaction
@@ -260,9 +261,9 @@ def test_split_idempotent() -> None:
     default_effective = determine_default_effective_date(CONFIG, tx_split)
     commands = with_default_effective(tx_split.commands, default_effective)
 
-    raw_rows = [clone_raw_measurement(row) for row in tx_initial.measurements + tx_split.measurements]
-    for idx, row in enumerate(raw_rows):
-        row.source_tx = "tx1" if idx < len(tx_initial.measurements) else "tx2"
+    raw_rows = [replace(row, source_tx="tx1") for row in tx_initial.measurements] + [
+        replace(row, source_tx="tx2") for row in tx_split.measurements
+    ]
 
     first_pass = assemble_dataset(raw_rows, commands, CONFIG)
     second_pass = assemble_dataset(raw_rows, commands, CONFIG)